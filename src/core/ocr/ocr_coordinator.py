@@ -6,6 +6,7 @@ background processing with progress tracking. This is the main entry point for
 all OCR operations.
 """
 
+import logging
 import time
 from typing import List, Optional, Dict, Any, Callable
 from pathlib import Path
@@ -18,6 +19,8 @@ from .text_extractor import TextExtractor, PageOCRResult
 from .table_detector import TableDetector, TableStructure
 from .pdf_text_layer import PDFTextLayer
 
+_log = logging.getLogger(__name__)
+
 
 class ScanDetector:
     """Detects if a PDF is a scanned document without text layer."""
@@ -47,7 +50,7 @@ class ScanDetector:
             scanned_indicators = 0
             total_checks = 0
             
-            print(f"DEBUG ScanDetector: Analyzing {pages_to_check} pages from {num_pages} total")
+            _log.debug("ScanDetector: Analyzing %s pages from %s total", pages_to_check, num_pages)
             
             for i in range(pages_to_check):
                 # Sample pages evenly distributed throughout document
@@ -66,7 +69,7 @@ class ScanDetector:
                 text_blocks = page.get_text("blocks")
                 meaningful_blocks = [b for b in text_blocks if len(b[4].strip()) > 10]
                 
-                print(f"DEBUG: Page {page_num} - Text: {text_length} chars, Images: {len(images)}, Text blocks: {len(meaningful_blocks)}")
+                _log.debug("Page %s - Text: %s chars, Images: %s, Text blocks: %s", page_num, text_length, len(images), len(meaningful_blocks))
                 
                 # Scoring: A scanned page typically has:
                 # - Very little extractable text (< 100 chars)
@@ -77,20 +80,20 @@ class ScanDetector:
                 
                 if text_length < 100:
                     page_score += 1
-                    print(f"DEBUG:   → Little text (scanned indicator)")
+                    _log.debug("  → Little text (scanned indicator)")
                 
                 if has_large_images and len(meaningful_blocks) < 2:
                     page_score += 1
-                    print(f"DEBUG:   → Has images but few text blocks (scanned indicator)")
+                    _log.debug("  → Has images but few text blocks (scanned indicator)")
                 
                 if text_length < 20 and has_large_images:
                     page_score += 1  # Strong indicator
-                    print(f"DEBUG:   → Almost no text + images (strong scanned indicator)")
+                    _log.debug("  → Almost no text + images (strong scanned indicator)")
                 
                 # If page has substantial text (>200 chars) and text blocks, it's definitely not scanned
                 if text_length > 200 and len(meaningful_blocks) > 0:
                     page_score = 0  # Override - clearly has text layer
-                    print(f"DEBUG:   → Substantial text found (NOT scanned)")
+                    _log.debug("  → Substantial text found (NOT scanned)")
                 
                 if page_score >= 2:
                     scanned_indicators += 1
@@ -102,12 +105,12 @@ class ScanDetector:
             # Consider scanned if majority of sampled pages appear scanned
             is_scanned = scanned_indicators > (total_checks * 0.6)
             
-            print(f"DEBUG ScanDetector: Result = {is_scanned} ({scanned_indicators}/{total_checks} pages appear scanned)")
+            _log.debug("ScanDetector: Result = %s (%s/%s pages appear scanned)", is_scanned, scanned_indicators, total_checks)
             
             return is_scanned
             
         except Exception as e:
-            print(f"DEBUG ScanDetector ERROR: {e}")
+            _log.error("ScanDetector error: %s", e)
             return False
 
 
@@ -300,11 +303,11 @@ class OCRWorker(QThread):
             OCREngine instance
         """
         if cls._shared_engine is None or cls._shared_language != language:
-            print(f"DEBUG: Creating new shared OCR engine for language: {language}")
+            _log.debug("Creating new shared OCR engine for language: %s", language)
             cls._shared_engine = OCREngine(language)
             cls._shared_language = language
         else:
-            print(f"DEBUG: Reusing existing OCR engine for language: {language}")
+            _log.debug("Reusing existing OCR engine for language: %s", language)
         
         return cls._shared_engine
     
@@ -312,7 +315,7 @@ class OCRWorker(QThread):
     def cleanup_shared_engine(cls):
         """Release shared OCR engine to free memory."""
         if cls._shared_engine:
-            print("DEBUG: Cleaning up shared OCR engine")
+            _log.debug("Cleaning up shared OCR engine")
             del cls._shared_engine
             cls._shared_engine = None
             cls._shared_language = None
@@ -326,8 +329,8 @@ class OCRWorker(QThread):
         try:
             # Initialize components
             self.progress_updated.emit(0, 100, "Initializing OCR engine...")
-            print(f"DEBUG OCRWorker: Starting OCR on {self.pdf_path}")
-            print(f"DEBUG: Language: {self.language}")
+            _log.debug("OCRWorker: Starting OCR on %s", self.pdf_path)
+            _log.debug("Language: %s", self.language)
             
             # Use shared OCR engine (singleton pattern for performance)
             ocr_engine = self.get_shared_engine(self.language)
@@ -336,7 +339,7 @@ class OCRWorker(QThread):
             
             # Open PDF
             doc = fitz.open(self.pdf_path)
-            print(f"DEBUG: Opened PDF - {len(doc)} pages")
+            _log.debug("Opened PDF - %s pages", len(doc))
             
             # Determine page range
             if self.page_range:
@@ -347,12 +350,12 @@ class OCRWorker(QThread):
             total_pages = end - start
             results = []
             
-            print(f"DEBUG: Processing pages {start} to {end} ({total_pages} pages)")
+            _log.debug("Processing pages %s to %s (%s pages)", start, end, total_pages)
             
             # Process each page
             for i, page_num in enumerate(range(start, end)):
                 if self._cancelled:
-                    print("DEBUG: OCR cancelled by user")
+                    _log.debug("OCR cancelled by user")
                     break
                 
                 # Update progress
@@ -371,9 +374,9 @@ class OCRWorker(QThread):
                 )
                 
                 # Debug output
-                print(f"DEBUG: Page {page_num} OCR complete - {len(result.text_blocks)} text blocks, {result.word_count} words")
+                _log.debug("Page %s OCR complete - %s text blocks, %s words", page_num, len(result.text_blocks), result.word_count)
                 if result.text_blocks:
-                    print(f"DEBUG: Sample text: {result.text_blocks[0].text[:50]}...")
+                    _log.debug("Sample text: %s...", result.text_blocks[0].text[:50])
                 
                 results.append(result)
                 
@@ -385,20 +388,18 @@ class OCRWorker(QThread):
             
             if not self._cancelled:
                 # Analyze overall results
-                print(f"DEBUG: OCR complete, analyzing {len(results)} page results")
+                _log.debug("OCR complete, analyzing %s page results", len(results))
                 analyzer = ConfidenceAnalyzer()
                 analysis = analyzer.analyze_results(results)
                 
-                print(f"DEBUG: Analysis - Total words: {analysis['total_words']}, Avg confidence: {analysis['avg_confidence']:.2f}")
+                _log.debug("Analysis - Total words: %s, Avg confidence: %.2f", analysis['total_words'], analysis['avg_confidence'])
                 
                 # Emit completion
                 self.ocr_completed.emit(results, analysis)
             
         except Exception as e:
             error_msg = str(e)
-            print(f"DEBUG OCR ERROR: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("OCR error: %s", error_msg)
             self.error_occurred.emit(error_msg)
     
     def cancel(self):
@@ -7,6 +7,7 @@ making scanned documents searchable while preserving the original appearance.
 Uses pikepdf for proper PDF text layer creation (battle-tested by OCRmyPDF).
 """
 
+import logging
 import fitz  # PyMuPDF for reading/image extraction
 import pikepdf
 from typing import List, Optional
@@ -16,6 +17,8 @@ import io
 
 from .text_extractor import PageOCRResult
 
+_log = logging.getLogger(__name__)
+
 
 class PDFTextLayer:
     """
@@ -121,9 +124,7 @@ class PDFTextLayer:
             return True
             
         except Exception as e:
-            print(f"Error adding text layer with pikepdf: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Error adding text layer with pikepdf: %s", e)
             return False
     
     def create_searchable_pdf(
@@ -146,23 +147,23 @@ class PDFTextLayer:
             True if successful, False otherwise
         """
         try:
-            print(f"DEBUG: Opening PDF with pikepdf: {input_path}")
+            _log.debug("Opening PDF with pikepdf: %s", input_path)
             
             # Open PDF with pikepdf
             pdf = pikepdf.open(input_path)
             
-            print(f"DEBUG: PDF opened, has {len(pdf.pages)} pages")
+            _log.debug("PDF opened, has %s pages", len(pdf.pages))
             
             # Add text layer to each OCR'd page
             for ocr_result in ocr_results:
                 page_num = ocr_result.page_number
-                print(f"DEBUG: Adding text layer to page {page_num} ({len(ocr_result.text_blocks)} blocks)")
+                _log.debug("Adding text layer to page %s (%s blocks)", page_num, len(ocr_result.text_blocks))
                 
                 success = self.add_text_layer_to_page(pdf, page_num, ocr_result)
-                print(f"DEBUG: Text layer added to page {page_num}: {success}")
+                _log.debug("Text layer added to page %s: %s", page_num, success)
             
             # Save with compression
-            print(f"DEBUG: Saving searchable PDF to {output_path}")
+            _log.debug("Saving searchable PDF to %s", output_path)
             
             if compress:
                 pdf.save(
@@ -175,13 +176,11 @@ class PDFTextLayer:
             
             pdf.close()
             
-            print("DEBUG: Searchable PDF saved successfully")
+            _log.debug("Searchable PDF saved successfully")
             return True
             
         except Exception as e:
-            print(f"Error creating searchable PDF with pikepdf: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Error creating searchable PDF with pikepdf: %s", e)
             return False
 
 
@@ -218,10 +217,10 @@ class PDFSaveWorker(QThread):
     def run(self):
         """Execute PDF save operation in background thread."""
         try:
-            print("DEBUG PDFSaveWorker: Starting save operation with pikepdf")
-            print(f"DEBUG: Input: {self.input_path}")
-            print(f"DEBUG: Output: {self.output_path}")
-            print(f"DEBUG: OCR results: {len(self.ocr_results)} pages")
+            _log.debug("PDFSaveWorker: Starting save operation with pikepdf")
+            _log.debug("Input: %s", self.input_path)
+            _log.debug("Output: %s", self.output_path)
+            _log.debug("OCR results: %s pages", len(self.ocr_results))
             
             self.progress_updated.emit(0, 100, "Opening PDF...")
             
@@ -231,7 +230,7 @@ class PDFSaveWorker(QThread):
             
             # Validate OCR results have text blocks
             total_blocks = sum(len(r.text_blocks) for r in self.ocr_results)
-            print(f"DEBUG: Total text blocks across all pages: {total_blocks}")
+            _log.debug("Total text blocks across all pages: %s", total_blocks)
             
             if total_blocks == 0:
                 raise ValueError("OCR results contain no text blocks")
@@ -239,11 +238,11 @@ class PDFSaveWorker(QThread):
             # Open PDF with pikepdf
             self.progress_updated.emit(10, 100, "Loading PDF...")
             pdf = pikepdf.open(self.input_path)
-            print(f"DEBUG: Opened PDF with pikepdf - {len(pdf.pages)} pages")
+            _log.debug("Opened PDF with pikepdf - %s pages", len(pdf.pages))
             
             # Get list of page numbers to extract
             page_numbers = sorted(set(r.page_number for r in self.ocr_results))
-            print(f"DEBUG: Will process pages: {page_numbers}")
+            _log.debug("Will process pages: %s", page_numbers)
             
             # Create output PDF with only selected pages
             self.progress_updated.emit(20, 100, "Extracting pages...")
@@ -253,7 +252,7 @@ class PDFSaveWorker(QThread):
             for page_num in page_numbers:
                 output_pdf.pages.append(pdf.pages[page_num])
             
-            print(f"DEBUG: Created output PDF with {len(output_pdf.pages)} pages")
+            _log.debug("Created output PDF with %s pages", len(output_pdf.pages))
             
             # Close source PDF
             pdf.close()
@@ -267,7 +266,7 @@ class PDFSaveWorker(QThread):
             
             for i, ocr_result in enumerate(self.ocr_results):
                 if self._cancelled:
-                    print("DEBUG: Save cancelled by user")
+                    _log.debug("Save cancelled by user")
                     output_pdf.close()
                     return
                 
@@ -279,7 +278,7 @@ class PDFSaveWorker(QThread):
                     f"Adding text layer to page {i + 1} of {total_pages}..."
                 )
                 
-                print(f"DEBUG: Processing OCR result {i} - page {ocr_result.page_number} has {len(ocr_result.text_blocks)} text blocks")
+                _log.debug("Processing OCR result %s - page %s has %s text blocks", i, ocr_result.page_number, len(ocr_result.text_blocks))
                 
                 if len(ocr_result.text_blocks) > 0:
                     # Page index in output PDF
@@ -291,9 +290,9 @@ class PDFSaveWorker(QThread):
                     )
                     if success:
                         pages_with_text += 1
-                    print(f"DEBUG: Added text layer to output page {new_page_index}: {success}")
+                    _log.debug("Added text layer to output page %s: %s", new_page_index, success)
             
-            print(f"DEBUG: Added text layers to {pages_with_text}/{total_pages} pages")
+            _log.debug("Added text layers to %s/%s pages", pages_with_text, total_pages)
             
             if self._cancelled:
                 output_pdf.close()
@@ -301,7 +300,7 @@ class PDFSaveWorker(QThread):
             
             # Save output PDF
             self.progress_updated.emit(95, 100, "Saving PDF...")
-            print(f"DEBUG: Saving output PDF to {self.output_path}")
+            _log.debug("Saving output PDF to %s", self.output_path)
             
             if self.compress:
                 output_pdf.save(
@@ -319,20 +318,18 @@ class PDFSaveWorker(QThread):
             output_file = Path(self.output_path)
             if output_file.exists():
                 file_size = output_file.stat().st_size
-                print(f"DEBUG: Output file size: {file_size} bytes")
+                _log.debug("Output file size: %s bytes", file_size)
                 if file_size == 0:
                     raise ValueError("Output PDF is 0 bytes - save failed")
             else:
                 raise ValueError("Output PDF was not created")
             
-            print("DEBUG: Emitting save_completed signal (success)")
+            _log.debug("Emitting save_completed signal (success)")
             self.save_completed.emit(True, self.output_path)
             
         except Exception as e:
             error_msg = f"Failed to save PDF: {str(e)}"
-            print(f"DEBUG ERROR: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Save error: %s", error_msg)
             self.save_completed.emit(False, error_msg)
     
     def cancel(self):
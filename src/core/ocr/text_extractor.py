@@ -5,6 +5,7 @@ Provides the pipeline from PDF document to OCR-ready images,
 including page rendering, image extraction, and preprocessing coordination.
 """
 
+import time
 import fitz  # PyMuPDF
 import numpy as np
 from PIL import Image
@@ -167,8 +168,7 @@ class TextExtractor:
         Returns:
             PageOCRResult with recognized text
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()  # Monotonic, unaffected by clock changes
         
         # Extract page as image
         image = self.extract_page_image(pdf_document, page_number)
@@ -181,7 +181,7 @@ class TextExtractor:
         ocr_results = self.ocr_engine.recognize_text(image, min_confidence)
         
         # Calculate processing time
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         return PageOCRResult(page_number, ocr_results, processing_time)
     
@@ -4,21 +4,32 @@ PDF Document handler using PyMuPDF.
 Manages PDF file operations, rendering, and caching.
 """
 
+import itertools
 import fitz  # PyMuPDF
 from typing import Optional, Dict, Tuple
 from pathlib import Path
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QPixmap, QImage, QPixmapCache
 from PySide6.QtCore import QObject, Signal
 
 
+# Cache generations for all documents, so a key is never reused across
+# documents sharing the process-wide QPixmapCache (unlike id(), which a new
+# document can inherit from a freed one)
+_cache_generations = itertools.count()
+
+
 class PDFDocument(QObject):
     """
     PDF document handler.
     
     Manages PDF file loading, rendering, and basic operations.
-    Uses LRU cache for rendered pages to optimize memory usage.
+    Rendered pages are kept in the shared, byte-bounded QPixmapCache
+    (LRU) keyed by page, zoom and rotation.
     """
     
+    # Byte budget for the shared pixmap cache (in KB)
+    PAGE_CACHE_LIMIT_KB = 256 * 1024  # 256 MiB
+    
     # Signals
     document_loaded = Signal()
     document_closed = Signal()
@@ -37,8 +48,13 @@ class PDFDocument(QObject):
         self._current_page: int = 0
         self._zoom_level: float = 100.0  # percentage
         self._rotation_angles: Dict[int, int] = {}  # page_num: angle
-        self._page_cache: Dict[Tuple[int, float, int], QPixmap] = {}  # (page, zoom, rotation): pixmap
-        self._max_cache_size: int = 10  # Maximum cached pages
+        self._cache_generation: int = next(_cache_generations)  # Renewed to drop every cached page at once
+        self._page_generations: Dict[int, int] = {}  # page_num: bumped when the page changes
+        self._edit_generation: int = 0  # Bumped whenever any page changes
+        
+        # Raise the shared cache budget so pages survive zoom toggles and scrolling
+        if QPixmapCache.cacheLimit() < self.PAGE_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PAGE_CACHE_LIMIT_KB)
         
         # Dirty state tracking for annotations
         self._modified: bool = False  # Track if document has unsaved changes
@@ -72,7 +88,7 @@ class PDFDocument(QObject):
             self._page_count = len(self._doc)
             self._current_page = 0
             self._rotation_angles = {}
-            self._page_cache = {}
+            self.clear_cache()
             self._modified = False  # Reset modified flag for new document
             
             # Reset undo/redo stacks for new document
@@ -125,7 +141,7 @@ class PDFDocument(QObject):
             self._page_count = 0
             self._current_page = 0
             self._rotation_angles = {}
-            self._page_cache = {}
+            self.clear_cache()
             self.document_closed.emit()
     
     def render_page(self, page_number: int, zoom: Optional[float] = None, 
@@ -151,9 +167,10 @@ class PDFDocument(QObject):
             rotation = self._rotation_angles.get(page_number, 0)
         
         # Check cache
-        cache_key = (page_number, zoom, rotation)
-        if cache_key in self._page_cache:
-            return self._page_cache[cache_key]
+        cache_key = self._page_cache_key(page_number, zoom, rotation)
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Get page
@@ -177,8 +194,8 @@ class PDFDocument(QObject):
             # Convert to QPixmap
             pixmap = QPixmap.fromImage(qimage)
             
-            # Cache the rendered page
-            self._cache_page(cache_key, pixmap)
+            # Cache the rendered page (LRU eviction is handled by QPixmapCache)
+            QPixmapCache.insert(cache_key, pixmap)
             
             # Emit signal
             self.page_rendered.emit(page_number)
@@ -189,25 +206,40 @@ class PDFDocument(QObject):
             self.error_occurred.emit(f"Failed to render page {page_number + 1}: {str(e)}")
             return None
     
-    def _cache_page(self, key: Tuple[int, float, int], pixmap: QPixmap):
+    def _page_cache_key(self, page_number: int, zoom: float, rotation: int) -> str:
         """
-        Cache a rendered page with LRU policy.
+        Build the QPixmapCache key of a rendered page.
         
         Args:
-            key: Cache key (page_num, zoom, rotation)
-            pixmap: Rendered pixmap
+            page_number: Page number (0-indexed)
+            zoom: Zoom level as percentage
+            rotation: Rotation angle in degrees
+            
+        Returns:
+            Cache key string unique to this document and page state
         """
-        # If cache is full, remove oldest entry
-        if len(self._page_cache) >= self._max_cache_size:
-            # Remove first (oldest) item
-            oldest_key = next(iter(self._page_cache))
-            del self._page_cache[oldest_key]
+        # Normalize the zoom so 125, 125.0 and 125.00000001 (from zoom steps,
+        # the status bar or fit arithmetic) share one entry when zooming back
+        return (
+            f"pdfpage:{self._cache_generation}:{page_number}:"
+            f"{self._page_generations.get(page_number, 0)}:{float(zoom):.2f}:{rotation}"
+        )
+    
+    def _invalidate_page(self, page_number: int):
+        """
+        Drop cached renders of a page (e.g. after rotation or annotation changes).
         
-        self._page_cache[key] = pixmap
+        Args:
+            page_number: Page number (0-indexed)
+        """
+        # Old entries become unreachable and age out of the LRU cache
+        self._page_generations[page_number] = self._page_generations.get(page_number, 0) + 1
+        self._edit_generation += 1
     
     def clear_cache(self):
         """Clear the page cache."""
-        self._page_cache = {}
+        self._cache_generation = next(_cache_generations)
+        self._page_generations = {}
     
     def get_page_size(self, page_number: int) -> Optional[Tuple[float, float]]:
         """
@@ -261,6 +293,11 @@ class PDFDocument(QObject):
         """Get current file path."""
         return self._file_path
     
+    @property
+    def edit_generation(self) -> int:
+        """Get a counter that changes whenever a page is rotated or edited."""
+        return self._edit_generation
+    
     @property
     def page_count(self) -> int:
         """Get total page count."""
@@ -285,8 +322,9 @@ class PDFDocument(QObject):
     @zoom_level.setter
     def zoom_level(self, zoom: float):
         """Set zoom level."""
-        self._zoom_level = max(25.0, min(400.0, zoom))  # Clamp between 25% and 400%
-        self.clear_cache()  # Clear cache when zoom changes
+        # Cache keys include the zoom, so renders at other zoom levels stay
+        # cached for zooming back
+        self._zoom_level = float(max(25.0, min(400.0, zoom)))  # Clamp between 25% and 400%
     
     def rotate_page(self, page_number: int, angle: int):
         """
@@ -302,9 +340,7 @@ class PDFDocument(QObject):
             self._rotation_angles[page_number] = angle
             
             # Clear cache for this page
-            keys_to_remove = [k for k in self._page_cache.keys() if k[0] == page_number]
-            for key in keys_to_remove:
-                del self._page_cache[key]
+            self._invalidate_page(page_number)
     
     def get_page_rotation(self, page_number: int) -> int:
         """
@@ -957,9 +993,7 @@ class PDFDocument(QObject):
             self._redo_stack.append(action)
             
             # Clear cache for this page
-            keys_to_remove = [k for k in self._page_cache.keys() if k[0] == page_number]
-            for key in keys_to_remove:
-                del self._page_cache[key]
+            self._invalidate_page(page_number)
             
             # Update modified state if undo stack is empty
             if not self._undo_stack:
@@ -1024,9 +1058,7 @@ class PDFDocument(QObject):
             self.mark_modified()
             
             # Clear cache for this page
-            keys_to_remove = [k for k in self._page_cache.keys() if k[0] == page_number]
-            for key in keys_to_remove:
-                del self._page_cache[key]
+            self._invalidate_page(page_number)
             
             # Emit state change
             self.undo_redo_changed.emit(self.can_undo(), self.can_redo())
@@ -1103,9 +1135,7 @@ class PDFDocument(QObject):
                 self.mark_modified()
                 
                 # Clear cache for this page to show annotation
-                keys_to_remove = [k for k in self._page_cache.keys() if k[0] == page_number]
-                for key in keys_to_remove:
-                    del self._page_cache[key]
+                self._invalidate_page(page_number)
                 
                 return True
         
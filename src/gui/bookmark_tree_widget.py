@@ -5,17 +5,280 @@ Displays PDF bookmarks in a hierarchical tree structure.
 """
 
 from PySide6.QtWidgets import (
-    QTreeWidget, QTreeWidgetItem, QMenu, QLineEdit,
-    QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QLabel,
-    QTreeWidgetItemIterator
+    QTreeView, QMenu, QLineEdit,
+    QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QLabel
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractItemModel, QModelIndex
 from PySide6.QtGui import QFont, QBrush, QColor, QIcon
 
 
-class BookmarkTreeWidget(QTreeWidget):
+class BookmarkTreeModel(QAbstractItemModel):
     """
-    Custom tree widget for displaying PDF bookmarks.
+    Item model exposing PDF bookmarks to a tree view.
+    
+    The nested bookmark dictionaries are flattened once (preorder) into
+    parallel lists indexed by node id, so the view only asks for the rows
+    it shows instead of the panel creating one tree item per bookmark.
+    Children are reported to the view only once their parent is first
+    expanded (canFetchMore/fetchMore), so collapsed subtrees cost nothing.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize empty bookmark model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        
+        # Per-node data, indexed by node id (preorder position)
+        self._bookmarks = []  # Source bookmark dictionaries
+        self._titles = []
+        self._pages = []
+        self._levels = []
+        self._parents = []  # Parent node id (-1 for top level)
+        self._rows = []  # Row within parent
+        self._children = []  # Child node ids per node
+        self._top = []  # Top-level node ids
+        self._fetched = bytearray()  # 1 where the node's children are in the view
+        
+        self._page_nodes = {}  # page: node ids bookmarking it
+        self._current_page = -1
+        
+        # Shared styling (one object per style instead of per item)
+        top_font = QFont()
+        top_font.setPointSize(11)
+        top_font.setWeight(QFont.Weight.DemiBold)
+        second_font = QFont()
+        second_font.setPointSize(10)
+        deep_font = QFont()
+        deep_font.setPointSize(9)
+        self._fonts = (top_font, second_font, deep_font)
+        
+        self._parent_brush = QBrush(QColor(50, 50, 50))  # Darker text for parents
+        self._leaf_brush = QBrush(QColor(80, 80, 80))
+        self._current_brush = QBrush(QColor(173, 216, 230, 100))  # Light blue
+    
+    def set_bookmarks(self, bookmarks: list):
+        """
+        Replace the model contents.
+        
+        Args:
+            bookmarks: List of bookmark dictionaries from PDFDocument
+        """
+        self.beginResetModel()
+        
+        self._bookmarks = []
+        self._titles = []
+        self._pages = []
+        self._levels = []
+        self._parents = []
+        self._rows = []
+        self._children = []
+        self._page_nodes = {}
+        self._top = []
+        self._fetched = bytearray()
+        
+        # Single preorder pass with an explicit stack of
+        # (bookmark, parent node id, row within parent)
+        stack = [(bookmarks[row], -1, row) for row in range(len(bookmarks) - 1, -1, -1)]
+        while stack:
+            bookmark, parent, row = stack.pop()
+            node = len(self._bookmarks)
+            page = bookmark['page']
+            
+            self._bookmarks.append(bookmark)
+            self._titles.append(bookmark['title'])
+            self._pages.append(page)
+            self._levels.append(bookmark['level'])
+            self._parents.append(parent)
+            self._rows.append(row)
+            self._children.append([])
+            self._fetched.append(0)
+            self._page_nodes.setdefault(page, []).append(node)
+            (self._children[parent] if parent >= 0 else self._top).append(node)
+            
+            # Push children reversed so they pop in document order
+            children = bookmark.get('children')
+            if children:
+                stack.extend(
+                    (children[child_row], node, child_row)
+                    for child_row in range(len(children) - 1, -1, -1)
+                )
+        
+        self.endResetModel()
+    
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        """Return index of a child row (node id kept as internal id)."""
+        children = self._children[parent.internalId()] if parent.isValid() else self._top
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, 0, children[row])
+    
+    def parent(self, index=QModelIndex()) -> QModelIndex:
+        """Return index of the parent bookmark."""
+        if not index.isValid():
+            return QModelIndex()
+        parent = self._parents[index.internalId()]
+        if parent < 0:
+            return QModelIndex()
+        return self.createIndex(self._rows[parent], 0, parent)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return number of child bookmarks fetched into the view."""
+        if parent.isValid():
+            node = parent.internalId()
+            return len(self._children[node]) if self._fetched[node] else 0
+        return len(self._top)
+    
+    def hasChildren(self, parent=QModelIndex()) -> bool:
+        """Return whether a bookmark has children, fetched or not."""
+        if parent.isValid():
+            return bool(self._children[parent.internalId()])
+        return bool(self._top)
+    
+    def canFetchMore(self, parent) -> bool:
+        """Return whether a bookmark's children are still to be fetched."""
+        if not parent.isValid():
+            return False
+        node = parent.internalId()
+        return not self._fetched[node] and bool(self._children[node])
+    
+    def fetchMore(self, parent):
+        """Report a bookmark's children to the view (on first expand)."""
+        if not self.canFetchMore(parent):
+            return
+        node = parent.internalId()
+        self.beginInsertRows(parent, 0, len(self._children[node]) - 1)
+        self._fetched[node] = 1
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return number of columns (titles only)."""
+        return 1
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return data for a bookmark.
+        
+        Args:
+            index: Model index of the bookmark
+            role: Item data role
+            
+        Returns:
+            Text, tooltip, styling or the bookmark dictionary (UserRole)
+        """
+        if not index.isValid():
+            return None
+        
+        node = index.internalId()
+        
+        if role == Qt.DisplayRole:
+            # Choose icon based on whether it has children
+            icon = "📁" if self._children[node] else "📄"
+            return f"{icon} {self._titles[node]}"
+        if role == Qt.UserRole:
+            return self._bookmarks[node]
+        if role == Qt.ToolTipRole:
+            return f"{self._titles[node]}\nPage {self._pages[node] + 1}"
+        if role == Qt.FontRole:
+            # Top-level bookmarks: larger, bold; second level: slightly larger
+            return self._fonts[min(self._levels[node], 3) - 1]
+        if role == Qt.ForegroundRole:
+            return self._parent_brush if self._children[node] else self._leaf_brush
+        if role == Qt.BackgroundRole and self._pages[node] == self._current_page:
+            return self._current_brush
+        return None
+    
+    def set_current_page(self, page_num: int):
+        """
+        Highlight the bookmarks pointing at a page.
+        
+        Args:
+            page_num: Current page number (0-indexed)
+        """
+        previous = self._page_nodes.get(self._current_page, [])
+        self._current_page = page_num
+        
+        # Only bookmarks of the old and new page change background (rows
+        # not fetched yet pick up the current page when they are)
+        for node in previous + self._page_nodes.get(page_num, []):
+            if self.in_view(node):
+                index = self.createIndex(self._rows[node], 0, node)
+                self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+    
+    def in_view(self, node: int) -> bool:
+        """
+        Check whether a node's row has been reported to the view.
+        
+        Args:
+            node: Node id
+            
+        Returns:
+            True for top-level nodes and children of fetched nodes
+        """
+        parent = self._parents[node]
+        return parent < 0 or bool(self._fetched[parent])
+    
+    def titles(self) -> list:
+        """Return bookmark titles in tree order."""
+        return self._titles
+    
+    def node_count(self) -> int:
+        """Return total number of bookmarks (including nested)."""
+        return len(self._bookmarks)
+    
+    def node_index(self, node: int) -> QModelIndex:
+        """
+        Return the model index of a node.
+        
+        Args:
+            node: Node id
+            
+        Returns:
+            Model index of the bookmark
+        """
+        return self.createIndex(self._rows[node], 0, node)
+    
+    def find_page(self, page_num: int) -> int:
+        """
+        Find the first bookmark (in tree order) for a page.
+        
+        Args:
+            page_num: Page number (0-indexed)
+            
+        Returns:
+            Node id, or -1 if no bookmark points at the page
+        """
+        nodes = self._page_nodes.get(page_num)
+        return nodes[0] if nodes else -1
+    
+    def match_nodes(self, search_text: str) -> tuple:
+        """
+        Match bookmark titles against search text.
+        
+        Args:
+            search_text: Text to search for
+            
+        Returns:
+            (matches, has_matching_children) lists indexed by node id
+        """
+        matches = [search_text in title.lower() for title in self._titles]
+        has_matching_children = [False] * len(matches)
+        
+        # Preorder ids: walking backwards visits children before parents
+        for node in range(len(matches) - 1, -1, -1):
+            parent = self._parents[node]
+            if parent >= 0 and (matches[node] or has_matching_children[node]):
+                has_matching_children[parent] = True
+        
+        return matches, has_matching_children
+
+
+class BookmarkTreeWidget(QTreeView):
+    """
+    Custom tree view for displaying PDF bookmarks.
     
     Features:
     - Hierarchical display with visual indicators
@@ -38,6 +301,11 @@ class BookmarkTreeWidget(QTreeWidget):
         """
         super().__init__(parent)
         
+        # Bookmarks live in a model; the view only lays out visible rows
+        self._model = BookmarkTreeModel(self)
+        self.setModel(self._model)
+        self.setUniformRowHeights(True)
+        
         # Configure tree
         self.setHeaderHidden(True)
         self.setIndentation(25)  # More space for bigger arrows
@@ -45,44 +313,9 @@ class BookmarkTreeWidget(QTreeWidget):
         self.setExpandsOnDoubleClick(False)  # We handle double-click
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         
-        # Make the branch clickable area larger
-        self.setStyleSheet("""
-            QTreeWidget {
-                outline: 0;
-            }
-            QTreeWidget::branch {
-                background: palette(base);
-                width: 20px;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-        """)
-        
-        # Use built-in arrows with proper coloring
-        # This ensures arrows are visible in both light and dark themes
-        self.setStyleSheet("""
-            QTreeWidget {
-                outline: 0;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-        """)
+        # Tree and branch styles live in the application stylesheet
+        # (ThemeManager), keyed by object name, so they are parsed once
+        self.setObjectName("bookmark_tree")
         
         # Override the item delegate to draw custom arrows
         from PySide6.QtWidgets import QStyledItemDelegate
@@ -90,18 +323,23 @@ class BookmarkTreeWidget(QTreeWidget):
         from PySide6.QtCore import QRect, QPoint
         
         class ArrowDelegate(QStyledItemDelegate):
+            # Arrow pen and fill, created once instead of per painted row
+            ARROW_PEN = QPen(QColor(80, 80, 80), 2)
+            ARROW_BRUSH = QBrush(QColor(80, 80, 80))
+            
+            def __init__(self, tree):
+                super().__init__(tree)
+                self._tree = tree  # Resolved once instead of parent() per painted row
+            
             def paint(self, painter, option, index):
                 super().paint(painter, option, index)
                 
                 # Draw arrow for items with children
-                item = self.parent().itemFromIndex(index)
-                if item and item.childCount() > 0:
+                if index.model().hasChildren(index):
                     painter.save()
                     
                     # Set arrow color (dark gray for visibility)
-                    pen = QPen(QColor(80, 80, 80))
-                    pen.setWidth(2)
-                    painter.setPen(pen)
+                    painter.setPen(self.ARROW_PEN)
                     painter.setRenderHint(QPainter.Antialiasing)
                     
                     # Calculate arrow position (left side of item)
@@ -110,7 +348,7 @@ class BookmarkTreeWidget(QTreeWidget):
                     arrow_y = rect.center().y()
                     
                     # Draw LARGER arrow based on expansion state
-                    if item.isExpanded():
+                    if self._tree.isExpanded(index):
                         # Down arrow (▼) - BIGGER
                         points = [
                             QPoint(arrow_x - 6, arrow_y - 3),
@@ -125,7 +363,7 @@ class BookmarkTreeWidget(QTreeWidget):
                             QPoint(arrow_x + 4, arrow_y)
                         ]
                     
-                    painter.setBrush(QColor(80, 80, 80))
+                    painter.setBrush(self.ARROW_BRUSH)
                     painter.drawPolygon(points)
                     
                     painter.restore()
@@ -136,16 +374,18 @@ class BookmarkTreeWidget(QTreeWidget):
         self._bookmarks = []
         self._current_page = -1
         self._search_filter = ""
+        self._filter_state = None  # match_nodes() result while filtering
         
         # Expansion state
         self._expanded_items = set()  # Track expanded bookmark titles
         
         # Connect signals
-        self.itemClicked.connect(self._on_item_clicked)
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.clicked.connect(self._on_item_clicked)
+        self.doubleClicked.connect(self._on_item_double_clicked)
         self.customContextMenuRequested.connect(self._show_context_menu)
-        self.itemExpanded.connect(self._on_item_expanded)
-        self.itemCollapsed.connect(self._on_item_collapsed)
+        self.expanded.connect(self._on_item_expanded)
+        self.collapsed.connect(self._on_item_collapsed)
+        self._model.rowsInserted.connect(self._on_rows_fetched)
     
     def load_bookmarks(self, bookmarks: list):
         """
@@ -155,128 +395,55 @@ class BookmarkTreeWidget(QTreeWidget):
             bookmarks: List of bookmark dictionaries from PDFDocument
         """
         self._bookmarks = bookmarks
-        self.clear()
+        self._model.set_bookmarks(bookmarks)
         self._expanded_items.clear()
+        self._filter_state = None
         
         if not bookmarks:
             return
         
-        # Build tree recursively
-        self._build_tree_recursive(bookmarks, None)
-        
-        # Auto-expand first level
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                item.setExpanded(True)
-    
-    def _build_tree_recursive(self, bookmarks: list, parent_item: QTreeWidgetItem):
-        """
-        Recursively build bookmark tree.
-        
-        Args:
-            bookmarks: List of bookmark dictionaries
-            parent_item: Parent tree item (None for top-level)
-        """
-        for bookmark in bookmarks:
-            # Create tree item
-            if parent_item:
-                item = QTreeWidgetItem(parent_item)
-            else:
-                item = QTreeWidgetItem(self)
-            
-            # Store bookmark data
-            item.setData(0, Qt.UserRole, bookmark)
-            
-            # Set text with icon
-            title = bookmark['title']
-            page = bookmark['page']
-            has_children = len(bookmark.get('children', [])) > 0
-            
-            # Choose icon based on whether it has children
-            icon = "📁" if has_children else "📄"
-            display_text = f"{icon} {title}"
-            
-            item.setText(0, display_text)
-            item.setToolTip(0, f"{title}\nPage {page + 1}")
-            
-            # Style based on level
-            level = bookmark['level']
-            self._style_item(item, level, has_children)
-            
-            # Recursively add children
-            children = bookmark.get('children', [])
-            if children:
-                self._build_tree_recursive(children, item)
+        # Auto-expand first level (one call instead of expand() per row)
+        self.expandToDepth(0)
     
-    def _style_item(self, item: QTreeWidgetItem, level: int, has_children: bool):
-        """
-        Apply visual styling to tree item based on hierarchy level.
-        
-        Args:
-            item: Tree widget item
-            level: Hierarchy level (1=top, 2=child, etc.)
-            has_children: Whether item has children
-        """
-        font = QFont()
-        
-        # Top-level bookmarks: larger, bold
-        if level == 1:
-            font.setPointSize(11)
-            font.setWeight(QFont.Weight.DemiBold)
-            item.setFont(0, font)
-        # Second level: slightly larger
-        elif level == 2:
-            font.setPointSize(10)
-            item.setFont(0, font)
-        # Deeper levels: normal
-        else:
-            font.setPointSize(9)
-            item.setFont(0, font)
-        
-        # Parent items: darker text
-        if has_children:
-            item.setForeground(0, QBrush(QColor(50, 50, 50)))
-        else:
-            item.setForeground(0, QBrush(QColor(80, 80, 80)))
+    def clear(self):
+        """Remove all bookmarks."""
+        self.load_bookmarks([])
     
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_clicked(self, index: QModelIndex):
         """
         Handle bookmark item click.
         
         Args:
-            item: Clicked item
-            column: Column number
+            index: Clicked index
         """
-        bookmark = item.data(0, Qt.UserRole)
+        bookmark = index.data(Qt.UserRole)
         if bookmark:
             page = bookmark['page']
             top = bookmark.get('top', 0)
             self.bookmark_clicked.emit(page, top)
     
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """
         Handle bookmark item double-click.
         
         Args:
-            item: Double-clicked item
-            column: Column number
+            index: Double-clicked index
         """
-        bookmark = item.data(0, Qt.UserRole)
+        bookmark = index.data(Qt.UserRole)
         if bookmark:
             page = bookmark['page']
             top = bookmark.get('top', 0)
             self.bookmark_double_clicked.emit(page, top)
     
-    def _on_item_expanded(self, item: QTreeWidgetItem):
+    def _on_item_expanded(self, index: QModelIndex):
         """Track expanded items."""
-        bookmark = item.data(0, Qt.UserRole)
+        bookmark = index.data(Qt.UserRole)
         if bookmark:
             self._expanded_items.add(bookmark['title'])
     
-    def _on_item_collapsed(self, item: QTreeWidgetItem):
+    def _on_item_collapsed(self, index: QModelIndex):
         """Track collapsed items."""
-        bookmark = item.data(0, Qt.UserRole)
+        bookmark = index.data(Qt.UserRole)
         if bookmark:
             self._expanded_items.discard(bookmark['title'])
     
@@ -288,35 +455,14 @@ class BookmarkTreeWidget(QTreeWidget):
             page_num: Current page number (0-indexed)
         """
         self._current_page = page_num
-        self._update_current_indicator()
-    
-    def _update_current_indicator(self):
-        """Update visual indicator for current page's bookmark."""
-        # Find and highlight bookmark for current page
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            bookmark = item.data(0, Qt.UserRole)
-            if bookmark and bookmark['page'] == self._current_page:
-                # Highlight this item
-                item.setBackground(0, QBrush(QColor(173, 216, 230, 100)))  # Light blue
-            else:
-                # Clear background
-                item.setBackground(0, QBrush(Qt.transparent))
-            iterator += 1
+        self._model.set_current_page(page_num)
     
     def expand_all_bookmarks(self):
         """Expand all bookmark items."""
         self.expandAll()
         
         # Track all as expanded
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            bookmark = item.data(0, Qt.UserRole)
-            if bookmark:
-                self._expanded_items.add(bookmark['title'])
-            iterator += 1
+        self._expanded_items.update(self._model.titles())
     
     def collapse_all_bookmarks(self):
         """Collapse all bookmark items."""
@@ -331,21 +477,22 @@ class BookmarkTreeWidget(QTreeWidget):
             page_num: Page number (0-indexed)
         """
         # Find item for this page
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            bookmark = item.data(0, Qt.UserRole)
-            if bookmark and bookmark['page'] == page_num:
-                # Expand all parents
-                parent = item.parent()
-                while parent:
-                    parent.setExpanded(True)
-                    parent = parent.parent()
-                
-                # Scroll to item
-                self.scrollToItem(item)
-                return
-            iterator += 1
+        node = self._model.find_page(page_num)
+        if node < 0:
+            return
+        
+        # Expand all parents, outermost first so each fetches the next
+        index = self._model.node_index(node)
+        parents = []
+        parent = index.parent()
+        while parent.isValid():
+            parents.append(parent)
+            parent = parent.parent()
+        for parent in reversed(parents):
+            self.expand(parent)
+        
+        # Scroll to item
+        self.scrollTo(index)
     
     def filter_bookmarks(self, search_text: str):
         """
@@ -355,65 +502,58 @@ class BookmarkTreeWidget(QTreeWidget):
             search_text: Text to search for (case-insensitive)
         """
         self._search_filter = search_text.lower()
-        
-        if not search_text:
-            # Show all items
-            iterator = QTreeWidgetItemIterator(self)
-            while iterator.value():
-                iterator.value().setHidden(False)
-                iterator += 1
-            return
-        
-        # Hide items that don't match, show those that do
-        iterator = QTreeWidgetItemIterator(self)
-        match_count = 0
-        
-        while iterator.value():
-            item = iterator.value()
-            bookmark = item.data(0, Qt.UserRole)
+        model = self._model
+        
+        # Apply all row changes with repaints off, then lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            if not search_text:
+                # Show all items (only fetched rows can have been hidden)
+                self._filter_state = None
+                for node in range(model.node_count()):
+                    if model.in_view(node):
+                        index = model.node_index(node)
+                        self.setRowHidden(index.row(), index.parent(), False)
+                return
             
-            if bookmark:
-                title = bookmark['title'].lower()
-                matches = search_text in title
-                
-                if matches:
-                    match_count += 1
-                    # Show this item and all parents
-                    item.setHidden(False)
-                    parent = item.parent()
-                    while parent:
-                        parent.setHidden(False)
-                        parent.setExpanded(True)  # Auto-expand parents
-                        parent = parent.parent()
-                else:
-                    # Hide if no children match
-                    if not self._has_matching_children(item, search_text):
-                        item.setHidden(True)
+            # Hide items that don't match, show those that do (and their parents)
+            matches, has_matching_children = model.match_nodes(search_text)
+            self._filter_state = (matches, has_matching_children)
             
-            iterator += 1
-        
-        return match_count
+            # Preorder: expanding a parent fetches its children before
+            # they are visited; unfetched rows are handled on fetch
+            for node in range(model.node_count()):
+                if not model.in_view(node):
+                    continue
+                index = model.node_index(node)
+                visible = matches[node] or has_matching_children[node]
+                self.setRowHidden(index.row(), index.parent(), not visible)
+                if has_matching_children[node]:
+                    self.expand(index)  # Auto-expand parents
+            
+            return sum(matches)
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def _has_matching_children(self, item: QTreeWidgetItem, search_text: str) -> bool:
+    def _on_rows_fetched(self, parent: QModelIndex, first: int, last: int):
         """
-        Check if item has any children matching search.
+        Apply the active filter to rows fetched after it ran.
         
         Args:
-            item: Tree item to check
-            search_text: Search text
-            
-        Returns:
-            True if any children match
-        """
-        for i in range(item.childCount()):
-            child = item.child(i)
-            bookmark = child.data(0, Qt.UserRole)
-            if bookmark:
-                if search_text in bookmark['title'].lower():
-                    return True
-                if self._has_matching_children(child, search_text):
-                    return True
-        return False
+            parent: Parent index of the new rows
+            first: First new row
+            last: Last new row
+        """
+        if self._filter_state is None:
+            return
+        
+        matches, has_matching_children = self._filter_state
+        for row in range(first, last + 1):
+            index = self._model.index(row, 0, parent)
+            node = index.internalId()
+            self.setRowHidden(row, parent, not (matches[node] or has_matching_children[node]))
+            if has_matching_children[node]:
+                self.expand(index)  # Auto-expand parents
     
     def _show_context_menu(self, position):
         """
@@ -422,11 +562,11 @@ class BookmarkTreeWidget(QTreeWidget):
         Args:
             position: Menu position
         """
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
         
-        bookmark = item.data(0, Qt.UserRole)
+        bookmark = index.data(Qt.UserRole)
         if not bookmark:
             return
         
@@ -440,13 +580,13 @@ class BookmarkTreeWidget(QTreeWidget):
         menu.addSeparator()
         
         # Expand/collapse actions (if has children)
-        if item.childCount() > 0:
-            if item.isExpanded():
+        if self._model.hasChildren(index):
+            if self.isExpanded(index):
                 collapse_action = menu.addAction("Collapse")
-                collapse_action.triggered.connect(lambda: item.setExpanded(False))
+                collapse_action.triggered.connect(lambda: self.collapse(index))
             else:
                 expand_action = menu.addAction("Expand")
-                expand_action.triggered.connect(lambda: item.setExpanded(True))
+                expand_action.triggered.connect(lambda: self.expand(index))
             
             menu.addSeparator()
         
@@ -485,12 +625,7 @@ class BookmarkTreeWidget(QTreeWidget):
         Returns:
             Total bookmark count
         """
-        count = 0
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            count += 1
-            iterator += 1
-        return count
+        return self._model.node_count()
 
 
 class BookmarkPanel(QWidget):
@@ -532,18 +667,8 @@ class BookmarkPanel(QWidget):
         self.search_input.setClearButtonEnabled(True)
         self.search_input.textChanged.connect(self._on_search_changed)
         
-        # Fix clear button positioning and visibility
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 4px 24px 4px 4px;
-                min-height: 24px;
-            }
-            QLineEdit QToolButton {
-                border: none;
-                padding: 2px;
-                margin-right: 2px;
-            }
-        """)
+        # Clear button positioning is styled by ThemeManager
+        self.search_input.setObjectName("bookmark_search_input")
         
         layout.addWidget(self.search_input)
         
@@ -4,15 +4,22 @@ Content area component for PDF display.
 Uses QGraphicsView for rendering PDF pages with continuous scrolling support.
 """
 
-from typing import Optional, List
+import bisect
+import math
+from typing import Optional, List, Dict
+import numpy as np
 from PySide6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
     QWidget, QVBoxLayout, QLabel
 )
-from PySide6.QtCore import Qt, Signal, QRectF, QPointF
-from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtCore import Qt, Signal, QRectF, QPointF, QTimer
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush
 
 from utils.constants import Icons
+from utils.config import get_config
+from utils.spatial_grid import SpatialGrid
+from .search_highlight_item import SearchHighlightItem
+from .word_highlight_item import WordHighlightItem
 
 
 class ContentArea(QGraphicsView):
@@ -32,6 +39,17 @@ class ContentArea(QGraphicsView):
     image_copied = Signal(str)  # Emitted when image is copied
     selection_mode_changed = Signal(bool)  # Emitted when selection mode changes
     
+    # Rendered pages further than this many pages outside the render range
+    # drop their pixmap again (re-rendering hits the page cache)
+    _PIXMAP_KEEP_PAGES = 2
+    
+    # Shared pens and brushes (created once instead of per item)
+    _PLACEHOLDER_BRUSH = QBrush(QColor(240, 240, 240))  # Light gray
+    _PLACEHOLDER_PEN = QPen(QColor(200, 200, 200))
+    _SELECTION_BRUSH = QBrush(QColor(0, 120, 215, 76))  # Blue with ~30% alpha
+    _SELECTION_PEN = QPen(QColor(0, 120, 215), 1)
+    _IMAGE_PEN = QPen(QColor(255, 102, 0), 3)  # Orange, 3px
+    
     def __init__(self, parent=None):
         """
         Initialize content area.
@@ -45,9 +63,18 @@ class ContentArea(QGraphicsView):
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
         
+        # Optional GPU-backed viewport; set first since it replaces the viewport widget
+        if get_config().get_opengl_viewport():
+            self._use_opengl_viewport()
+        
         # Configure view
-        self.setRenderHint(QPainter.Antialiasing)
+        # No Antialiasing hint: everything drawn here is an axis-aligned
+        # rectangle or a pixmap, which the raster engine fills faster without it
         self.setRenderHint(QPainter.SmoothPixmapTransform)
+        # Without antialiasing the exposed areas need no 2px safety margin,
+        # so small updates (selection drag, current match) repaint only
+        # the region that actually changed
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
@@ -57,21 +84,58 @@ class ContentArea(QGraphicsView):
         # State for multi-page display
         self._page_items: List[QGraphicsPixmapItem] = []
         self._page_positions: List[float] = []  # Y positions of each page
+        self._page_widths: List[float] = []  # Rendered width of each page
+        self._page_heights: List[float] = []  # Rendered height of each page
+        self._placeholder_pool = []  # Detached placeholder items reused on re-layout
+        self._rendered_pages = set()  # Pages currently showing a pixmap item
+        self._render_queue: List[int] = []  # Buffer pages waiting to be rendered
+        self._render_range = (0, 0)  # Pages wanted by the last visibility pass
+        self._rendered_span = (0.0, 0.0)  # Scene y span fully covered by rendered pages
         self._current_page: int = 0
+        self._current_page_span = (0.0, 0.0)  # Scene y span mapping to the current page
         self._pdf_document = None  # Reference to PDF document
         self._page_spacing = 10  # Space between pages in pixels
+        self._inv_zoom_factor = 1.0  # Scene -> PDF scale of the current layout
+        
+        # Recompute the current page once scrolling settles instead of per scroll step
+        self._page_update_timer = QTimer(self)
+        self._page_update_timer.setSingleShot(True)
+        self._page_update_timer.setInterval(50)
+        self._page_update_timer.timeout.connect(self._update_current_page)
+        self.verticalScrollBar().valueChanged.connect(self._on_vertical_scroll)
+        
+        # Render buffer pages one per event loop pass so input is handled in between
+        self._render_queue_timer = QTimer(self)
+        self._render_queue_timer.setSingleShot(True)
+        self._render_queue_timer.setInterval(0)
+        self._render_queue_timer.timeout.connect(self._render_next_queued_page)
+        
+        # While scrolling within rendered pages, run the visibility pass once per frame
+        self._scroll_render_timer = QTimer(self)
+        self._scroll_render_timer.setSingleShot(True)
+        self._scroll_render_timer.setInterval(16)
+        self._scroll_render_timer.timeout.connect(self._render_visible_pages)
         
         # Text selection state
         self._selection_mode = False  # Toggle between select and pan modes
         self._is_selecting = False
-        self._selection_start = None
-        self._selection_end = None
-        self._selection_rect_item = None  # Blue rectangle while dragging
+        self._selection_start: Optional[QPointF] = None  # Scene position of drag start
+        self._selection_end: Optional[QPointF] = None  # Scene position of drag end
+        self._selection_band: Optional[QRectF] = None  # Blue rectangle while dragging (scene coordinates)
+        self._pending_move_pos = None  # Latest drag position not yet drawn
+        self._last_move_pos = None  # Viewport position of the previous drag move
+        
+        # Coalesce drag updates to at most one per frame (~60 Hz)
+        self._selection_update_timer = QTimer(self)
+        self._selection_update_timer.setSingleShot(True)
+        self._selection_update_timer.setInterval(16)
+        self._selection_update_timer.timeout.connect(self._flush_selection_update)
         self._spacebar_pressed = False  # For temporary pan mode
+        self._wheel_accum = 0  # Accumulated Ctrl+wheel angle delta (1/8 degree units)
         
         # Persistent selection state
         self._selected_text = ""  # The selected text content
-        self._selected_word_rects = []  # List of QGraphicsRectItem for yellow highlights
+        self._selected_word_rects = []  # WordHighlightItem per page for yellow highlights
         self._selection_data = None  # Store selection coordinates for copying
         
         # Image selection state
@@ -84,18 +148,37 @@ class ContentArea(QGraphicsView):
         self._annotation_color_rgb = (255, 255, 0)  # For Qt display (RGB 0-255)
         
         # Search highlighting state
-        self._search_highlights = []  # List of QGraphicsRectItem for search matches
-        self._current_search_match = None  # Currently selected search match bbox
+        self._search_highlights: Dict[int, SearchHighlightItem] = {}  # Page -> highlight overlay
+        self._current_search_match = None  # Currently selected match as (page, bbox)
         self._all_search_results = []  # All search results for highlighting
+        self._search_page_bboxes: Dict[int, np.ndarray] = {}  # Page -> (N, 4) match rects
+        
+        # Image hit-testing index (page -> (SpatialGrid, image list))
+        self._image_index = {}
         
         # Show placeholder
         self._show_placeholder()
     
+    def _use_opengl_viewport(self):
+        """Replace the raster viewport with an OpenGL one, if Qt provides it."""
+        try:
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            # No OpenGL support in this Qt build: keep the raster viewport
+            return
+        
+        self.setViewport(QOpenGLWidget())
+        
+        # Partial updates gain nothing on GL, which redraws the whole frame
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+    
     def _show_placeholder(self):
         """Show placeholder when no document is open."""
         self.scene.clear()
         self._page_items = []
         self._page_positions = []
+        self._page_widths = []
+        self._page_heights = []
         
         # Create placeholder text
         placeholder = self.scene.addText(
@@ -116,6 +199,7 @@ class ContentArea(QGraphicsView):
             pdf_document: PDFDocument instance
         """
         self._pdf_document = pdf_document
+        self._image_index = {}
         self.render_all_pages()
     
     def render_all_pages(self):
@@ -126,43 +210,61 @@ class ContentArea(QGraphicsView):
         # Save current page to restore position after re-render
         saved_page = self._current_page
         
+        # Save the current search match to re-emphasize it after re-render
+        saved_match = self._current_search_match
+        
         # Clear selection references BEFORE scene.clear() to avoid dangling references
         self._selected_word_rects = []
         self._selected_text = ""
         self._selected_image_border = None
         self._selected_image = None
+        self._search_highlights = {}
+        self._search_page_bboxes = {}  # Arrays of the overlays being cleared
+        self._current_search_match = None
+        self._selection_band = None
+        
+        # Detach placeholders so they survive scene.clear() and can be reused
+        # (every page not in _rendered_pages holds a placeholder)
+        for page_num, page_item in enumerate(self._page_items):
+            if page_num not in self._rendered_pages:
+                self.scene.removeItem(page_item)
+                self._placeholder_pool.append(page_item)
         
         # Clear existing content
         self.scene.clear()
         self._page_items = []
         self._page_positions = []
+        self._page_widths = []
+        self._page_heights = []
+        self._rendered_pages = set()
+        self._render_queue = []
+        self._rendered_span = (0.0, 0.0)
+        self._current_page_span = (0.0, 0.0)
         
         # Calculate page positions and create placeholders
         y_offset = 0
         max_width = 0
         
+        zoom_factor = self._pdf_document.zoom_level / 100.0
+        self._inv_zoom_factor = 1.0 / zoom_factor  # Multiply instead of dividing per event
+        
         for page_num in range(self._pdf_document.page_count):
             # Get page size to calculate position
             page_size = self._pdf_document.get_page_size(page_num)
             
             if page_size:
                 width, height = page_size
-                zoom_factor = self._pdf_document.zoom_level / 100.0
                 rendered_width = width * zoom_factor
                 rendered_height = height * zoom_factor
                 
                 # Create placeholder item (will be replaced with actual render on-demand)
-                from PySide6.QtWidgets import QGraphicsRectItem
-                from PySide6.QtGui import QBrush, QColor, QPen
-                
-                placeholder = QGraphicsRectItem(0, y_offset, rendered_width, rendered_height)
-                placeholder.setBrush(QBrush(QColor(240, 240, 240)))  # Light gray
-                placeholder.setPen(QPen(QColor(200, 200, 200)))
-                self.scene.addItem(placeholder)
+                placeholder = self._add_placeholder(y_offset, rendered_width, rendered_height)
                 
                 # Store placeholder and position
                 self._page_items.append(placeholder)
                 self._page_positions.append(y_offset)
+                self._page_widths.append(rendered_width)
+                self._page_heights.append(rendered_height)
                 
                 # Update max width and y offset
                 max_width = max(max_width, rendered_width)
@@ -173,18 +275,30 @@ class ContentArea(QGraphicsView):
             total_height = y_offset - self._page_spacing
             self.scene.setSceneRect(0, 0, max_width, total_height)
             
-            # Render only visible pages
-            self._render_visible_pages()
-            
-            # Restore to saved page (don't jump to page 1!)
+            # Restore to saved page (don't jump to page 1!) before rendering,
+            # so only the pages that end up on screen get pixmaps, not the
+            # ones under the stale scroll position
             if saved_page < len(self._page_positions):
                 self.go_to_page(saved_page)
             else:
                 # Scroll to top only if this is first load
                 self.verticalScrollBar().setValue(0)
             
+            # Render only visible pages (no-op if scrolling above already did)
+            self._render_visible_pages()
+            
             # Update current page
             self._update_current_page()
+            
+            # Re-apply search highlights at the new page layout
+            if self._all_search_results:
+                self.highlight_search_results(self._all_search_results)
+                
+                # Restore the current match emphasis (orange)
+                if saved_match is not None and saved_match[0] in self._search_page_bboxes:
+                    page_num, bbox = saved_match
+                    self._get_search_highlight_item(page_num).set_current_match(bbox)
+                    self._current_search_match = saved_match
     
     def display_page(self, pixmap: QPixmap, page_number: int):
         """
@@ -204,8 +318,19 @@ class ContentArea(QGraphicsView):
         self._show_placeholder()
         self._page_items = []
         self._page_positions = []
+        self._page_widths = []
+        self._page_heights = []
         self._current_page = 0
         self._pdf_document = None
+        self._image_index = {}
+        self._placeholder_pool = []
+        self._rendered_pages = set()
+        self._render_queue = []
+        self._rendered_span = (0.0, 0.0)
+        self._current_page_span = (0.0, 0.0)
+        self._search_highlights = {}
+        self._search_page_bboxes = {}
+        self._current_search_match = None
     
     def set_selection_mode(self, enabled: bool):
         """
@@ -235,12 +360,28 @@ class ContentArea(QGraphicsView):
         
         if in_pan_mode:
             # Pan mode: hand cursor and drag enabled
-            self.setDragMode(QGraphicsView.ScrollHandDrag)
-            self.viewport().setCursor(Qt.OpenHandCursor)
+            self._apply_cursor_and_drag_mode(Qt.OpenHandCursor, QGraphicsView.ScrollHandDrag)
         else:
             # Selection mode: text cursor and no drag
-            self.setDragMode(QGraphicsView.NoDrag)
-            self.viewport().setCursor(Qt.IBeamCursor)
+            self._apply_cursor_and_drag_mode(Qt.IBeamCursor, QGraphicsView.NoDrag)
+    
+    def _apply_cursor_and_drag_mode(self, cursor_shape, drag_mode):
+        """
+        Set viewport cursor and drag mode, skipping calls that change nothing.
+        
+        The drag mode is applied first because leaving ScrollHandDrag resets
+        the viewport cursor.
+        
+        Args:
+            cursor_shape: Qt.CursorShape for the viewport
+            drag_mode: QGraphicsView.DragMode to use
+        """
+        if self.dragMode() != drag_mode:
+            self.setDragMode(drag_mode)
+        
+        viewport = self.viewport()
+        if viewport.cursor().shape() != cursor_shape:
+            viewport.setCursor(cursor_shape)
     
     def get_current_page(self) -> int:
         """
@@ -251,33 +392,93 @@ class ContentArea(QGraphicsView):
         """
         return self._current_page
     
+    def _on_vertical_scroll(self, _value: int):
+        """
+        Schedule a current page update once scrolling crosses a page boundary.
+        
+        Args:
+            _value: New scroll bar value (unused; the viewport is mapped instead)
+        """
+        # Scrolling within the current page cannot change it
+        span_top, span_bottom = self._current_page_span
+        if span_top <= self._viewport_center_y() < span_bottom:
+            return
+        self._page_update_timer.start()
+    
+    def _viewport_center_y(self) -> float:
+        """
+        Get the viewport center in scene coordinates.
+        
+        Returns:
+            Scene y coordinate of the viewport center
+        """
+        return self.mapToScene(self.viewport().rect().center()).y()
+    
     def _update_current_page(self):
         """Update current page based on scroll position."""
         if not self._page_positions:
             return
         
-        # Get center of viewport in scene coordinates
-        viewport_center = self.mapToScene(
-            self.viewport().rect().center()
+        center_y = self._viewport_center_y()
+        
+        # Still inside the span of the last page found: nothing to look up
+        span_top, span_bottom = self._current_page_span
+        if span_top <= center_y < span_bottom:
+            return
+        
+        # Find which page is at the center (a gap belongs to the page above it)
+        page_num = bisect.bisect_right(self._page_positions, center_y) - 1
+        if page_num < 0:
+            return
+        
+        # Remember the page's span: its top up to the top of the next page
+        self._current_page_span = (
+            self._page_positions[page_num],
+            self._page_positions[page_num + 1]
+            if page_num + 1 < len(self._page_positions) else float('inf')
         )
-        center_y = viewport_center.y()
-        
-        # Find which page is at the center
-        for i, y_pos in enumerate(self._page_positions):
-            if i < len(self._page_positions) - 1:
-                next_y = self._page_positions[i + 1]
-                if y_pos <= center_y < next_y:
-                    if self._current_page != i:
-                        self._current_page = i
-                        self.page_changed.emit(i)
-                    return
-            else:
-                # Last page
-                if center_y >= y_pos:
-                    if self._current_page != i:
-                        self._current_page = i
-                        self.page_changed.emit(i)
-                    return
+        if self._current_page != page_num:
+            self._current_page = page_num
+            self.page_changed.emit(page_num)
+    
+    def _get_page_at_y(self, scene_y: float) -> int:
+        """
+        Find the page under a scene y coordinate.
+        
+        Binary-searches the page tops cached at layout time instead of
+        walking every page.
+        
+        Args:
+            scene_y: Y position in scene coordinates
+            
+        Returns:
+            Page number (0-indexed), or -1 if the position is outside every
+            page (above the first page, below the last or in a page gap)
+        """
+        page_num = bisect.bisect_right(self._page_positions, scene_y) - 1
+        if page_num < 0 or scene_y > self._page_positions[page_num] + self._page_heights[page_num]:
+            return -1
+        return page_num
+    
+    def _get_pages_in_y_range(self, scene_y0: float, scene_y1: float) -> range:
+        """
+        Find the pages overlapping a vertical scene range.
+        
+        Args:
+            scene_y0: Top of the range in scene coordinates
+            scene_y1: Bottom of the range in scene coordinates
+            
+        Returns:
+            Range of page numbers (0-indexed), empty if no page overlaps
+        """
+        positions = self._page_positions
+        first_page = bisect.bisect_right(positions, scene_y0) - 1
+        if first_page < 0:
+            first_page = 0
+        elif scene_y0 > positions[first_page] + self._page_heights[first_page]:
+            first_page += 1  # Range starts in the gap below this page
+        last_page = bisect.bisect_right(positions, scene_y1) - 1
+        return range(first_page, last_page + 1)
     
     def scrollContentsBy(self, dx: int, dy: int):
         """
@@ -288,13 +489,26 @@ class ContentArea(QGraphicsView):
             dy: Vertical scroll delta
         """
         super().scrollContentsBy(dx, dy)
-        self._render_visible_pages()  # Lazy render on scroll
-        self._update_current_page()
+        
+        # Lazy render on scroll: immediately once the viewport reaches a page
+        # that is not rendered, otherwise coalesced to one pass per frame
+        viewport_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        span_top, span_bottom = self._rendered_span
+        if span_top < viewport_rect.top() and viewport_rect.bottom() < span_bottom:
+            if not self._scroll_render_timer.isActive():
+                self._scroll_render_timer.start()
+        else:
+            self._scroll_render_timer.stop()
+            self._render_visible_pages()
+        # Current page is updated by the debounced scroll bar handler
     
-    def _get_visible_page_range(self):
+    def _get_visible_page_range(self, buffer_pages: int = 1):
         """
         Get the range of pages currently visible in the viewport.
         
+        Args:
+            buffer_pages: Extra pages to include above and below the viewport
+        
         Returns:
             Tuple of (first_visible_page, last_visible_page) or (0, 0) if none
         """
@@ -306,61 +520,172 @@ class ContentArea(QGraphicsView):
         viewport_top = viewport_rect.top()
         viewport_bottom = viewport_rect.bottom()
         
-        # Add buffer: render 1 page above and below visible area
-        buffer_pages = 1
+        # Binary search over the page tops instead of testing every page
+        visible = self._get_pages_in_y_range(viewport_top, viewport_bottom)
+        if not visible:
+            return (0, 0)
         
-        first_page = None
-        last_page = None
+        first_page = max(0, visible.start - buffer_pages)
+        last_page = min(len(self._page_positions) - 1, visible.stop - 1 + buffer_pages)
+        return (first_page, last_page)
+    
+    def _render_visible_pages(self):
+        """
+        Render the pages visible in the viewport and queue the buffer pages.
+        
+        Pages on screen are rendered right away; the one page of buffer above
+        and below is rendered from the event loop afterwards, one page per
+        pass, so scrolling and selection stay responsive meanwhile.
+        """
+        if not self._pdf_document or not self._pdf_document.is_open:
+            return
         
-        for page_num, y_pos in enumerate(self._page_positions):
+        first_visible, last_visible = self._get_visible_page_range(buffer_pages=0)
+        first_page = max(0, first_visible - 1)
+        last_page = min(len(self._page_items) - 1, last_visible + 1)
+        self._render_range = (first_page, last_page)
+        
+        for page_num in range(first_visible, last_visible + 1):
             if page_num < len(self._page_items):
-                page_item = self._page_items[page_num]
-                
-                # Get page height (might be placeholder or rendered)
-                if isinstance(page_item, QGraphicsPixmapItem):
-                    page_height = page_item.pixmap().height()
-                else:
-                    page_height = page_item.rect().height()
-                
-                page_bottom = y_pos + page_height
-                
-                # Check if page is visible (or near visible)
-                if page_bottom >= viewport_top and y_pos <= viewport_bottom:
-                    if first_page is None:
-                        first_page = max(0, page_num - buffer_pages)
-                    last_page = min(len(self._page_positions) - 1, page_num + buffer_pages)
+                self._render_page_item(page_num)
+        
+        # Remember the scene span in which only these (now rendered) pages
+        # are visible: from the bottom of the page above to the top of the
+        # page below
+        if all(page_num in self._rendered_pages for page_num in range(first_visible, last_visible + 1)):
+            span_top = (
+                self._page_positions[first_visible - 1] + self._page_heights[first_visible - 1]
+                if first_visible > 0 else float('-inf')
+            )
+            span_bottom = (
+                self._page_positions[last_visible + 1]
+                if last_visible + 1 < len(self._page_positions) else float('inf')
+            )
+            self._rendered_span = (span_top, span_bottom)
+        else:
+            self._rendered_span = (0.0, 0.0)
+        
+        # Buffer pages are rendered once control returns to the event loop
+        self._render_queue = [
+            page_num for page_num in (first_page, last_page)
+            if page_num not in self._rendered_pages and not first_visible <= page_num <= last_visible
+        ]
+        if self._render_queue:
+            self._render_queue_timer.start()
+        
+        # Drop pixmaps of pages that scrolled well out of view so memory
+        # stays bounded by the visible pages instead of the whole document
+        keep_first = first_page - self._PIXMAP_KEEP_PAGES
+        keep_last = last_page + self._PIXMAP_KEEP_PAGES
+        offscreen = [n for n in self._rendered_pages if n < keep_first or n > keep_last]
+        for page_num in offscreen:
+            self._release_page_pixmap(page_num)
+    
+    def _render_next_queued_page(self):
+        """Render one queued buffer page, rescheduling while more are pending."""
+        if not self._render_queue or not self._pdf_document or not self._pdf_document.is_open:
+            return
         
-        if first_page is not None and last_page is not None:
-            return (first_page, last_page)
+        page_num = self._render_queue.pop(0)
         
-        return (0, 0)
+        # Skip pages that scrolled out of the wanted range in the meantime
+        first_page, last_page = self._render_range
+        if first_page <= page_num <= last_page and page_num < len(self._page_items):
+            self._render_page_item(page_num)
+        
+        if self._render_queue:
+            self._render_queue_timer.start()
     
-    def _render_visible_pages(self):
-        """Render only the pages currently visible in the viewport."""
-        if not self._pdf_document or not self._pdf_document.is_open:
+    def _render_page_item(self, page_num: int):
+        """
+        Replace a page placeholder with its rendered pixmap.
+        
+        Args:
+            page_num: Page number (0-indexed)
+        """
+        page_item = self._page_items[page_num]
+        
+        # Check if this is still a placeholder (not yet rendered)
+        if page_num in self._rendered_pages:
             return
         
-        first_page, last_page = self._get_visible_page_range()
+        # Render this page
+        pixmap = self._pdf_document.render_page(page_num)
         
-        for page_num in range(first_page, last_page + 1):
-            if page_num < len(self._page_items):
-                page_item = self._page_items[page_num]
-                
-                # Check if this is still a placeholder (not yet rendered)
-                if not isinstance(page_item, QGraphicsPixmapItem):
-                    # Render this page
-                    pixmap = self._pdf_document.render_page(page_num)
-                    
-                    if pixmap and not pixmap.isNull():
-                        # Remove placeholder
-                        self.scene.removeItem(page_item)
-                        
-                        # Add rendered pixmap
-                        rendered_item = self.scene.addPixmap(pixmap)
-                        rendered_item.setPos(0, self._page_positions[page_num])
-                        
-                        # Replace in list
-                        self._page_items[page_num] = rendered_item
+        if pixmap and not pixmap.isNull():
+            # Remove placeholder (kept for reuse)
+            self.scene.removeItem(page_item)
+            self._placeholder_pool.append(page_item)
+            
+            # Add rendered pixmap
+            rendered_item = self._add_page_pixmap(page_num, pixmap)
+            
+            # Replace in list
+            self._page_items[page_num] = rendered_item
+            self._rendered_pages.add(page_num)
+    
+    def _add_page_pixmap(self, page_num: int, pixmap: QPixmap) -> QGraphicsPixmapItem:
+        """
+        Add a rendered page pixmap to the scene at the page position.
+        
+        Args:
+            page_num: Page number (0-indexed)
+            pixmap: Rendered page
+            
+        Returns:
+            QGraphicsPixmapItem showing the page
+        """
+        rendered_item = self.scene.addPixmap(pixmap)
+        rendered_item.setPos(0, self._page_positions[page_num])
+        
+        # Pages are opaque rectangles: hit-test against the bounds instead of
+        # deriving a shape from the pixmap mask on mouse events
+        rendered_item.setShapeMode(QGraphicsPixmapItem.BoundingRectShape)
+        
+        self._apply_pixmap_scaling(rendered_item)
+        return rendered_item
+    
+    def _add_placeholder(self, y_offset: float, width: float, height: float):
+        """
+        Add a page placeholder to the scene, reusing a pooled item if possible.
+        
+        Args:
+            y_offset: Page top in scene coordinates
+            width: Rendered page width
+            height: Rendered page height
+            
+        Returns:
+            QGraphicsRectItem placeholder
+        """
+        if self._placeholder_pool:
+            # Pooled items are already styled
+            placeholder = self._placeholder_pool.pop()
+            placeholder.setRect(0, y_offset, width, height)
+        else:
+            from PySide6.QtWidgets import QGraphicsRectItem
+            
+            placeholder = QGraphicsRectItem(0, y_offset, width, height)
+            placeholder.setBrush(self._PLACEHOLDER_BRUSH)
+            placeholder.setPen(self._PLACEHOLDER_PEN)
+        self.scene.addItem(placeholder)
+        return placeholder
+    
+    def _release_page_pixmap(self, page_num: int):
+        """
+        Swap a rendered page back to a placeholder, releasing its pixmap.
+        
+        Args:
+            page_num: Page number (0-indexed)
+        """
+        self.scene.removeItem(self._page_items[page_num])
+        
+        # Same geometry as the layout pass (the pixmap size is in device
+        # pixels and rounded)
+        self._page_items[page_num] = self._add_placeholder(
+            self._page_positions[page_num], self._page_widths[page_num],
+            self._page_heights[page_num]
+        )
+        self._rendered_pages.discard(page_num)
     
     def zoom_in(self):
         """Zoom in by 25%."""
@@ -403,7 +728,9 @@ class ContentArea(QGraphicsView):
         if 0 <= page_number < len(self._page_positions):
             y_pos = self._page_positions[page_number]
             self.verticalScrollBar().setValue(int(y_pos))
+            self._page_update_timer.stop()  # Explicit navigation wins over the scroll update
             self._current_page = page_number
+            self._current_page_span = (0.0, 0.0)
             self.page_changed.emit(page_number)
     
     def _emit_zoom_change(self):
@@ -411,8 +738,33 @@ class ContentArea(QGraphicsView):
         # Calculate approximate zoom level from transform
         transform = self.transform()
         zoom = transform.m11() * 100  # Get horizontal scale factor
+        
+        # Rendered pages switch between 1:1 blitting and cached scaling
+        for page_num in self._rendered_pages:
+            self._apply_pixmap_scaling(self._page_items[page_num])
+        
         self.zoom_changed.emit(zoom)
     
+    def _apply_pixmap_scaling(self, pixmap_item: QGraphicsPixmapItem):
+        """
+        Choose how a rendered page pixmap is scaled by the view transform.
+        
+        At 1:1 the pixmap is blitted directly. When the view is scaled, the
+        page is smooth-scaled once into a device pixmap cache and reused on
+        every repaint until the zoom changes again, instead of being scaled
+        on each paint.
+        
+        Args:
+            pixmap_item: Rendered page item
+        """
+        # A chain of scale() steps back to 100% can miss 1.0 by an ulp
+        if math.isclose(self.transform().m11(), 1.0):
+            pixmap_item.setCacheMode(QGraphicsPixmapItem.NoCache)
+            pixmap_item.setTransformationMode(Qt.FastTransformation)
+        else:
+            pixmap_item.setTransformationMode(Qt.SmoothTransformation)
+            pixmap_item.setCacheMode(QGraphicsPixmapItem.DeviceCoordinateCache)
+    
     def wheelEvent(self, event):
         """
         Handle mouse wheel events for zooming.
@@ -422,9 +774,20 @@ class ContentArea(QGraphicsView):
         """
         # Ctrl + Wheel = Zoom
         if event.modifiers() & Qt.ControlModifier:
-            if event.angleDelta().y() > 0:
+            delta = event.angleDelta().y()
+            
+            # Start over when the wheel changes direction
+            if delta * self._wheel_accum < 0:
+                self._wheel_accum = 0
+            
+            # Trackpads and high-resolution wheels send many small deltas;
+            # zoom once per full notch (120 units) instead of per event
+            self._wheel_accum += delta
+            while self._wheel_accum >= 120:
+                self._wheel_accum -= 120
                 self.zoom_in()
-            else:
+            while self._wheel_accum <= -120:
+                self._wheel_accum += 120
                 self.zoom_out()
             event.accept()
         else:
@@ -454,12 +817,11 @@ class ContentArea(QGraphicsView):
                     self.setDragMode(QGraphicsView.NoDrag)
                     self._is_selecting = True
                     self._selection_start = click_pos
-                    self._selection_end = self._selection_start
+                    self._selection_end = click_pos
+                    self._last_move_pos = event.pos()
                     
                     # Remove old selection rectangle if exists
-                    if self._selection_rect_item:
-                        self.scene.removeItem(self._selection_rect_item)
-                        self._selection_rect_item = None
+                    self._set_selection_band(None)
                     
                     event.accept()
             else:
@@ -477,15 +839,17 @@ class ContentArea(QGraphicsView):
             event: Mouse move event
         """
         if self._is_selecting:
-            # Update selection end point
-            self._selection_end = self.mapToScene(event.pos())
-            
-            # Remove old selection rectangle
-            if self._selection_rect_item:
-                self.scene.removeItem(self._selection_rect_item)
+            # Moves that repeat the previous position change nothing
+            pos = event.pos()
+            if pos == self._last_move_pos:
+                event.accept()
+                return
+            self._last_move_pos = pos
             
-            # Draw new selection rectangle
-            self._draw_selection_rect()
+            # Only remember the position; the timer draws it once per frame
+            self._pending_move_pos = pos
+            if not self._selection_update_timer.isActive():
+                self._selection_update_timer.start()
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -498,15 +862,16 @@ class ContentArea(QGraphicsView):
             event: Mouse release event
         """
         if self._is_selecting and event.button() == Qt.LeftButton:
+            # Apply the last drag position before finishing
+            self._selection_update_timer.stop()
+            self._flush_selection_update()
             self._is_selecting = False
             
             # Extract text and show highlights (NO auto-copy)
             self._complete_selection()
             
             # Remove blue rectangle
-            if self._selection_rect_item:
-                self.scene.removeItem(self._selection_rect_item)
-                self._selection_rect_item = None
+            self._set_selection_band(None)
             
             event.accept()
         elif event.button() == Qt.LeftButton and self._selection_mode:
@@ -527,33 +892,84 @@ class ContentArea(QGraphicsView):
         else:
             super().mouseReleaseEvent(event)
     
+    def _flush_selection_update(self):
+        """Apply the latest pending drag position to the selection rectangle."""
+        if self._pending_move_pos is None or not self._is_selecting:
+            return
+        
+        # Update selection end point (skip moves that land on the same scene point)
+        scene_pos = self.mapToScene(self._pending_move_pos)
+        self._pending_move_pos = None
+        if scene_pos != self._selection_end:
+            self._selection_end = scene_pos
+            self._draw_selection_rect()
+    
     def _draw_selection_rect(self):
-        """Draw the current selection rectangle."""
-        if not self._selection_start or not self._selection_end:
+        """Draw or update the current selection rectangle."""
+        if self._selection_start is None or self._selection_end is None:
             return
         
-        from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen, QBrush
+        self._set_selection_band(self._selection_rect())
+    
+    def _selection_rect(self) -> QRectF:
+        """
+        Get the dragged selection as a normalized rectangle.
+        
+        Returns:
+            QRectF spanning the drag start and end in scene coordinates
+        """
+        # Normalized in C++ instead of min/max per coordinate in Python
+        return QRectF(self._selection_start, self._selection_end).normalized()
+    
+    def _set_selection_band(self, rect: Optional[QRectF]):
+        """
+        Move the selection rectangle, repainting only the area it changed.
         
-        # Calculate rectangle
-        x1, y1 = self._selection_start.x(), self._selection_start.y()
-        x2, y2 = self._selection_end.x(), self._selection_end.y()
+        The rectangle is painted in drawForeground() rather than being a
+        scene item, so a drag does not re-index an item on every move and
+        the repaint is exactly the union of the old and new rectangle.
         
-        rect = QRectF(
-            min(x1, x2), min(y1, y2),
-            abs(x2 - x1), abs(y2 - y1)
-        )
+        Args:
+            rect: New rectangle in scene coordinates, or None to remove it
+        """
+        old_rect = self._selection_band
+        if old_rect is None and rect is None:
+            return
+        if old_rect is not None and rect is not None:
+            if rect == old_rect:
+                return
+            dirty = old_rect.united(rect)
+        else:
+            dirty = old_rect if old_rect is not None else rect
+        self._selection_band = rect
+        
+        # Include the border, then a pixel for rounding in view coordinates
+        pad = self._SELECTION_PEN.widthF()
+        view_rect = self.mapFromScene(dirty.adjusted(-pad, -pad, pad, pad)).boundingRect()
+        self.viewport().update(view_rect.adjusted(-1, -1, 1, 1))
+    
+    def drawForeground(self, painter, rect):
+        """
+        Paint the selection rectangle on top of the scene.
         
-        # Create rectangle item
-        self._selection_rect_item = QGraphicsRectItem(rect)
+        Args:
+            painter: Active QPainter in scene coordinates
+            rect: Exposed area in scene coordinates
+        """
+        super().drawForeground(painter, rect)
         
-        # Style: Blue with 30% opacity
-        color = QColor(0, 120, 215, 76)  # RGBA: Blue with ~30% alpha
-        self._selection_rect_item.setBrush(QBrush(color))
-        self._selection_rect_item.setPen(QPen(QColor(0, 120, 215), 1))
+        band = self._selection_band
+        if band is None:
+            return
         
-        # Add to scene
-        self.scene.addItem(self._selection_rect_item)
+        # Exposed areas the band (incl. border) does not reach need no drawing,
+        # e.g. repaints of scrolled-in pages or highlight changes elsewhere
+        pad = self._SELECTION_PEN.widthF()
+        if band.adjusted(-pad, -pad, pad, pad).intersects(rect):
+            # Style: Blue with 30% opacity
+            painter.setBrush(self._SELECTION_BRUSH)
+            painter.setPen(self._SELECTION_PEN)
+            painter.drawRect(band)
     
     def set_annotation_mode(self, mode: str = None):
         """
@@ -589,16 +1005,13 @@ class ContentArea(QGraphicsView):
             self._update_cursor_and_drag_mode()
         elif self._annotation_mode in ['highlight', 'underline', 'strikeout']:
             # Text selection cursor for text markup
-            self.viewport().setCursor(Qt.IBeamCursor)
-            self.setDragMode(QGraphicsView.NoDrag)
+            self._apply_cursor_and_drag_mode(Qt.IBeamCursor, QGraphicsView.NoDrag)
         elif self._annotation_mode == 'comment':
             # Arrow cursor for point-and-click
-            self.viewport().setCursor(Qt.ArrowCursor)
-            self.setDragMode(QGraphicsView.NoDrag)
+            self._apply_cursor_and_drag_mode(Qt.ArrowCursor, QGraphicsView.NoDrag)
         elif self._annotation_mode in ['sticky_note', 'rectangle', 'circle']:
             # Crosshair for drawing
-            self.viewport().setCursor(Qt.CrossCursor)
-            self.setDragMode(QGraphicsView.NoDrag)
+            self._apply_cursor_and_drag_mode(Qt.CrossCursor, QGraphicsView.NoDrag)
     
     def keyPressEvent(self, event):
         """
@@ -656,130 +1069,76 @@ class ContentArea(QGraphicsView):
     
     def _complete_selection(self):
         """Complete text selection and draw persistent highlights (NO auto-copy)."""
-        if not self._pdf_document or not self._selection_start or not self._selection_end:
+        if not self._pdf_document or self._selection_start is None or self._selection_end is None:
             return
         
         # Clear any previous selection
         self.clear_selection()
         
-        from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen, QBrush
-        
-        # Get selection rectangle in scene coordinates
-        x1, y1 = self._selection_start.x(), self._selection_start.y()
-        x2, y2 = self._selection_end.x(), self._selection_end.y()
-        
-        # Normalize coordinates
-        sel_x0, sel_x1 = min(x1, x2), max(x1, x2)
-        sel_y0, sel_y1 = min(y1, y2), max(y1, y2)
+        # Get normalized selection rectangle in scene coordinates
+        sel_rect = self._selection_rect()
+        sel_x0, sel_x1 = sel_rect.left(), sel_rect.right()
+        sel_y0, sel_y1 = sel_rect.top(), sel_rect.bottom()
         
         # Find which page(s) the selection spans and get word boxes
         selected_text_parts = []
+        page_word_boxes = []  # (page_num, word_boxes) for the annotation pass
         zoom_factor = self._pdf_document.zoom_level / 100.0
+        inv_zoom = self._inv_zoom_factor
         
-        for page_num, page_y_offset in enumerate(self._page_positions):
-            if page_num < len(self._page_items):
-                page_item = self._page_items[page_num]
-                
-                # Get page height (handle both pixmaps and placeholders)
-                if isinstance(page_item, QGraphicsPixmapItem):
-                    page_height = page_item.pixmap().height()
-                else:
-                    page_height = page_item.rect().height()
-                
-                page_bottom = page_y_offset + page_height
-                
-                # Check if selection intersects this page
-                if sel_y1 >= page_y_offset and sel_y0 <= page_bottom:
-                    # Calculate selection within this page (in scene coordinates)
-                    page_sel_y0 = max(0, sel_y0 - page_y_offset)
-                    page_sel_y1 = min(page_height, sel_y1 - page_y_offset)
-                    
-                    # Convert to PDF coordinates
-                    pdf_x0 = sel_x0 / zoom_factor
-                    pdf_y0 = page_sel_y0 / zoom_factor
-                    pdf_x1 = sel_x1 / zoom_factor
-                    pdf_y1 = page_sel_y1 / zoom_factor
-                    
-                    # Get text for this page
-                    text = self._pdf_document.get_text_in_rect(
-                        page_num, (pdf_x0, pdf_y0, pdf_x1, pdf_y1)
-                    )
-                    if text:
-                        selected_text_parts.append(text)
-                    
-                    # Get word bounding boxes for highlighting
-                    word_boxes = self._pdf_document.get_word_boxes_in_rect(
-                        page_num, (pdf_x0, pdf_y0, pdf_x1, pdf_y1)
-                    )
-                    
-                    # Draw yellow highlights for each word
-                    for wx0, wy0, wx1, wy1, word_text in word_boxes:
-                        # Convert word box to scene coordinates
-                        scene_x0 = wx0 * zoom_factor
-                        scene_y0 = (wy0 * zoom_factor) + page_y_offset
-                        scene_x1 = wx1 * zoom_factor
-                        scene_y1 = (wy1 * zoom_factor) + page_y_offset
-                        
-                        # Create highlight rectangle
-                        highlight_rect = QRectF(scene_x0, scene_y0, scene_x1 - scene_x0, scene_y1 - scene_y0)
-                        highlight_item = QGraphicsRectItem(highlight_rect)
-                        
-                        # Style: Yellow with 40% opacity
-                        yellow_color = QColor(255, 255, 0, 102)  # RGBA: Yellow with 40% alpha
-                        highlight_item.setBrush(QBrush(yellow_color))
-                        highlight_item.setPen(QPen(Qt.NoPen))
-                        
-                        # Add to scene and track
-                        self.scene.addItem(highlight_item)
-                        self._selected_word_rects.append(highlight_item)
+        # Horizontal extent is the same on every page; convert it once
+        pdf_x0 = sel_x0 * inv_zoom
+        pdf_x1 = sel_x1 * inv_zoom
+        
+        # Only the pages the selection spans (binary search over page tops)
+        for page_num in self._get_pages_in_y_range(sel_y0, sel_y1):
+            page_y_offset = self._page_positions[page_num]
+            page_height = self._page_heights[page_num]
+            
+            # Calculate selection within this page (in scene coordinates)
+            page_sel_y0 = max(0, sel_y0 - page_y_offset)
+            page_sel_y1 = min(page_height, sel_y1 - page_y_offset)
+            
+            # Convert to PDF coordinates
+            pdf_y0 = page_sel_y0 * inv_zoom
+            pdf_y1 = page_sel_y1 * inv_zoom
+            
+            # Get text for this page
+            text = self._pdf_document.get_text_in_rect(
+                page_num, (pdf_x0, pdf_y0, pdf_x1, pdf_y1)
+            )
+            if text:
+                selected_text_parts.append(text)
+            
+            # Get word bounding boxes for highlighting
+            word_boxes = self._pdf_document.get_word_boxes_in_rect(
+                page_num, (pdf_x0, pdf_y0, pdf_x1, pdf_y1)
+            )
+            
+            if word_boxes:
+                page_word_boxes.append((page_num, word_boxes))
+            
+            # Draw yellow highlights for the words (one batched item per page)
+            self._add_word_highlights(word_boxes, zoom_factor, page_y_offset)
         
         # Store selected text
         self._selected_text = "\n".join(selected_text_parts)
         
         # If in highlight annotation mode, add annotation to PDF
         if self._annotation_mode == 'highlight' and self._selected_text:
-            # Add highlight annotation to PDF for each page
-            for page_num, page_y_offset in enumerate(self._page_positions):
-                if page_num < len(self._page_items):
-                    page_item = self._page_items[page_num]
-                    
-                    # Get page height
-                    if isinstance(page_item, QGraphicsPixmapItem):
-                        page_height = page_item.pixmap().height()
-                    else:
-                        page_height = page_item.rect().height()
-                    
-                    page_bottom = page_y_offset + page_height
-                    
-                    # Check if selection intersects this page
-                    if sel_y1 >= page_y_offset and sel_y0 <= page_bottom:
-                        # Calculate selection within this page
-                        page_sel_y0 = max(0, sel_y0 - page_y_offset)
-                        page_sel_y1 = min(page_height, sel_y1 - page_y_offset)
-                        
-                        # Convert to PDF coordinates
-                        pdf_x0 = sel_x0 / zoom_factor
-                        pdf_y0 = page_sel_y0 / zoom_factor
-                        pdf_x1 = sel_x1 / zoom_factor
-                        pdf_y1 = page_sel_y1 / zoom_factor
-                        
-                        # Get word boxes for this page
-                        word_boxes = self._pdf_document.get_word_boxes_in_rect(
-                            page_num, (pdf_x0, pdf_y0, pdf_x1, pdf_y1)
-                        )
-                        
-                        if word_boxes:
-                            # Add highlight annotation to PDF
-                            self._pdf_document.add_highlight_annotation(
-                                page_num, 
-                                word_boxes,
-                                self._annotation_color,
-                                0.5  # 50% opacity
-                            )
-                            
-                            # Re-render this page to show the annotation
-                            self._refresh_page(page_num)
+            # Add highlight annotation to PDF for each page, reusing the word
+            # boxes found above instead of querying every page again
+            for page_num, word_boxes in page_word_boxes:
+                # Add highlight annotation to PDF
+                self._pdf_document.add_highlight_annotation(
+                    page_num, 
+                    word_boxes,
+                    self._annotation_color,
+                    0.5  # 50% opacity
+                )
+                
+                # Re-render this page to show the annotation
+                self._refresh_page(page_num)
             
             # Clear selection after adding annotation
             self.clear_selection()
@@ -789,6 +1148,27 @@ class ContentArea(QGraphicsView):
             word_count = len(self._selected_text.split())
             self.text_selected.emit(f"Selected {word_count} words - Press Ctrl+C to copy")
     
+    def _add_word_highlights(self, word_boxes: list, zoom_factor: float, page_y_offset: float):
+        """
+        Add one highlight item covering all selected words of a page.
+        
+        Args:
+            word_boxes: List of (x0, y0, x1, y1, text) in PDF coordinates
+            zoom_factor: Scale from PDF points to scene units
+            page_y_offset: Page top in scene coordinates
+        """
+        if not word_boxes:
+            return
+        
+        # Convert word boxes to scene coordinates, all words at once
+        boxes = np.array([box[:4] for box in word_boxes], dtype=np.float64) * zoom_factor
+        boxes[:, 1::2] += page_y_offset
+        
+        # Add to scene and track
+        highlight_item = WordHighlightItem(boxes)
+        self.scene.addItem(highlight_item)
+        self._selected_word_rects.append(highlight_item)
+    
     def clear_selection(self):
         """Clear the current text or image selection and highlights."""
         # Remove text highlight rectangles (check if still in scene)
@@ -868,9 +1248,6 @@ class ContentArea(QGraphicsView):
         if current_page >= len(self._page_positions):
             return
         
-        from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen, QBrush
-        
         # Get page dimensions
         page_size = self._pdf_document.get_page_size(current_page)
         if not page_size:
@@ -893,26 +1270,8 @@ class ContentArea(QGraphicsView):
         # Get word boxes for highlighting
         word_boxes = self._pdf_document.get_word_boxes_in_rect(current_page, page_rect)
         
-        # Draw yellow highlights for each word
-        for wx0, wy0, wx1, wy1, word_text in word_boxes:
-            # Convert word box to scene coordinates
-            scene_x0 = wx0 * zoom_factor
-            scene_y0 = (wy0 * zoom_factor) + page_y_offset
-            scene_x1 = wx1 * zoom_factor
-            scene_y1 = (wy1 * zoom_factor) + page_y_offset
-            
-            # Create highlight rectangle
-            highlight_rect = QRectF(scene_x0, scene_y0, scene_x1 - scene_x0, scene_y1 - scene_y0)
-            highlight_item = QGraphicsRectItem(highlight_rect)
-            
-            # Style: Yellow with 40% opacity
-            yellow_color = QColor(255, 255, 0, 102)  # RGBA: Yellow with 40% alpha
-            highlight_item.setBrush(QBrush(yellow_color))
-            highlight_item.setPen(QPen(Qt.NoPen))
-            
-            # Add to scene and track
-            self.scene.addItem(highlight_item)
-            self._selected_word_rects.append(highlight_item)
+        # Draw yellow highlights for the words (one batched item)
+        self._add_word_highlights(word_boxes, zoom_factor, page_y_offset)
         
         # Store selected text
         self._selected_text = text
@@ -945,37 +1304,43 @@ class ContentArea(QGraphicsView):
             return None
         
         # Find which page the click is on
-        zoom_factor = self._pdf_document.zoom_level / 100.0
+        page_num = self._get_page_at_y(scene_pos.y())
+        if page_num < 0:
+            return None
         
-        for page_num, page_y_offset in enumerate(self._page_positions):
-            if page_num < len(self._page_items):
-                page_item = self._page_items[page_num]
-                
-                # Get page height (handle both pixmaps and placeholders)
-                if isinstance(page_item, QGraphicsPixmapItem):
-                    page_height = page_item.pixmap().height()
-                else:
-                    page_height = page_item.rect().height()
-                
-                page_bottom = page_y_offset + page_height
-                
-                # Check if click is on this page
-                if page_y_offset <= scene_pos.y() <= page_bottom:
-                    # Convert click position to PDF coordinates
-                    page_click_y = scene_pos.y() - page_y_offset
-                    pdf_x = scene_pos.x() / zoom_factor
-                    pdf_y = page_click_y / zoom_factor
-                    
-                    # Get images on this page
-                    images = self._pdf_document.get_images_on_page(page_num)
-                    
-                    # Check if click is within any image
-                    for img_x0, img_y0, img_x1, img_y1, xref, width, height in images:
-                        if img_x0 <= pdf_x <= img_x1 and img_y0 <= pdf_y <= img_y1:
-                            return (page_num, img_x0, img_y0, img_x1, img_y1, xref, width, height)
+        # Convert click position to PDF coordinates (point arithmetic in C++)
+        pdf_pos = (scene_pos - QPointF(0.0, self._page_positions[page_num])) * self._inv_zoom_factor
+        
+        # Look up images under the click in the page's grid index
+        grid, images = self._get_image_index(page_num)
+        hits = grid.query_point(pdf_pos.x(), pdf_pos.y())
+        
+        if hits:
+            return (page_num,) + tuple(images[hits[0]])
         
         return None
     
+    def _get_image_index(self, page_num: int):
+        """
+        Get the spatial index of image rectangles on a page (built on first use).
+        
+        Args:
+            page_num: Page number (0-indexed)
+            
+        Returns:
+            Tuple (SpatialGrid, images) where images is the list returned by
+            PDFDocument.get_images_on_page() and grid indices match its order
+        """
+        entry = self._image_index.get(page_num)
+        if entry is None:
+            images = self._pdf_document.get_images_on_page(page_num)
+            grid = SpatialGrid()
+            for img_x0, img_y0, img_x1, img_y1, *_ in images:
+                grid.insert(img_x0, img_y0, img_x1, img_y1)
+            entry = (grid, images)
+            self._image_index[page_num] = entry
+        return entry
+    
     def _select_image(self, image_info):
         """
         Select an image and draw border highlight.
@@ -987,7 +1352,6 @@ class ContentArea(QGraphicsView):
         self.clear_selection()
         
         from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen
         
         page_num, img_x0, img_y0, img_x1, img_y1, xref, width, height = image_info
         
@@ -1011,8 +1375,7 @@ class ContentArea(QGraphicsView):
         self._selected_image_border = QGraphicsRectItem(border_rect)
         
         # Style: Orange border, no fill, 3px width
-        orange_color = QColor(255, 102, 0)  # Orange
-        self._selected_image_border.setPen(QPen(orange_color, 3))
+        self._selected_image_border.setPen(self._IMAGE_PEN)
         self._selected_image_border.setBrush(Qt.NoBrush)
         
         # Add to scene
@@ -1058,61 +1421,110 @@ class ContentArea(QGraphicsView):
         
         if pixmap and not pixmap.isNull():
             # Add new rendered pixmap
-            rendered_item = self.scene.addPixmap(pixmap)
-            rendered_item.setPos(0, self._page_positions[page_number])
+            rendered_item = self._add_page_pixmap(page_number, pixmap)
             
-            # Replace in list
+            # Replace in list (keeping a replaced placeholder for reuse)
+            if page_number not in self._rendered_pages:
+                self._placeholder_pool.append(old_item)
             self._page_items[page_number] = rendered_item
+            self._rendered_pages.add(page_number)
     
     # Search highlighting methods
     def highlight_search_results(self, results: list):
         """
         Highlight all search results on PDF pages.
         
+        Overlays of pages whose matches did not change are kept as they are,
+        so re-applying the same results repaints nothing.
+        
         Args:
             results: List of search result dictionaries with 'page' and 'bbox'
         """
-        # Clear existing highlights
-        self.clear_search_highlights()
-        
-        # Store results
-        self._all_search_results = results
-        
         if not results or not self._pdf_document:
+            self.clear_search_highlights()
+            self._all_search_results = results
             return
         
-        from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen, QBrush
+        # Store results
+        self._all_search_results = results
         
         zoom_factor = self._pdf_document.zoom_level / 100.0
         
-        # Draw highlight for each result
-        for result in results:
-            page_num = result['page']
-            bbox = result['bbox']  # (x0, y0, x1, y1) in PDF coordinates
-            
-            if page_num < len(self._page_positions):
-                page_y_offset = self._page_positions[page_num]
-                
-                # Convert PDF bbox to scene coordinates
-                x0, y0, x1, y1 = bbox
-                scene_x0 = x0 * zoom_factor
-                scene_y0 = (y0 * zoom_factor) + page_y_offset
-                scene_x1 = x1 * zoom_factor
-                scene_y1 = (y1 * zoom_factor) + page_y_offset
-                
-                # Create highlight rectangle
-                highlight_rect = QRectF(scene_x0, scene_y0, scene_x1 - scene_x0, scene_y1 - scene_y0)
-                highlight_item = QGraphicsRectItem(highlight_rect)
-                
-                # Style: Yellow with 50% opacity for search highlights
-                yellow_color = QColor(255, 235, 59, 127)  # RGBA: Bright yellow with 50% alpha
-                highlight_item.setBrush(QBrush(yellow_color))
-                highlight_item.setPen(QPen(QColor(255, 235, 59, 200), 1))  # Yellow border
+        # Group match rectangles by page as (N, 4) float32 arrays in one pass
+        old_page_bboxes = self._search_page_bboxes
+        self._search_page_bboxes = self._group_search_bboxes(results)
+        
+        # Drop overlays of pages that no longer have matches
+        for page_num in [p for p in self._search_highlights if p not in self._search_page_bboxes]:
+            highlight_item = self._search_highlights.pop(page_num)
+            if highlight_item.scene():
+                self.scene.removeItem(highlight_item)
+            if self._current_search_match is not None and self._current_search_match[0] == page_num:
+                self._current_search_match = None
+        
+        # One overlay item per page paints all of its matches
+        for page_num, bboxes in self._search_page_bboxes.items():
+            highlight_item = self._search_highlights.get(page_num)
+            if highlight_item is None:
+                highlight_item = SearchHighlightItem(zoom_factor)
+                highlight_item.setPos(0, self._page_positions[page_num])
                 
                 # Add to scene and track
                 self.scene.addItem(highlight_item)
-                self._search_highlights.append(highlight_item)
+                self._search_highlights[page_num] = highlight_item
+            elif page_num in old_page_bboxes and np.array_equal(old_page_bboxes[page_num], bboxes):
+                # Same matches as before: keep the cached overlay, no repaint
+                continue
+            
+            highlight_item.set_highlights(bboxes)
+    
+    def _group_search_bboxes(self, results: list) -> Dict[int, np.ndarray]:
+        """
+        Split search result rectangles into one array per page.
+        
+        Args:
+            results: List of search result dictionaries with 'page' and 'bbox'
+            
+        Returns:
+            Dictionary of page number -> (N, 4) float32 array of
+            (x0, y0, x1, y1) rows in PDF coordinates
+        """
+        pages = np.fromiter((result['page'] for result in results), dtype=np.int64, count=len(results))
+        bboxes = np.array([result['bbox'] for result in results], dtype=np.float32).reshape(-1, 4)
+        
+        # Drop matches on pages that are not laid out
+        in_range = pages < len(self._page_positions)
+        pages = pages[in_range]
+        bboxes = bboxes[in_range]
+        
+        # Stable sort keeps the per-page match order of the results
+        order = np.argsort(pages, kind='stable')
+        pages = pages[order]
+        bboxes = bboxes[order]
+        
+        page_numbers, starts = np.unique(pages, return_index=True)
+        return {
+            page_num: page_rows
+            for page_num, page_rows in zip(page_numbers.tolist(), np.split(bboxes, starts[1:]))
+        }
+    
+    def _get_search_highlight_item(self, page_num: int) -> SearchHighlightItem:
+        """
+        Get the highlight overlay of a page, creating an empty one if needed.
+        
+        Args:
+            page_num: Page number (0-indexed)
+            
+        Returns:
+            SearchHighlightItem positioned on the page
+        """
+        highlight_item = self._search_highlights.get(page_num)
+        if highlight_item is None:
+            highlight_item = SearchHighlightItem(self._pdf_document.zoom_level / 100.0)
+            highlight_item.setPos(0, self._page_positions[page_num])
+            self.scene.addItem(highlight_item)
+            self._search_highlights[page_num] = highlight_item
+        return highlight_item
     
     def highlight_current_search_match(self, page_num: int, bbox: tuple):
         """
@@ -1122,17 +1534,20 @@ class ContentArea(QGraphicsView):
             page_num: Page number (0-indexed)
             bbox: Bounding box (x0, y0, x1, y1) in PDF coordinates
         """
-        # Clear previous current match highlight
-        if self._current_search_match and self._current_search_match.scene():
-            self.scene.removeItem(self._current_search_match)
-            self._current_search_match = None
-        
-        if not self._pdf_document or page_num >= len(self._page_positions):
+        valid_page = self._pdf_document is not None and page_num < len(self._page_positions)
+        
+        # Clear previous current match highlight (repaints only that match);
+        # on the same page set_current_match() below swaps it in one step
+        previous_match = self._current_search_match
+        self._current_search_match = None
+        if previous_match is not None and (not valid_page or previous_match[0] != page_num):
+            previous_item = self._search_highlights.get(previous_match[0])
+            if previous_item is not None and previous_item.scene():
+                previous_item.set_current_match(None)
+        
+        if not valid_page:
             return
         
-        from PySide6.QtWidgets import QGraphicsRectItem
-        from PySide6.QtGui import QColor, QPen, QBrush
-        
         zoom_factor = self._pdf_document.zoom_level / 100.0
         page_y_offset = self._page_positions[page_num]
         
@@ -1143,17 +1558,9 @@ class ContentArea(QGraphicsView):
         scene_x1 = x1 * zoom_factor
         scene_y1 = (y1 * zoom_factor) + page_y_offset
         
-        # Create current match highlight (orange for emphasis)
-        highlight_rect = QRectF(scene_x0, scene_y0, scene_x1 - scene_x0, scene_y1 - scene_y0)
-        self._current_search_match = QGraphicsRectItem(highlight_rect)
-        
-        # Style: Orange with 60% opacity for current match
-        orange_color = QColor(255, 152, 0, 153)  # RGBA: Orange with 60% alpha
-        self._current_search_match.setBrush(QBrush(orange_color))
-        self._current_search_match.setPen(QPen(QColor(255, 152, 0), 2))  # Orange border, 2px
-        
-        # Add to scene
-        self.scene.addItem(self._current_search_match)
+        # Emphasize the match on its page overlay (orange)
+        self._get_search_highlight_item(page_num).set_current_match(bbox)
+        self._current_search_match = (page_num, bbox)
         
         # Scroll to make this match visible
         self._scroll_to_rect(scene_x0, scene_y0, scene_x1 - scene_x0, scene_y1 - scene_y0)
@@ -1180,16 +1587,15 @@ class ContentArea(QGraphicsView):
     
     def clear_search_highlights(self):
         """Clear all search highlights from the display."""
-        # Remove all search highlight rectangles
-        for highlight_item in self._search_highlights:
+        # Remove all per-page highlight overlays
+        for highlight_item in self._search_highlights.values():
             if highlight_item.scene():
                 self.scene.removeItem(highlight_item)
         
-        self._search_highlights = []
+        self._search_highlights = {}
         
-        # Clear current match highlight
-        if self._current_search_match and self._current_search_match.scene():
-            self.scene.removeItem(self._current_search_match)
-            self._current_search_match = None
+        # Current match was drawn by one of the overlays
+        self._current_search_match = None
         
         self._all_search_results = []
+        self._search_page_bboxes = {}
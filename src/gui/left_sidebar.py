@@ -56,12 +56,16 @@ class LeftSidebar(QDockWidget):
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.South)
         
-        # Add all tabs
+        # Add all tabs; comments and layers are built when first shown
+        self._lazy_tabs = {}  # Placeholder tab widget: builder, until built
+        self.comments_list = None
+        self.layers_list = None
         self._create_pages_tab()
         self._create_bookmarks_tab()
-        self._create_comments_tab()
+        self._add_lazy_tab(self._create_comments_tab, 'comment', "Comments")
         self._create_search_tab()
-        self._create_layers_tab()
+        self._add_lazy_tab(self._create_layers_tab, 'layers', "Layers")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Wrap tab widget in scroll area for small screens
         scroll_area = QScrollArea()
@@ -165,9 +169,39 @@ class LeftSidebar(QDockWidget):
         self.tabs.addTab(bookmarks_container, get_icon('bookmarks', 16), "")
         self.tabs.setTabToolTip(1, "Bookmarks")
     
-    def _create_comments_tab(self):
-        """Create comments panel."""
-        comments_widget = QWidget()
+    def _add_lazy_tab(self, builder, icon_name: str, tooltip: str):
+        """
+        Add a tab whose content is built the first time it is shown.
+        
+        Args:
+            builder: Method laying out the tab content into a given widget
+            icon_name: Tab icon name
+            tooltip: Tab tooltip
+        """
+        tab = QWidget()
+        index = self.tabs.addTab(tab, get_icon(icon_name, 16), "")
+        self.tabs.setTabToolTip(index, tooltip)
+        self._lazy_tabs[tab] = builder
+    
+    def _on_tab_changed(self, index: int):
+        """
+        Build a deferred tab the first time it is shown.
+        
+        Args:
+            index: Index of the newly current tab
+        """
+        tab = self.tabs.widget(index)
+        builder = self._lazy_tabs.pop(tab, None)
+        if builder is not None:
+            builder(tab)
+    
+    def _create_comments_tab(self, comments_widget: QWidget):
+        """
+        Create comments panel.
+        
+        Args:
+            comments_widget: Tab widget to lay the panel out in
+        """
         layout = QVBoxLayout(comments_widget)
         layout.setSpacing(Spacing.SMALL)
         
@@ -208,9 +242,6 @@ class LeftSidebar(QDockWidget):
         sort_layout.addStretch()
         
         layout.addLayout(sort_layout)
-        
-        self.tabs.addTab(comments_widget, get_icon('comment', 16), "")
-        self.tabs.setTabToolTip(2, "Comments")
     
     def _create_search_tab(self):
         """Create search panel."""
@@ -225,9 +256,13 @@ class LeftSidebar(QDockWidget):
         self.tabs.addTab(self.search_panel, get_icon('search', 16), "")
         self.tabs.setTabToolTip(3, "Search")
     
-    def _create_layers_tab(self):
-        """Create layers panel for advanced PDFs."""
-        layers_widget = QWidget()
+    def _create_layers_tab(self, layers_widget: QWidget):
+        """
+        Create layers panel for advanced PDFs.
+        
+        Args:
+            layers_widget: Tab widget to lay the panel out in
+        """
         layout = QVBoxLayout(layers_widget)
         layout.setSpacing(Spacing.SMALL)
         
@@ -267,9 +302,6 @@ class LeftSidebar(QDockWidget):
         action_layout.addWidget(hide_all_btn)
         
         layout.addLayout(action_layout)
-        
-        self.tabs.addTab(layers_widget, get_icon('layers', 16), "")
-        self.tabs.setTabToolTip(4, "Layers")
     
     def _on_search_requested(self, search_term: str, options: dict):
         """
@@ -298,6 +330,11 @@ class LeftSidebar(QDockWidget):
         # Signal will be handled by main window/content area
         pass
     
+    def show_search(self):
+        """Switch to the search tab and focus its input."""
+        self.tabs.setCurrentWidget(self.search_panel)
+        self.search_panel.focus_search_input()
+    
     def display_search_results(self, results: list):
         """
         Display search results in search panel.
@@ -497,8 +534,10 @@ class LeftSidebar(QDockWidget):
         self.bookmarks_panel.hide()
         self.bookmarks_placeholder.show()
         
-        # Clear other tabs
-        self.comments_list.clear()
-        self.layers_list.clear()
+        # Clear other tabs (unless not built yet)
+        if self.comments_list is not None:
+            self.comments_list.clear()
+        if self.layers_list is not None:
+            self.layers_list.clear()
         self.page_counter.setText("0 pages")
         self.clear_search()
@@ -4,8 +4,10 @@ Main application window.
 Contains the primary UI structure with menu bar, toolbar, sidebars, content area, and status bar.
 """
 
+import logging
+from collections import OrderedDict
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal
@@ -28,6 +30,8 @@ from .ocr_dialogs import OCRDialog, OCRProgressDialog, OCRCompletionDialog
 from .ocr_review_settings import OCRReviewDialog, OCRSettingsDialog
 from core.ocr.ocr_coordinator import OCRCoordinator, OCRWorker
 
+_log = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """
@@ -42,6 +46,8 @@ class MainWindow(QMainWindow):
     document_closed = Signal()     # Emitted when a document is closed
     theme_changed = Signal(str)    # Emitted when theme is changed
     
+    SEARCH_CACHE_SIZE = 32  # Result sets kept for repeated searches
+    
     def __init__(self):
         """Initialize the main window with all components."""
         super().__init__()
@@ -61,6 +67,9 @@ class MainWindow(QMainWindow):
         self._current_document = None
         self._is_modified = False
         
+        # Recent search results for the open document: (term, options) -> results
+        self._search_cache = OrderedDict()
+        
         self._setup_window()
         self._create_components()
         self._create_layout()
@@ -139,6 +148,7 @@ class MainWindow(QMainWindow):
         self.menu_bar_widget.undo_requested.connect(self._handle_undo)  # Connect Undo from menu  
         self.menu_bar_widget.redo_requested.connect(self._handle_redo)  # Connect Redo from menu
         self.menu_bar_widget.copy_requested.connect(self.content_area.copy_selected_text)
+        self.menu_bar_widget.find_requested.connect(self.left_sidebar.show_search)
         self.menu_bar_widget.exit_requested.connect(self.close)
         self.menu_bar_widget.zoom_in_requested.connect(self._handle_zoom_in)
         self.menu_bar_widget.zoom_out_requested.connect(self._handle_zoom_out)
@@ -197,8 +207,10 @@ class MainWindow(QMainWindow):
         self.left_sidebar.page_selected.connect(self.content_area.go_to_page)
         self.left_sidebar.search_requested.connect(self._handle_search_requested)
         
-        # Search panel signals (connect after search_panel is created in left_sidebar)
-        # Note: We'll connect these in _on_document_loaded after sidebar is fully initialized
+        # Search panel signals (connected once here; connecting them on every
+        # document load stacked a duplicate handler per opened document)
+        self.left_sidebar.search_panel.result_selected.connect(self._on_search_result_clicked)
+        self.left_sidebar.search_panel.clear_highlights.connect(self.content_area.clear_search_highlights)
         
         # Content area signals
         self.content_area.page_changed.connect(self._on_page_changed)
@@ -285,6 +297,7 @@ class MainWindow(QMainWindow):
         # Close document
         self._current_document = None
         self._is_modified = False
+        self._search_cache.clear()
         self._update_window_state()
         self.document_closed.emit()
     
@@ -331,9 +344,10 @@ class MainWindow(QMainWindow):
         current_theme = self.theme_manager.get_current_theme()
         new_theme = 'dark' if current_theme == 'light' else 'light'
         
-        # Apply new theme
+        # Apply new theme: one application-wide stylesheet and palette
+        # restyles every panel, so no component re-styles itself
         self.theme_manager.set_theme(new_theme)
-        self.theme_manager.apply_theme(self.window().windowHandle().screen())
+        self.theme_manager.apply_theme(QApplication.instance())
         
         # Save preference
         self.config.set_theme(new_theme)
@@ -445,12 +459,28 @@ class MainWindow(QMainWindow):
             options: Search options dictionary
         """
         if not self.pdf_document or not self.pdf_document.is_open:
+            self.left_sidebar.search_panel.search_failed()
             return
         
         # Cancel any existing search
-        if hasattr(self, '_search_worker') and self._search_worker and self._search_worker.isRunning():
-            self._search_worker.cancel()
-            self._search_worker.wait()
+        if hasattr(self, '_search_worker') and self._search_worker:
+            if self._search_worker.isRunning():
+                self._search_worker.cancel()
+                self._search_worker.wait()
+            
+            # Deleted after its already queued signals, which the handlers
+            # drop since it is no longer the current worker
+            self._search_worker.deleteLater()
+            self._search_worker = None
+        
+        # Repeated searches (history, toggling an option back) skip the scan;
+        # results found before a page edit are not reused after it
+        key = (self.pdf_document.edit_generation, search_term, tuple(sorted(options.items())))
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            self._on_search_results(cached)
+            return
         
         # Show searching message
         self.status_bar_widget.show_message(f"Searching for '{search_term}'...", 0)
@@ -458,12 +488,43 @@ class MainWindow(QMainWindow):
         # Create and start search worker
         from .search_worker import SearchWorker
         
-        self._search_worker = SearchWorker(self.pdf_document, search_term, options)
+        self.left_sidebar.search_panel.begin_results()
+        
+        self._search_worker = SearchWorker(self.pdf_document, search_term, options, self)
         self._search_worker.progress_updated.connect(self._on_search_progress)
+        self._search_worker.results_found.connect(self._on_search_results_found)
+        self._search_worker.results_ready.connect(
+            lambda results: self._cache_search_results(key, results)
+        )
         self._search_worker.results_ready.connect(self._on_search_results)
         self._search_worker.error_occurred.connect(self._on_search_error)
         self._search_worker.start()
     
+    def _cache_search_results(self, key: tuple, results: list):
+        """
+        Remember finished search results, dropping the least recently used.
+        
+        Args:
+            key: (edit generation, search_term, sorted option items) of the search
+            results: List of search result dictionaries
+        """
+        self._search_cache[key] = results
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+    
+    def _on_search_results_found(self, results: list):
+        """
+        Handle matches streamed by a running search.
+        
+        Args:
+            results: Matches found since the previous update
+        """
+        # Drop batches still queued from a search that was replaced
+        if self.sender() is not self._search_worker:
+            return
+        
+        self.left_sidebar.search_panel.append_results(results)
+    
     def _on_search_progress(self, current_page: int, total_pages: int):
         """
         Handle search progress update.
@@ -473,7 +534,7 @@ class MainWindow(QMainWindow):
             total_pages: Total number of pages
         """
         # Update progress in sidebar
-        percentage = int((current_page / total_pages) * 100)
+        percentage = current_page * 100 // total_pages
         self.left_sidebar.search_panel.set_progress(percentage)
         
         # Update status bar
@@ -489,6 +550,12 @@ class MainWindow(QMainWindow):
         Args:
             results: List of search result dictionaries
         """
+        # Drop results still queued from a search that was replaced
+        # (no sender: served directly from the cache)
+        sender = self.sender()
+        if sender is not None and sender is not self._search_worker:
+            return
+        
         # Display results in sidebar
         self.left_sidebar.display_search_results(results)
         
@@ -513,6 +580,7 @@ class MainWindow(QMainWindow):
         Args:
             error_message: Error description
         """
+        self.left_sidebar.search_panel.search_failed()
         self.status_bar_widget.show_message(f"Search error: {error_message}", 5000)
         QMessageBox.warning(self, "Search Error", error_message)
     
@@ -597,6 +665,9 @@ class MainWindow(QMainWindow):
     
     def _on_document_loaded(self):
         """Handle successful PDF document loading."""
+        # Cached search results belong to the previous document
+        self._search_cache.clear()
+        
         # Pass PDF document to content area for continuous rendering
         self.content_area.set_pdf_document(self.pdf_document)
         
@@ -610,12 +681,6 @@ class MainWindow(QMainWindow):
         bookmarks = self.pdf_document.get_bookmarks()
         self.left_sidebar.load_bookmarks(bookmarks)
         
-        # Connect search result selection signal
-        self.left_sidebar.search_panel.result_selected.connect(self._on_search_result_clicked)
-        
-        # Connect clear highlights signal
-        self.left_sidebar.search_panel.clear_highlights.connect(self.content_area.clear_search_highlights)
-        
         # Check if document is scanned and show OCR banner
         if self.ocr_coordinator.is_scanned_document(self._current_document):
             self.ocr_banner.show_banner()
@@ -629,8 +694,10 @@ class MainWindow(QMainWindow):
             page_num: Page number (0-indexed)
             bbox: Bounding box of match
         """
-        # Navigate to page
-        self.content_area.go_to_page(page_num)
+        # Navigate to page (stepping through matches on the current page
+        # only scrolls as far as needed, so just the two matches repaint)
+        if page_num != self.content_area.get_current_page():
+            self.content_area.go_to_page(page_num)
         
         # Highlight this specific match (orange)
         self.content_area.highlight_current_search_match(page_num, bbox)
@@ -871,7 +938,7 @@ class MainWindow(QMainWindow):
         total_text_blocks = sum(len(r.text_blocks) for r in results)
         total_text = ''.join(r.full_text for r in results).strip()
         
-        print(f"DEBUG: Saving OCR results - {len(results)} pages, {total_text_blocks} text blocks, {len(total_text)} chars")
+        _log.debug("Saving OCR results - %s pages, %s text blocks, %s chars", len(results), total_text_blocks, len(total_text))
         
         if total_text_blocks == 0 or len(total_text) == 0:
             QMessageBox.warning(
@@ -31,6 +31,7 @@ class MenuBar(QMenuBar):
     undo_requested = Signal()
     redo_requested = Signal()
     copy_requested = Signal()  # Copy selected content (text or image)
+    find_requested = Signal()  # Focus the search panel input
     
     zoom_in_requested = Signal()
     zoom_out_requested = Signal()
@@ -198,6 +199,15 @@ class MenuBar(QMenuBar):
         select_all_action.triggered.connect(lambda: self._show_coming_soon("Select All"))
         edit_menu.addAction(select_all_action)
         self._document_actions.append(select_all_action)
+        
+        edit_menu.addSeparator()
+        
+        # Find (window-wide, so it also works from the document view)
+        find_action = QAction("&Find...", self)
+        find_action.setShortcut(QKeySequence.Find)
+        find_action.setStatusTip("Search the document")
+        find_action.triggered.connect(self.find_requested.emit)
+        edit_menu.addAction(find_action)
     
     def _create_view_menu(self):
         """Create View menu with view options."""
@@ -643,6 +653,7 @@ class MenuBar(QMenuBar):
         <tr><td><b>Ctrl+C</b></td><td>Copy</td></tr>
         <tr><td><b>Ctrl+V</b></td><td>Paste</td></tr>
         <tr><td><b>Ctrl+A</b></td><td>Select All</td></tr>
+        <tr><td><b>Ctrl+F</b></td><td>Find</td></tr>
         </table>
         
         <h4>View</h4>
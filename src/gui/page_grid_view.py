@@ -123,12 +123,21 @@ class PageGridView(QScrollArea):
     
     def _clear_grid(self):
         """Clear all widgets from grid."""
-        # Remove all widgets
-        for widget in self._thumbnail_widgets.values():
-            self._grid_layout.removeWidget(widget)
-            widget.deleteLater()
+        # Hold off repaints and relayouts until every widget is out
+        self._container.setUpdatesEnabled(False)
+        
+        # Take items from the end so the remaining indices never shift
+        for index in range(self._grid_layout.count() - 1, -1, -1):
+            item = self._grid_layout.takeAt(index)
+            widget = item.widget() if item else None
+            if widget:
+                # Detach now; freed as soon as the last reference is dropped
+                widget.setParent(None)
         
         self._thumbnail_widgets.clear()
+        
+        self._container.setUpdatesEnabled(True)
+        self._container.updateGeometry()
     
     def set_thumbnail(self, page_num: int, pixmap):
         """
@@ -201,16 +210,15 @@ class PageGridView(QScrollArea):
         Returns:
             Tuple of (first_visible, last_visible) page numbers
         """
-        viewport_rect = self.viewport().rect()
+        # Thumbnails are direct children of the container, so map the
+        # viewport into container coordinates once instead of mapping
+        # every thumbnail up to the viewport
+        visible_rect = self.viewport().rect().translated(-self._container.pos())
         visible_pages = []
         
         for page_num, widget in self._thumbnail_widgets.items():
-            # Get widget position relative to viewport
-            widget_pos = widget.mapTo(self.viewport(), widget.rect().topLeft())
-            widget_rect = QRect(widget_pos, widget.size())
-            
             # Check if widget intersects viewport
-            if viewport_rect.intersects(widget_rect):
+            if visible_rect.intersects(widget.geometry()):
                 visible_pages.append(page_num)
         
         if visible_pages:
@@ -259,8 +267,8 @@ class PageGridView(QScrollArea):
             return
         
         # Calculate target scroll position
-        widget_pos = widget.mapTo(self._container, widget.rect().topLeft())
-        target_y = widget_pos.y() - (self.viewport().height() // 2) + (widget.height() // 2)
+        # Direct child of the container: its position is already in container coordinates
+        target_y = widget.y() - (self.viewport().height() // 2) + (widget.height() // 2)
         
         # Clamp to valid range
         scrollbar = self.verticalScrollBar()
@@ -5,8 +5,8 @@ Displays a single page thumbnail with page number and visual indicators.
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMenu
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush, QFont, QPalette
+from PySide6.QtCore import Qt, Signal, QSize, QTimer, QRect, QPoint
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush, QFont, QPalette, QRegion, QPolygon
 
 
 class PageThumbnailWidget(QWidget):
@@ -23,6 +23,14 @@ class PageThumbnailWidget(QWidget):
     double_clicked = Signal(int)  # page_number
     context_menu_requested = Signal(int, object)  # page_number, QPoint
     
+    # Shared indicator pens and brushes (created once instead of per paint)
+    _CURRENT_PEN = QPen(QColor(0, 120, 215), 3)  # Blue, 3px width
+    _BADGE_BRUSH = QBrush(QColor(255, 140, 0))  # Orange
+    _ANNOTATION_PEN = QPen(QColor(255, 215, 0), 2)  # Gold outline
+    _ANNOTATION_BRUSH = QBrush(QColor(255, 255, 0))  # Yellow fill
+    _ANNOTATION_TEXT_COLOR = QColor(0, 0, 0)
+    _annotation_font = None  # Created on first paint (needs the application)
+    
     def __init__(self, page_number: int, parent=None):
         """
         Initialize thumbnail widget.
@@ -133,8 +141,13 @@ class PageThumbnailWidget(QWidget):
         Args:
             is_current: True if this is the current page
         """
+        if is_current == self._is_current:
+            return
         self._is_current = is_current
-        self.update()  # Repaint to show/hide blue border
+        
+        # Repaint only the blue border ring, not the whole thumbnail
+        rect = self._thumbnail_label.geometry()
+        self.update(QRegion(rect.adjusted(-1, -1, 1, 1)) - QRegion(rect.adjusted(4, 4, -4, -4)))
     
     def set_selected(self, is_selected: bool):
         """
@@ -154,8 +167,10 @@ class PageThumbnailWidget(QWidget):
         Args:
             is_modified: True if page has been modified
         """
+        if is_modified == self._is_modified:
+            return
         self._is_modified = is_modified
-        self.update()  # Repaint to show/hide orange badge
+        self.update(self._badge_rect(self._thumbnail_label.geometry()))  # Repaint to show/hide orange badge
     
     def set_has_annotations(self, has_annotations: bool):
         """
@@ -164,8 +179,39 @@ class PageThumbnailWidget(QWidget):
         Args:
             has_annotations: True if page has annotations
         """
+        if has_annotations == self._has_annotations:
+            return
         self._has_annotations = has_annotations
-        self.update()  # Repaint to show/hide yellow star
+        # Repaint to show/hide yellow star
+        self.update(self._annotation_rect(self._thumbnail_label.geometry()).adjusted(-2, -2, 2, 2))
+    
+    @staticmethod
+    def _badge_rect(rect: QRect) -> QRect:
+        """
+        Get the area of the modified badge (top-right of the thumbnail).
+        
+        Args:
+            rect: Thumbnail label geometry
+            
+        Returns:
+            Badge area in widget coordinates
+        """
+        badge_size = 16
+        return QRect(rect.right() - badge_size, rect.top(), badge_size + 1, badge_size + 1)
+    
+    @staticmethod
+    def _annotation_rect(rect: QRect) -> QRect:
+        """
+        Get the area of the annotation indicator (bottom-right of the thumbnail).
+        
+        Args:
+            rect: Thumbnail label geometry
+            
+        Returns:
+            Indicator area in widget coordinates
+        """
+        star_size = 12
+        return QRect(rect.right() - star_size - 2, rect.bottom() - star_size - 2, star_size, star_size)
     
     def get_page_number(self) -> int:
         """
@@ -194,57 +240,70 @@ class PageThumbnailWidget(QWidget):
         """
         super().paintEvent(event)
         
+        # Most thumbnails carry no indicator: don't set up a painter at all
+        if not (self._is_current or self._is_modified or self._has_annotations):
+            return
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Draw current page indicator (blue border)
+        # Label geometry is fetched once and shared by all indicators
+        rect = self._thumbnail_label.geometry()
+        
+        # Draw current page indicator (blue border, axis-aligned: no antialiasing)
         if self._is_current:
-            pen = QPen(QColor(0, 120, 215), 3)  # Blue, 3px width
-            painter.setPen(pen)
+            painter.setPen(self._CURRENT_PEN)
             painter.setBrush(Qt.NoBrush)
-            rect = self._thumbnail_label.geometry()
             painter.drawRect(rect.adjusted(1, 1, -1, -1))
         
+        # Antialiasing only for the diagonal badge edge and the round indicator
+        if self._is_modified or self._has_annotations:
+            painter.setRenderHint(QPainter.Antialiasing)
+        
         # Draw modified badge (orange triangle in top-right)
         if self._is_modified:
             badge_size = 16
-            rect = self._thumbnail_label.geometry()
-            x = rect.right() - badge_size
-            y = rect.top()
+            badge = self._badge_rect(rect)
+            x = badge.left()
+            y = badge.top()
             
-            painter.setBrush(QBrush(QColor(255, 140, 0)))  # Orange
+            painter.setBrush(self._BADGE_BRUSH)
             painter.setPen(Qt.NoPen)
             
-            points = [
-                (x + badge_size, y),
-                (x + badge_size, y + badge_size),
-                (x, y)
-            ]
-            from PySide6.QtCore import QPoint
-            qpoints = [QPoint(px, py) for px, py in points]
-            from PySide6.QtGui import QPolygon
-            painter.drawPolygon(QPolygon(qpoints))
+            painter.drawPolygon(QPolygon([
+                QPoint(x + badge_size, y),
+                QPoint(x + badge_size, y + badge_size),
+                QPoint(x, y)
+            ]))
         
         # Draw annotation indicator (yellow star in bottom-right)
         if self._has_annotations:
-            star_size = 12
-            rect = self._thumbnail_label.geometry()
-            x = rect.right() - star_size - 2
-            y = rect.bottom() - star_size - 2
+            star = self._annotation_rect(rect)
             
-            painter.setPen(QPen(QColor(255, 215, 0), 2))  # Gold outline
-            painter.setBrush(QBrush(QColor(255, 255, 0)))  # Yellow fill
+            painter.setPen(self._ANNOTATION_PEN)
+            painter.setBrush(self._ANNOTATION_BRUSH)
             
             # Draw simple star (circle for simplicity)
-            painter.drawEllipse(x, y, star_size, star_size)
+            painter.drawEllipse(star)
             
             # Draw "A" for annotation
-            painter.setPen(QColor(0, 0, 0))
+            painter.setPen(self._ANNOTATION_TEXT_COLOR)
+            painter.setFont(self._get_annotation_font())
+            painter.drawText(star, Qt.AlignCenter, "A")
+    
+    @classmethod
+    def _get_annotation_font(cls) -> QFont:
+        """
+        Get the font of the annotation indicator, shared by all thumbnails.
+        
+        Returns:
+            Bold 8px font
+        """
+        if cls._annotation_font is None:
             font = QFont()
             font.setPixelSize(8)
             font.setBold(True)
-            painter.setFont(font)
-            painter.drawText(x, y, star_size, star_size, Qt.AlignCenter, "A")
+            cls._annotation_font = font
+        return cls._annotation_font
     
     def mousePressEvent(self, event):
         """
@@ -27,6 +27,19 @@ class RightSidebar(QDockWidget):
     format_changed = Signal(dict)  # Emitted when format settings change
     properties_updated = Signal(dict)  # Emitted when properties are saved
     
+    # Read-only document info rows: property key -> (label format, cleared value)
+    _INFO_FIELDS = {
+        'pages': ("Pages: {}", "-"),
+        'size': ("Size: {}", "-"),
+        'version': ("PDF Version: {}", "-"),
+        'created': ("Created: {}", "-"),
+        'modified': ("Modified: {}", "-"),
+    }
+    _SECURITY_FIELDS = {
+        'encrypted': ("Encrypted: {}", "No"),
+        'permissions': ("Permissions: {}", "Full access"),
+    }
+    
     def __init__(self, parent=None):
         """
         Initialize right sidebar.
@@ -52,9 +65,13 @@ class RightSidebar(QDockWidget):
         # Create tab widget
         self.tabs = QTabWidget()
         
-        # Add tabs
+        # Add tabs (properties content is built on first use, see
+        # _create_properties_tab)
         self._create_format_tab()
-        self._create_properties_tab()
+        self._properties_tab = QWidget()
+        self._properties_built = False
+        self.tabs.addTab(self._properties_tab, f"{Icons.PROPERTIES} Properties")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tabs)
         
@@ -155,10 +172,28 @@ class RightSidebar(QDockWidget):
         
         self.tabs.addTab(format_widget, f"{Icons.FORMAT} Format")
     
+    def _on_tab_changed(self, index: int):
+        """
+        Build the properties tab the first time it is shown.
+        
+        Args:
+            index: Index of the newly selected tab
+        """
+        if self.tabs.widget(index) is self._properties_tab:
+            self._create_properties_tab()
+    
     def _create_properties_tab(self):
-        """Create properties panel for document metadata."""
-        props_widget = QWidget()
-        layout = QVBoxLayout(props_widget)
+        """
+        Create properties panel for document metadata.
+        
+        Deferred until the tab is shown or properties are loaded, so
+        sessions that never look at a document's properties skip it.
+        """
+        if self._properties_built:
+            return
+        self._properties_built = True
+        
+        layout = QVBoxLayout(self._properties_tab)
         layout.setSpacing(Spacing.MEDIUM)
         layout.setContentsMargins(Spacing.MEDIUM, Spacing.MEDIUM, Spacing.MEDIUM, Spacing.MEDIUM)
         
@@ -189,24 +224,20 @@ class RightSidebar(QDockWidget):
         save_metadata_btn.clicked.connect(self._save_metadata)
         layout.addWidget(save_metadata_btn)
         
+        # Read-only labels by property key: (label, format, cleared value)
+        self._info_labels = {}
+        
         # Document info section
         info_group = QGroupBox("Document Information")
         info_layout = QVBoxLayout(info_group)
         
-        self.pages_label = QLabel("Pages: -")
-        info_layout.addWidget(self.pages_label)
-        
-        self.size_label = QLabel("Size: -")
-        info_layout.addWidget(self.size_label)
-        
-        self.version_label = QLabel("PDF Version: -")
-        info_layout.addWidget(self.version_label)
-        
-        self.created_label = QLabel("Created: -")
-        info_layout.addWidget(self.created_label)
-        
-        self.modified_label = QLabel("Modified: -")
-        info_layout.addWidget(self.modified_label)
+        # Values come from file metadata; plain text skips the rich-text
+        # check (and QTextDocument layout) Qt would otherwise do per update
+        for key, (text, cleared) in self._INFO_FIELDS.items():
+            label = QLabel(text.format(cleared))
+            label.setTextFormat(Qt.PlainText)
+            info_layout.addWidget(label)
+            self._info_labels[key] = (label, text, cleared)
         
         layout.addWidget(info_group)
         
@@ -214,12 +245,12 @@ class RightSidebar(QDockWidget):
         security_group = QGroupBox("Security")
         security_layout = QVBoxLayout(security_group)
         
-        self.encrypted_label = QLabel("Encrypted: No")
-        security_layout.addWidget(self.encrypted_label)
-        
-        self.permissions_label = QLabel("Permissions: Full access")
-        self.permissions_label.setWordWrap(True)
-        security_layout.addWidget(self.permissions_label)
+        for key, (text, cleared) in self._SECURITY_FIELDS.items():
+            label = QLabel(text.format(cleared))
+            label.setTextFormat(Qt.PlainText)
+            security_layout.addWidget(label)
+            self._info_labels[key] = (label, text, cleared)
+        self._info_labels['permissions'][0].setWordWrap(True)
         
         security_btn = QPushButton("Security Settings...")
         security_btn.clicked.connect(lambda: self._show_coming_soon("Security Settings"))
@@ -228,8 +259,6 @@ class RightSidebar(QDockWidget):
         layout.addWidget(security_group)
         
         layout.addStretch()
-        
-        self.tabs.addTab(props_widget, f"{Icons.PROPERTIES} Properties")
     
     def _choose_color(self):
         """Open color picker dialog."""
@@ -319,45 +348,35 @@ class RightSidebar(QDockWidget):
         Args:
             properties: Dictionary of document properties
         """
+        self._create_properties_tab()
+        
         # Load metadata
         self.title_input.setText(properties.get('title', ''))
         self.author_input.setText(properties.get('author', ''))
         self.subject_input.setText(properties.get('subject', ''))
         self.keywords_input.setText(properties.get('keywords', ''))
         
-        # Load info
-        if 'pages' in properties:
-            self.pages_label.setText(f"Pages: {properties['pages']}")
-        if 'size' in properties:
-            self.size_label.setText(f"Size: {properties['size']}")
-        if 'version' in properties:
-            self.version_label.setText(f"PDF Version: {properties['version']}")
-        if 'created' in properties:
-            self.created_label.setText(f"Created: {properties['created']}")
-        if 'modified' in properties:
-            self.modified_label.setText(f"Modified: {properties['modified']}")
-        
-        # Load security info
-        if 'encrypted' in properties:
-            encrypted_text = "Yes" if properties['encrypted'] else "No"
-            self.encrypted_label.setText(f"Encrypted: {encrypted_text}")
-        if 'permissions' in properties:
-            self.permissions_label.setText(f"Permissions: {properties['permissions']}")
+        # Load info and security info
+        for key, (label, text, _cleared) in self._info_labels.items():
+            if key not in properties:
+                continue
+            value = properties[key]
+            if key == 'encrypted':
+                value = "Yes" if value else "No"
+            label.setText(text.format(value))
     
     def clear_properties(self):
         """Clear all property fields."""
+        if not self._properties_built:
+            return  # Nothing shown yet
+        
         self.title_input.clear()
         self.author_input.clear()
         self.subject_input.clear()
         self.keywords_input.clear()
         
-        self.pages_label.setText("Pages: -")
-        self.size_label.setText("Size: -")
-        self.version_label.setText("PDF Version: -")
-        self.created_label.setText("Created: -")
-        self.modified_label.setText("Modified: -")
-        self.encrypted_label.setText("Encrypted: No")
-        self.permissions_label.setText("Permissions: Full access")
+        for label, text, cleared in self._info_labels.values():
+            label.setText(text.format(cleared))
     
     def get_format_settings(self) -> dict:
         """
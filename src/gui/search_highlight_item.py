@@ -0,0 +1,215 @@
+"""
+Search highlight overlay for a single PDF page.
+
+Paints every search match of one page from a single graphics item instead
+of adding one rectangle item per match to the scene.
+"""
+
+from typing import List, Tuple, Optional, Union
+import numpy as np
+from PySide6.QtWidgets import QGraphicsItem
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QColor, QPen, QBrush
+
+
+class SearchHighlightItem(QGraphicsItem):
+    """
+    Overlay item drawing the search matches of one page.
+
+    Match rectangles are scaled to scene units once when they are set and
+    kept as parallel x/y/w/h arrays plus ready-made QRectFs, so culling
+    against the exposed area is a single vectorized test and painting does
+    no per-match arithmetic. The QRectFs are only built on first paint, so
+    overlays of pages that are never scrolled into view cost no per-match
+    Python objects. The painted result is cached by Qt as a device pixmap
+    and reused while scrolling until the highlights change. Moving the
+    current match only invalidates the old and new match rectangles.
+    """
+
+    # Shared pens and brushes (created once instead of per paint)
+    _MATCH_BRUSH = QBrush(QColor(255, 235, 59, 127))  # Bright yellow with 50% alpha
+    _MATCH_PEN = QPen(QColor(255, 235, 59, 200), 1)  # Yellow border
+    _CURRENT_BRUSH = QBrush(QColor(255, 152, 0, 153))  # Orange with 60% alpha
+    _CURRENT_PEN = QPen(QColor(255, 152, 0), 2)  # Orange border, 2px
+
+    def __init__(self, zoom_factor: float, parent=None):
+        """
+        Initialize highlight overlay.
+
+        Args:
+            zoom_factor: Scale from PDF points to scene units
+            parent: Parent graphics item
+        """
+        super().__init__(parent)
+
+        self._bounds = QRectF()  # Union of match rects in local coordinates
+        self._match_bounds = QRectF()  # Union of all match rects
+        self._zoom_factor = zoom_factor
+        self._current = None  # Current match (x0, y0, x1, y1) in PDF coordinates
+        self._current_area = None  # Current match area incl. border, local coordinates
+
+        # Match rects scaled to local (scene) units, one contiguous array per field
+        self._hl_x = np.empty(0, dtype=np.float32)
+        self._hl_y = np.empty(0, dtype=np.float32)
+        self._hl_w = np.empty(0, dtype=np.float32)
+        self._hl_h = np.empty(0, dtype=np.float32)
+        self._rects: Optional[List[QRectF]] = []  # Same rects, built lazily for drawing
+
+        # Needed so paint() receives the exposed rectangle
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+        # Keep the painted overlay in a pixmap; only repainted after update()
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+        # Stay above page pixmaps that are added later by lazy rendering
+        self.setZValue(1)
+
+    def set_highlights(self, bboxes: Union[np.ndarray, List[Tuple[float, float, float, float]]]):
+        """
+        Replace the highlighted match rectangles.
+
+        Args:
+            bboxes: (N, 4) array or list of (x0, y0, x1, y1) in PDF coordinates
+        """
+        # (N, 4) rows -> four contiguous columns, scaled once per zoom level
+        # (overlays are recreated when the page layout changes)
+        scaled = np.asarray(bboxes, dtype=np.float32).reshape(-1, 4) * np.float32(self._zoom_factor)
+        x0, y0, x1, y1 = scaled.T.copy()
+        self._hl_x = x0
+        self._hl_y = y0
+        self._hl_w = x1 - x0
+        self._hl_h = y1 - y0
+        self._rects = None  # Built by _draw_rects() on first paint
+
+        # Bounds only cover the matches (plus the border) so the cached
+        # pixmap stays small
+        if len(x0):
+            left = float(x0.min())
+            top = float(y0.min())
+            right = float(x1.max())
+            bottom = float(y1.max())
+            self._match_bounds = QRectF(left, top, right - left, bottom - top).adjusted(-2, -2, 2, 2)
+        else:
+            self._match_bounds = QRectF()
+        self._update_bounds()
+        self.update()
+
+    def set_current_match(self, bbox: Optional[Tuple[float, float, float, float]]):
+        """
+        Set the match drawn with the current-match emphasis.
+
+        Only the old and new match rectangles are repainted.
+
+        Args:
+            bbox: (x0, y0, x1, y1) in PDF coordinates, or None to clear
+        """
+        if bbox == self._current:
+            return
+
+        old_rect = self._current_area
+        self._current = tuple(bbox) if bbox is not None else None
+        self._current_area = self._scale_current_rect()
+        new_rect = self._current_area
+        self._update_bounds()
+
+        # Invalidate just the union of the old and new current match
+        if old_rect is not None and new_rect is not None:
+            self.update(old_rect.united(new_rect))
+        elif old_rect is not None or new_rect is not None:
+            self.update(old_rect if old_rect is not None else new_rect)
+
+    def _scale_current_rect(self) -> Optional[QRectF]:
+        """
+        Scale the current match to local coordinates (once per change).
+
+        Returns:
+            QRectF including the border, or None if there is no current match
+        """
+        if self._current is None:
+            return None
+
+        zoom_factor = self._zoom_factor
+        x0, y0, x1, y1 = self._current
+        return QRectF(
+            x0 * zoom_factor, y0 * zoom_factor,
+            (x1 - x0) * zoom_factor, (y1 - y0) * zoom_factor
+        ).adjusted(-2, -2, 2, 2)
+
+    def _draw_rects(self) -> List[QRectF]:
+        """
+        Get the match rects as QRectFs, building them on first use.
+
+        Returns:
+            List of match rectangles in local coordinates
+        """
+        if self._rects is None:
+            self._rects = [
+                QRectF(rx, ry, rw, rh)
+                for rx, ry, rw, rh in zip(
+                    self._hl_x.tolist(), self._hl_y.tolist(),
+                    self._hl_w.tolist(), self._hl_h.tolist()
+                )
+            ]
+        return self._rects
+
+    def _update_bounds(self):
+        """Recompute item bounds from the matches and the current match."""
+        bounds = self._match_bounds
+        current_rect = self._current_area
+        if current_rect is not None:
+            bounds = bounds.united(current_rect) if not bounds.isNull() else current_rect
+
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+
+    def boundingRect(self) -> QRectF:
+        """Return item bounds in local coordinates."""
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the matches intersecting the exposed area.
+
+        Args:
+            painter: Active QPainter
+            option: Style option carrying the exposed rectangle
+            widget: Widget being painted on
+        """
+        exposed = option.exposedRect
+        current_rect = self._current_area
+
+        # Fast path: nothing overlaid, nothing to set up
+        if not self._hl_x.size and current_rect is None:
+            return
+
+        # Only run the vectorized cull when the exposed area reaches any match
+        # (e.g. repaints of just the current match skip it)
+        if self._match_bounds.intersects(exposed):
+            # Cull against the exposed area, all matches at once
+            x, y, w, h = self._hl_x, self._hl_y, self._hl_w, self._hl_h
+            mask = (
+                (x + w >= exposed.left()) & (x <= exposed.right())
+                & (y + h >= exposed.top()) & (y <= exposed.bottom())
+            )
+            visible = np.flatnonzero(mask).tolist()
+        else:
+            visible = []
+
+        if visible:
+            # Style: Yellow with 50% opacity for search highlights
+            painter.setBrush(self._MATCH_BRUSH)
+            painter.setPen(self._MATCH_PEN)
+
+            # Draw the rects of the visible matches in one call
+            rects = self._draw_rects()
+            if len(visible) == len(rects):
+                painter.drawRects(rects)
+            else:
+                painter.drawRects([rects[i] for i in visible])
+
+        # Current match on top (orange for emphasis)
+        if current_rect is not None and current_rect.intersects(exposed):
+            painter.setBrush(self._CURRENT_BRUSH)
+            painter.setPen(self._CURRENT_PEN)
+            painter.drawRect(current_rect.adjusted(2, 2, -2, -2))
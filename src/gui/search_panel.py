@@ -6,109 +6,289 @@ Provides advanced search functionality with results display and navigation.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QListWidget, QLabel, QCheckBox, QComboBox, QProgressBar,
-    QListWidgetItem, QFrame
+    QListView, QLabel, QCheckBox, QProgressBar, QFrame,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QSize, QRect
+from PySide6.QtGui import QFont, QFontMetrics, QColor, QBrush, QPalette, QKeySequence, QShortcut
 
-from utils.constants import Icons, Spacing
+from utils.constants import Spacing
 from utils.icon_manager import get_icon
 
 
-class SearchResultItem(QWidget):
+class SearchResultsModel(QAbstractListModel):
     """
-    Custom widget for displaying a search result.
+    List model holding search results for the results view.
     
-    Shows page number, matched text, and context snippet.
+    Row texts are formatted on first request and cached, so only rows the
+    view actually shows pay the formatting cost instead of the whole set.
+    Each row is kept as (page label, context before, match, context after)
+    so the delegate can emphasize the label and the match.
     """
     
-    clicked = Signal(int, tuple)  # page_num, bbox
+    # Row text split into (page label, before, match, after)
+    PartsRole = Qt.UserRole + 1
     
-    def __init__(self, page_num: int, text: str, context: str, bbox: tuple, parent=None):
+    # Longer contexts are shortened in the middle for display (the full
+    # context stays in the result for export)
+    MAX_CONTEXT_CHARS = 160
+    
+    def __init__(self, parent=None):
         """
-        Initialize search result item.
+        Initialize empty results model.
         
         Args:
-            page_num: Page number (0-indexed)
-            text: Matched text
-            context: Context snippet
-            bbox: Bounding box (x0, y0, x1, y1)
-            parent: Parent widget
+            parent: Parent object
         """
         super().__init__(parent)
         
-        self._page_num = page_num
-        self._bbox = bbox
+        self._results = []  # Search result dictionaries
+        self._parts = []  # Row text parts per row (None: not formatted yet)
+        self._row_size = QSize()  # Shared size hint for every row (invalid: measure)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return number of results (flat list, so none under valid parents)."""
+        return 0 if parent.isValid() else len(self._parts)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return data for a result row.
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(4)
+        Args:
+            index: Model index of the row
+            role: Item data role
+            
+        Returns:
+            Row text for DisplayRole, its parts for PartsRole,
+            (page_num, bbox) for UserRole, else None
+        """
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole or role == self.PartsRole:
+            row = index.row()
+            parts = self._parts[row]
+            if parts is None:
+                parts = self._parts[row] = self._row_parts(self._results[row])
+            return parts if role == self.PartsRole else "".join(parts)
+        if role == Qt.UserRole:
+            result = self._results[index.row()]
+            return (result['page'], result['bbox'])
+        if role == Qt.SizeHintRole and self._row_size.isValid():
+            return self._row_size
+        return None
+    
+    def set_row_size(self, size: QSize):
+        """
+        Set the size hint returned for every row.
         
-        # Page number header
-        header_layout = QHBoxLayout()
+        Args:
+            size: Row size (an invalid size lets the delegate measure rows)
+        """
+        self._row_size = size
+    
+    def set_results(self, results: list):
+        """
+        Replace the rows with a new result set.
         
-        page_label = QLabel(f"📄 Page {page_num + 1}")
-        page_font = QFont()
-        page_font.setWeight(QFont.Weight.DemiBold)
-        page_font.setPointSize(10)
-        page_label.setFont(page_font)
-        page_label.setStyleSheet("color: #0066cc;")
-        header_layout.addWidget(page_label)
-        header_layout.addStretch()
+        Rows are updated in place: only the surplus or missing tail is
+        removed or inserted, and kept rows whose result changed are
+        reported with one dataChanged, so the view keeps its row layout
+        instead of rebuilding it after a full reset.
         
-        layout.addLayout(header_layout)
+        Args:
+            results: List of search result dictionaries
+        """
+        old_count = len(self._parts)
+        new_count = len(results)
+        
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._parts = self._parts[:new_count]
+            self._results = self._results[:new_count]
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._parts = self._parts + [None] * (new_count - old_count)
+            self._results = self._results + results[old_count:]
+            self.endInsertRows()
+        
+        # Rows kept from the previous set: find the span whose result changed
+        old_results = self._results
+        changed = [
+            row for row in range(min(old_count, new_count))
+            if old_results[row] != results[row]
+        ]
+        
+        self._parts = [None] * new_count
+        self._results = results
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+    
+    def append_results(self, results: list):
+        """
+        Add rows for more results after the existing ones.
+        
+        Args:
+            results: List of search result dictionaries
+        """
+        if not results:
+            return
         
-        # Context with highlighted match
-        context_label = QLabel(self._format_context(context))
-        context_label.setWordWrap(True)
-        context_label.setTextFormat(Qt.RichText)
-        context_label.setStyleSheet("color: #333; padding: 4px;")
-        layout.addWidget(context_label)
-        
-        # Make clickable
-        self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet("""
-            SearchResultItem {
-                background: white;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-            SearchResultItem:hover {
-                background: #f0f7ff;
-                border-color: #0066cc;
-            }
-        """)
-    
-    def _format_context(self, context: str) -> str:
-        """
-        Format context string with HTML highlighting.
+        count = len(self._parts)
+        self.beginInsertRows(QModelIndex(), count, count + len(results) - 1)
+        self._parts = self._parts + [None] * len(results)
+        self._results = self._results + results
+        self.endInsertRows()
+    
+    @classmethod
+    def _row_parts(cls, result: dict) -> tuple:
+        """
+        Split the display text of a result row around its match.
         
         Args:
-            context: Context string with **match** markers
+            result: Search result dictionary
             
         Returns:
-            HTML formatted string
+            (page label, context before, match, context after) with the
+            match markers removed, at most MAX_CONTEXT_CHARS of context long
+        """
+        before, marker, rest = result['context'].partition('**')
+        match, _, after = rest.partition('**')
+        if not marker:
+            match = after = ""
+        context = before + match + after.replace('**', '')
+        match_start = len(before)
+        match_end = match_start + len(match)
+        
+        start, end = 0, len(context)
+        if end > cls.MAX_CONTEXT_CHARS:
+            # Keep a window that starts shortly before the match
+            start = max(0, min(match_start - 40, end - cls.MAX_CONTEXT_CHARS))
+            end = start + cls.MAX_CONTEXT_CHARS
+        match_end = min(match_end, end)
+        
+        return (
+            f"Page {result['page'] + 1}: ",
+            ("…" if start > 0 else "") + context[start:match_start],
+            context[match_start:match_end],
+            context[match_end:end] + ("…" if end < len(context) else ""),
+        )
+
+
+class SearchResultDelegate(QStyledItemDelegate):
+    """
+    Paints result rows with the page label and the match emphasized.
+    
+    Rows are a single line: the context before the match is elided from
+    the left and the context after it from the right, so the match stays
+    in view however narrow the list is.
+    """
+    
+    # Match emphasis as in the page overlay: bold on yellow
+    _MATCH_BRUSH = QBrush(QColor(255, 235, 59))
+    _MATCH_TEXT_COLOR = QColor(51, 51, 51)
+    
+    def __init__(self, parent=None):
         """
-        # Replace **match** with HTML bold and yellow highlight
-        parts = context.split("**")
-        result = ""
+        Initialize delegate.
         
-        for i, part in enumerate(parts):
-            if i % 2 == 0:
-                # Regular text
-                result += part
-            else:
-                # Matched text - highlight in yellow
-                result += f'<span style="background-color: #ffeb3b; font-weight: bold; padding: 2px 4px; border-radius: 2px;">{part}</span>'
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
         
-        return result
+        self._font = None  # Font the bold variant below was derived from
+        self._bold_font = None
     
-    def mousePressEvent(self, event):
-        """Handle mouse click."""
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self._page_num, self._bbox)
-        super().mousePressEvent(event)
+    def _emphasis_font(self, font: QFont) -> QFont:
+        """
+        Get the bold variant of a row font (derived once per font).
+        
+        Args:
+            font: Row font
+            
+        Returns:
+            Bold copy of the font
+        """
+        if font != self._font:
+            self._font = QFont(font)
+            self._bold_font = QFont(font)
+            self._bold_font.setBold(True)
+        return self._bold_font
+    
+    def paint(self, painter, option, index):
+        """
+        Paint a result row.
+        
+        Args:
+            painter: Active QPainter
+            option: Style option of the row
+            index: Model index of the row
+        """
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, widget)
+        
+        # Background, hover and selection from the style; text drawn below
+        opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        
+        label, before, match, after = index.data(SearchResultsModel.PartsRole)
+        font = opt.font
+        bold_font = self._emphasis_font(font)
+        metrics = QFontMetrics(font)
+        bold_metrics = QFontMetrics(bold_font)
+        
+        # Fit label and match first, then as much context around them as fits
+        available = rect.width()
+        label_width = bold_metrics.horizontalAdvance(label)
+        match = bold_metrics.elidedText(match, Qt.ElideRight, max(available - label_width, 0))
+        match_width = bold_metrics.horizontalAdvance(match)
+        available -= label_width + match_width
+        before = metrics.elidedText(before, Qt.ElideLeft, max(available, 0))
+        before_width = metrics.horizontalAdvance(before)
+        after = metrics.elidedText(after, Qt.ElideRight, max(available - before_width, 0))
+        
+        if opt.state & QStyle.State_Selected:
+            text_color = label_color = opt.palette.color(QPalette.HighlightedText)
+        else:
+            text_color = opt.palette.color(QPalette.Text)
+            label_color = opt.palette.color(QPalette.Link)
+        
+        flags = Qt.AlignLeft | Qt.AlignVCenter | Qt.TextSingleLine
+        x = rect.left()
+        top = rect.top()
+        height = rect.height()
+        
+        painter.save()
+        painter.setFont(bold_font)
+        painter.setPen(label_color)
+        painter.drawText(QRect(x, top, label_width, height), flags, label)
+        x += label_width
+        
+        painter.setFont(font)
+        painter.setPen(text_color)
+        painter.drawText(QRect(x, top, before_width, height), flags, before)
+        x += before_width
+        
+        if match:
+            match_height = bold_metrics.height()
+            painter.fillRect(
+                QRect(x, top + (height - match_height) // 2, match_width, match_height),
+                self._MATCH_BRUSH
+            )
+            painter.setFont(bold_font)
+            painter.setPen(self._MATCH_TEXT_COLOR)
+            painter.drawText(QRect(x, top, match_width, height), flags, match)
+            x += match_width
+        
+        painter.setFont(font)
+        painter.setPen(text_color)
+        painter.drawText(QRect(x, top, rect.right() + 1 - x, height), flags, after)
+        painter.restore()
 
 
 class SearchPanel(QWidget):
@@ -134,7 +314,10 @@ class SearchPanel(QWidget):
         
         self._results = []  # List of search results
         self._current_index = -1  # Current result index
+        self._unique_pages = 0  # Pages with matches in the current results
         self._search_history = []  # Recent searches
+        self._search_term = ""  # Stripped input text, updated as it is edited
+        self._pending_search = None  # (term, options) requested, results not back yet
         
         self._create_ui()
     
@@ -144,6 +327,9 @@ class SearchPanel(QWidget):
         layout.setSpacing(Spacing.SMALL)
         layout.setContentsMargins(8, 8, 8, 8)
         
+        # Styles live in the application stylesheet (ThemeManager), keyed by
+        # object name, instead of one stylesheet parse per widget here
+        
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Search Document")
@@ -160,42 +346,18 @@ class SearchPanel(QWidget):
         input_layout = QHBoxLayout()
         
         self.search_input = QLineEdit()
+        self.search_input.setObjectName("search_input")
         self.search_input.setPlaceholderText("Enter search text...")
         self.search_input.returnPressed.connect(self._on_search_clicked)
         self.search_input.textChanged.connect(self._on_search_text_changed)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 6px 28px 6px 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border-color: #0066cc;
-            }
-        """)
         input_layout.addWidget(self.search_input)
         
         # History dropdown button with icon
         self.history_btn = QPushButton("🕐 ⏷")
+        self.history_btn.setObjectName("search_history_btn")
         self.history_btn.setFixedWidth(50)
         self.history_btn.setFixedHeight(28)
         self.history_btn.setToolTip("Search history")
-        self.history_btn.setStyleSheet("""
-            QPushButton {
-                background: #f0f0f0;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QPushButton:hover {
-                background: #e0e0e0;
-                border-color: #0066cc;
-            }
-            QPushButton:pressed {
-                background: #d0d0d0;
-            }
-        """)
         self.history_btn.clicked.connect(self._show_history_menu)
         input_layout.addWidget(self.history_btn)
         
@@ -223,27 +385,9 @@ class SearchPanel(QWidget):
         button_layout = QHBoxLayout()
         
         self.search_btn = QPushButton("Find All")
+        self.search_btn.setObjectName("search_find_btn")
         self.search_btn.setIcon(get_icon('search', 16))
         self.search_btn.clicked.connect(self._on_search_clicked)
-        self.search_btn.setStyleSheet("""
-            QPushButton {
-                background: #0066cc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #0052a3;
-            }
-            QPushButton:pressed {
-                background: #003d7a;
-            }
-            QPushButton:disabled {
-                background: #ccc;
-            }
-        """)
         button_layout.addWidget(self.search_btn)
         
         self.clear_btn = QPushButton("Clear")
@@ -275,40 +419,47 @@ class SearchPanel(QWidget):
         self.prev_btn.setEnabled(False)
         self.prev_btn.clicked.connect(self._on_previous_clicked)
         self.prev_btn.setFixedWidth(70)
+        self.prev_btn.setToolTip("Previous match (Shift+F3)")
         results_header_layout.addWidget(self.prev_btn)
         
         self.next_btn = QPushButton("Next ↓")
         self.next_btn.setEnabled(False)
         self.next_btn.clicked.connect(self._on_next_clicked)
         self.next_btn.setFixedWidth(70)
+        self.next_btn.setToolTip("Next match (F3)")
         results_header_layout.addWidget(self.next_btn)
         
         layout.addLayout(results_header_layout)
         
         # Results count and statistics
         self.results_count = QLabel("0 matches")
+        self.results_count.setObjectName("search_results_count")
         self.results_count.setProperty("secondary", True)
-        self.results_count.setStyleSheet("color: #666; font-size: 10pt;")
         layout.addWidget(self.results_count)
         
-        # Results list
-        self.results_list = QListWidget()
-        self.results_list.setSpacing(4)
-        self.results_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background: #fafafa;
-            }
-            QListWidget::item {
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }
-            QListWidget::item:selected {
-                background: transparent;
-            }
-        """)
+        # Results list (model/view: no widget per result)
+        self._results_model = SearchResultsModel(self)
+        self.results_list = QListView()
+        self.results_list.setObjectName("search_results_list")
+        self.results_list.setModel(self._results_model)
+        self.results_list.setItemDelegate(SearchResultDelegate(self.results_list))
+        self.results_list.setSpacing(2)
+        
+        # One line per result: long contexts are elided around the match
+        # (SearchResultDelegate) instead of wrapped, so every row really
+        # fits the shared height
+        self.results_list.setWordWrap(False)
+        
+        # All rows share one height (see _update_row_size), so the view
+        # lays out thousands of matches without measuring each row
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(100)
+        
+        # Scroll by pixels: with tall rows the view can blit the scrolled
+        # contents and paint only the strip that comes into view
+        self.results_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.results_list.clicked.connect(self._on_result_clicked)
         layout.addWidget(self.results_list)
         
         # Export buttons (bottom)
@@ -325,25 +476,45 @@ class SearchPanel(QWidget):
         export_layout.addWidget(self.export_csv_btn)
         
         layout.addLayout(export_layout)
+        
+        self._create_shortcuts()
+    
+    def _create_shortcuts(self):
+        """
+        Register search navigation shortcuts while the panel has focus.
+        
+        Find itself is the window-wide Edit > Find menu action, which
+        focuses the input through focus_search_input().
+        """
+        shortcuts = (
+            (QKeySequence.StandardKey.FindNext, self._on_next_clicked),
+            (QKeySequence.StandardKey.FindPrevious, self._on_previous_clicked),
+        )
+        for key, handler in shortcuts:
+            shortcut = QShortcut(key, self)
+            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(handler)
+    
+    def focus_search_input(self):
+        """Move focus to the search input and select its text."""
+        self.search_input.setFocus(Qt.ShortcutFocusReason)
+        self.search_input.selectAll()
     
     def _on_search_text_changed(self, text: str):
         """Handle search input text change."""
+        # Strip once per edit; searches reuse the result
+        self._search_term = text.strip()
+        
         # Enable/disable search button
-        self.search_btn.setEnabled(bool(text.strip()))
+        self.search_btn.setEnabled(bool(self._search_term))
     
     def _on_search_clicked(self):
         """Handle search button click."""
-        search_term = self.search_input.text().strip()
+        search_term = self._search_term
         
         if not search_term:
             return
         
-        # Add to history
-        if search_term not in self._search_history:
-            self._search_history.insert(0, search_term)
-            # Keep only last 10 searches
-            self._search_history = self._search_history[:10]
-        
         # Get options
         options = {
             'match_case': self.match_case_cb.isChecked(),
@@ -351,6 +522,20 @@ class SearchPanel(QWidget):
             'regex': self.regex_cb.isChecked()
         }
         
+        # Repeated triggers for the search that is still running
+        # (auto-repeated Enter, Enter followed by a Find All click) would
+        # only restart it
+        request = (search_term, options)
+        if request == self._pending_search:
+            return
+        self._pending_search = request
+        
+        # Add to history
+        if search_term not in self._search_history:
+            self._search_history.insert(0, search_term)
+            # Keep only last 10 searches
+            self._search_history = self._search_history[:10]
+        
         # Show progress
         self.progress_bar.show()
         self.progress_bar.setValue(0)
@@ -376,6 +561,16 @@ class SearchPanel(QWidget):
             self._current_index += 1
             self._select_result(self._current_index)
     
+    def _on_result_clicked(self, index: QModelIndex):
+        """
+        Handle click on a result row.
+        
+        Args:
+            index: Model index of the clicked row
+        """
+        self._current_index = index.row()
+        self._select_result(self._current_index)
+    
     def _select_result(self, index: int):
         """
         Select and navigate to a result.
@@ -387,7 +582,7 @@ class SearchPanel(QWidget):
             result = self._results[index]
             
             # Update list selection
-            self.results_list.setCurrentRow(index)
+            self.results_list.setCurrentIndex(self._results_model.index(index))
             
             # Update navigation buttons
             self.prev_btn.setEnabled(index > 0)
@@ -438,50 +633,44 @@ class SearchPanel(QWidget):
         """
         self._results = results
         self._current_index = 0 if results else -1
-        
-        # Clear existing results
-        self.results_list.clear()
-        
-        # Hide progress
-        self.progress_bar.hide()
-        
-        if not results:
-            # Show no results message
-            self.results_count.setText("No matches found")
-            self.prev_btn.setEnabled(False)
-            self.next_btn.setEnabled(False)
-            self.export_txt_btn.setEnabled(False)
-            self.export_csv_btn.setEnabled(False)
-            return
-        
-        # Add results to list
-        for result in results:
-            # Create custom widget for result
-            result_widget = SearchResultItem(
-                result['page'],
-                result['text'],
-                result['context'],
-                result['bbox']
-            )
-            result_widget.clicked.connect(lambda p, b: self.result_selected.emit(p, b))
+        self._pending_search = None
+        
+        # Counted once per result set, not on every Prev/Next
+        self._unique_pages = len({r['page'] for r in results})
+        
+        # Rebuild the panel with repaints frozen, so the list reset, labels
+        # and buttons below repaint once instead of one by one
+        self.setUpdatesEnabled(False)
+        try:
+            # Replace the list rows
+            self._update_row_size()
+            self._results_model.set_results(results)
             
-            # Add to list
-            item = QListWidgetItem(self.results_list)
-            item.setSizeHint(result_widget.sizeHint())
-            self.results_list.setItemWidget(item, result_widget)
-        
-        # Update count
-        self._update_results_count()
-        
-        # Enable navigation and export
-        self.prev_btn.setEnabled(False)
-        self.next_btn.setEnabled(len(results) > 1)
-        self.export_txt_btn.setEnabled(True)
-        self.export_csv_btn.setEnabled(True)
-        
-        # Select first result
-        if results:
+            # Hide progress
+            self.progress_bar.hide()
+            
+            # Export is available whenever there are results
+            self.export_txt_btn.setEnabled(bool(results))
+            self.export_csv_btn.setEnabled(bool(results))
+            
+            if not results:
+                # Show no results message
+                self.results_count.setText("No matches found")
+                self.prev_btn.setEnabled(False)
+                self.next_btn.setEnabled(False)
+                return
+            
+            # Select first result (also sets navigation buttons and count)
             self._select_result(0)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_row_size(self):
+        """Size result rows for one line of text plus item padding."""
+        # Measured here rather than at construction, once the application
+        # stylesheet has set the list's font
+        line_height = self.results_list.fontMetrics().lineSpacing()
+        self._results_model.set_row_size(QSize(0, line_height + 16))
     
     def _update_results_count(self):
         """Update results count label."""
@@ -490,8 +679,7 @@ class SearchPanel(QWidget):
         if total == 0:
             self.results_count.setText("No matches found")
         else:
-            # Count unique pages
-            unique_pages = len(set(r['page'] for r in self._results))
+            unique_pages = self._unique_pages
             
             if self._current_index >= 0:
                 self.results_count.setText(
@@ -506,15 +694,48 @@ class SearchPanel(QWidget):
     
     def clear_results(self):
         """Clear search results."""
+        self.begin_results()
+        self._pending_search = None
+        self.progress_bar.hide()
+    
+    def search_failed(self):
+        """Stop waiting for a search that ended without results."""
+        self._pending_search = None
+        self.progress_bar.hide()
+    
+    def begin_results(self):
+        """
+        Start an empty result set for a search that streams its matches.
+        
+        Rows then arrive through append_results() while the search runs;
+        display_results() completes the set when it finishes.
+        """
         self._results = []
         self._current_index = -1
-        self.results_list.clear()
+        self._unique_pages = 0
+        self._results_model.set_results([])
         self.results_count.setText("0 matches")
         self.prev_btn.setEnabled(False)
         self.next_btn.setEnabled(False)
         self.export_txt_btn.setEnabled(False)
         self.export_csv_btn.setEnabled(False)
-        self.progress_bar.hide()
+    
+    def append_results(self, results: list):
+        """
+        Show more matches of a running search.
+        
+        Args:
+            results: Matches found since the previous call
+        """
+        if not results:
+            return
+        
+        self._results = self._results + results
+        self._results_model.append_results(results)
+        
+        # A page's matches never span two batches, so page counts just add up
+        self._unique_pages += len({r['page'] for r in results})
+        self._update_results_count()
     
     def set_progress(self, value: int):
         """
@@ -4,7 +4,7 @@ Background search worker thread.
 Performs PDF text search in background to keep UI responsive.
 """
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, Signal, QElapsedTimer
 
 
 class SearchWorker(QThread):
@@ -17,9 +17,12 @@ class SearchWorker(QThread):
     
     # Signals
     progress_updated = Signal(int, int)  # current_page, total_pages
+    results_found = Signal(list)  # matches found since the previous emit
     results_ready = Signal(list)  # search results
     error_occurred = Signal(str)  # error message
     
+    PROGRESS_INTERVAL_MS = 33  # At most ~30 progress updates per second
+    
     def __init__(self, pdf_document, search_term: str, options: dict, parent=None):
         """
         Initialize search worker.
@@ -70,13 +73,28 @@ class SearchWorker(QThread):
         whole_words = self._options.get('whole_words', False)
         use_regex = self._options.get('regex', False)
         
+        progress_clock = QElapsedTimer()
+        progress_clock.start()
+        last_page = page_count - 1
+        reported = 0  # Results already sent through results_found
+        
         # Search each page
         for page_num in range(page_count):
             if self._cancelled:
                 break
             
-            # Emit progress
-            self.progress_updated.emit(page_num + 1, page_count)
+            # Emit progress (throttled: each emit wakes the GUI thread, and
+            # pages are often searched faster than the bar can repaint)
+            if (page_num == 0 or page_num == last_page
+                    or progress_clock.elapsed() >= self.PROGRESS_INTERVAL_MS):
+                progress_clock.restart()
+                self.progress_updated.emit(page_num + 1, page_count)
+                
+                # Stream matches found so far, so the first ones show up
+                # while later pages are still being searched
+                if len(results) > reported:
+                    self.results_found.emit(results[reported:])
+                    reported = len(results)
             
             # Get page
             page = self._pdf_document._doc[page_num]
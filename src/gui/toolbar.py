@@ -51,6 +51,102 @@ class Toolbar(QToolBar):
     # OCR signal
     quick_ocr_requested = Signal()
     
+    # Button styles, parsed once for the whole toolbar; buttons opt in through
+    # dynamic properties (ribbonTab, toolButton, toggle). Checked rules come
+    # before hover/pressed/disabled so those still take precedence.
+    TOOLBAR_QSS = """
+        QToolButton[ribbonTab="true"] {
+            background-color: #f0f0f0;
+            border: 1px solid #d0d0d0;
+            border-bottom: 3px solid #d0d0d0;
+            border-radius: 4px 4px 0px 0px;
+            padding: 6px 16px;
+            font-size: 12px;
+            font-weight: 600;
+            color: #606060;
+        }
+        QToolButton[ribbonTab="true"]:checked {
+            background-color: #ffffff;
+            border-bottom: 3px solid #0078d4;
+            color: #0078d4;
+        }
+        QToolButton[ribbonTab="true"]:hover {
+            background-color: #e8e8e8;
+            color: #0078d4;
+        }
+        QToolButton[toolButton="true"] {
+            background-color: #f8f8f8;
+            border: 1px solid #d0d0d0;
+            border-radius: 4px;
+            padding: 8px 12px;
+            font-size: 11px;
+            font-weight: 500;
+            color: #333333;
+        }
+        QToolButton[toggle="select"]:checked {
+            background-color: #0078d4;
+            border-color: #0078d4;
+            color: white;
+            font-weight: 600;
+        }
+        QToolButton[toggle="highlight"]:checked {
+            background-color: #FFB900;
+            border-color: #FFB900;
+            color: #333333;
+            font-weight: 600;
+        }
+        QToolButton[toolButton="true"]:hover {
+            background-color: #0078d4;
+            border-color: #0078d4;
+            color: white;
+        }
+        QToolButton[toggle="highlight"]:checked:hover {
+            background-color: #FFA500;
+            border-color: #FFA500;
+        }
+        QToolButton[toolButton="true"]:pressed {
+            background-color: #005a9e;
+            border-color: #005a9e;
+        }
+        QToolButton[toolButton="true"]:disabled {
+            background-color: #f0f0f0;
+            color: #a0a0a0;
+            border-color: #e0e0e0;
+        }
+    """
+    
+    # Tool button icons (button text -> icon name)
+    TOOL_ICONS = {
+        'Open': 'file_open',
+        'Save': 'save',
+        'Print': 'print',
+        'Zoom In': 'zoom_in',
+        'Zoom Out': 'zoom_out',
+        'Fit Page': 'zoom_out',
+        'Rotate': 'rotate',
+        'Undo': 'undo',
+        'Redo': 'redo',
+        'Cut': 'cut',
+        'Copy': 'copy',
+        'Paste': 'paste',
+        'Select All': 'select_all',
+        'Delete': 'delete',
+        'Underline': 'highlight',
+        'Strikeout': 'highlight',
+        'Comment': 'comment',
+        'Note': 'note',
+        'Insert': 'pages',
+        'Extract': 'pages',
+        'Crop': 'pages',
+        'Reorder': 'pages',
+        'To Word': 'save',
+        'To Excel': 'save',
+        'To Image': 'save',
+        'From Word': 'file_open',
+        'From Image': 'file_open',
+        'Scan Text': 'search',
+    }
+    
     def __init__(self, parent=None):
         """
         Initialize toolbar.
@@ -63,11 +159,18 @@ class Toolbar(QToolBar):
         self.setMovable(False)
         self.setFloatable(False)
         self.setIconSize(self.iconSize() * 1.2)  # Slightly larger icons
+        self.setStyleSheet(self.TOOLBAR_QSS)
         
         self._document_actions = []
+        self._document_actions_enabled = None  # Last state applied to _document_actions
         self._current_tab = "Home"
         self._select_text_button = None  # Reference to select text toggle button
         
+        # Shared by every group title label
+        self._group_title_font = QFont()
+        self._group_title_font.setPointSize(Fonts.SIZE_SMALL)
+        self._group_title_font.setWeight(QFont.Weight.DemiBold)
+        
         self._create_toolbar()
     
     def _create_toolbar(self):
@@ -135,29 +238,7 @@ class Toolbar(QToolBar):
             btn.setMinimumWidth(80)
             btn.setMinimumHeight(32)
             btn.clicked.connect(lambda checked, t=tab: self._switch_tab(t))
-            
-            # Apply professional tab button styling
-            btn.setStyleSheet("""
-                QToolButton {
-                    background-color: #f0f0f0;
-                    border: 1px solid #d0d0d0;
-                    border-bottom: 3px solid #d0d0d0;
-                    border-radius: 4px 4px 0px 0px;
-                    padding: 6px 16px;
-                    font-size: 12px;
-                    font-weight: 600;
-                    color: #606060;
-                }
-                QToolButton:checked {
-                    background-color: #ffffff;
-                    border-bottom: 3px solid #0078d4;
-                    color: #0078d4;
-                }
-                QToolButton:hover {
-                    background-color: #e8e8e8;
-                    color: #0078d4;
-                }
-            """)
+            btn.setProperty("ribbonTab", True)  # Styled by TOOLBAR_QSS
             
             if tab == "Home":
                 btn.setChecked(True)
@@ -167,6 +248,21 @@ class Toolbar(QToolBar):
         
         return widget
     
+    def _create_group_title(self, title: str) -> QLabel:
+        """
+        Create a centered tool group title label.
+        
+        Args:
+            title: Group title
+            
+        Returns:
+            Title label using the shared group title font
+        """
+        title_label = QLabel(title)
+        title_label.setFont(self._group_title_font)
+        title_label.setAlignment(Qt.AlignCenter)
+        return title_label
+    
     def _create_separator(self) -> QWidget:
         """
         Create vertical separator.
@@ -278,13 +374,7 @@ class Toolbar(QToolBar):
         layout.setSpacing(2)
         
         # Group title
-        title_label = QLabel("Mode")
-        title_font = QFont()
-        title_font.setPointSize(Fonts.SIZE_SMALL)
-        title_font.setWeight(QFont.Weight.DemiBold)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        layout.addWidget(self._create_group_title("Mode"))
         
         # Select Text toggle button with professional styling
         self._select_text_button = QToolButton()
@@ -302,39 +392,8 @@ class Toolbar(QToolBar):
         self._select_text_button.setMinimumWidth(85)
         self._select_text_button.setMinimumHeight(40)
         self._select_text_button.toggled.connect(self.select_text_toggled.emit)
-        
-        # Apply toggle button styling
-        self._select_text_button.setStyleSheet("""
-            QToolButton {
-                background-color: #f8f8f8;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 11px;
-                font-weight: 500;
-                color: #333333;
-            }
-            QToolButton:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-                color: white;
-                font-weight: 600;
-            }
-            QToolButton:hover {
-                background-color: #0078d4;
-                border-color: #0078d4;
-                color: white;
-            }
-            QToolButton:pressed {
-                background-color: #005a9e;
-                border-color: #005a9e;
-            }
-            QToolButton:disabled {
-                background-color: #f0f0f0;
-                color: #a0a0a0;
-                border-color: #e0e0e0;
-            }
-        """)
+        self._select_text_button.setProperty("toolButton", True)
+        self._select_text_button.setProperty("toggle", "select")
         
         # Add to document actions
         self._document_actions.append(self._select_text_button)
@@ -392,13 +451,7 @@ class Toolbar(QToolBar):
         layout.setSpacing(2)
         
         # Group title
-        title_label = QLabel("Highlight")
-        title_font = QFont()
-        title_font.setPointSize(Fonts.SIZE_SMALL)
-        title_font.setWeight(QFont.Weight.DemiBold)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        layout.addWidget(self._create_group_title("Highlight"))
         
         # Container for button and colors
         content_layout = QHBoxLayout()
@@ -420,43 +473,8 @@ class Toolbar(QToolBar):
         self._highlight_button.setMinimumWidth(75)
         self._highlight_button.setMinimumHeight(40)
         self._highlight_button.toggled.connect(self._on_highlight_toggled)
-        
-        # Apply professional toggle button styling
-        self._highlight_button.setStyleSheet("""
-            QToolButton {
-                background-color: #f8f8f8;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 11px;
-                font-weight: 500;
-                color: #333333;
-            }
-            QToolButton:checked {
-                background-color: #FFB900;
-                border-color: #FFB900;
-                color: #333333;
-                font-weight: 600;
-            }
-            QToolButton:hover {
-                background-color: #0078d4;
-                border-color: #0078d4;
-                color: white;
-            }
-            QToolButton:checked:hover {
-                background-color: #FFA500;
-                border-color: #FFA500;
-            }
-            QToolButton:pressed {
-                background-color: #005a9e;
-                border-color: #005a9e;
-            }
-            QToolButton:disabled {
-                background-color: #f0f0f0;
-                color: #a0a0a0;
-                border-color: #e0e0e0;
-            }
-        """)
+        self._highlight_button.setProperty("toolButton", True)
+        self._highlight_button.setProperty("toggle", "highlight")
         
         self._document_actions.append(self._highlight_button)
         content_layout.addWidget(self._highlight_button)
@@ -641,13 +659,7 @@ class Toolbar(QToolBar):
         layout.setSpacing(2)
         
         # Group title
-        title_label = QLabel("OCR")
-        title_font = QFont()
-        title_font.setPointSize(Fonts.SIZE_SMALL)
-        title_font.setWeight(QFont.Weight.DemiBold)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        layout.addWidget(self._create_group_title("OCR"))
         
         # OCR button
         ocr_btn = QToolButton()
@@ -660,33 +672,7 @@ class Toolbar(QToolBar):
         ocr_btn.setMinimumWidth(90)
         ocr_btn.setMinimumHeight(40)
         ocr_btn.clicked.connect(self.quick_ocr_requested.emit)
-        
-        # Apply professional button styling
-        ocr_btn.setStyleSheet("""
-            QToolButton {
-                background-color: #f8f8f8;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 11px;
-                font-weight: 500;
-                color: #333333;
-            }
-            QToolButton:hover {
-                background-color: #0078d4;
-                border-color: #0078d4;
-                color: white;
-            }
-            QToolButton:pressed {
-                background-color: #005a9e;
-                border-color: #005a9e;
-            }
-            QToolButton:disabled {
-                background-color: #f0f0f0;
-                color: #a0a0a0;
-                border-color: #e0e0e0;
-            }
-        """)
+        ocr_btn.setProperty("toolButton", True)  # Styled by TOOLBAR_QSS
         
         self._document_actions.append(ocr_btn)
         layout.addWidget(ocr_btn)
@@ -710,56 +696,18 @@ class Toolbar(QToolBar):
         layout.setSpacing(2)
         
         # Group title
-        title_label = QLabel(title)
-        title_font = QFont()
-        title_font.setPointSize(Fonts.SIZE_SMALL)
-        title_font.setWeight(QFont.Weight.DemiBold)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        layout.addWidget(self._create_group_title(title))
         
         # Tool buttons
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(Spacing.SMALL)
         
-        # Icon name mapping (button text -> icon name)
-        icon_mapping = {
-            'Open': 'file_open',
-            'Save': 'save',
-            'Print': 'print',
-            'Zoom In': 'zoom_in',
-            'Zoom Out': 'zoom_out',
-            'Fit Page': 'zoom_out',
-            'Rotate': 'rotate',
-            'Undo': 'undo',
-            'Redo': 'redo',
-            'Cut': 'cut',
-            'Copy': 'copy',
-            'Paste': 'paste',
-            'Select All': 'select_all',
-            'Delete': 'delete',
-            'Underline': 'highlight',
-            'Strikeout': 'highlight',
-            'Comment': 'comment',
-            'Note': 'note',
-            'Insert': 'pages',
-            'Extract': 'pages',
-            'Crop': 'pages',
-            'Reorder': 'pages',
-            'To Word': 'save',
-            'To Excel': 'save',
-            'To Image': 'save',
-            'From Word': 'file_open',
-            'From Image': 'file_open',
-            'Scan Text': 'search',
-        }
-        
         for text, tooltip, callback, is_doc_action in tools:
             btn = QToolButton()
             btn.setText(text)
             
             # Add SVG icon if available
-            icon_name = icon_mapping.get(text)
+            icon_name = self.TOOL_ICONS.get(text)
             if icon_name:
                 icon = get_icon(icon_name, 20)
                 btn.setIcon(icon)
@@ -773,33 +721,7 @@ class Toolbar(QToolBar):
             btn.setMinimumWidth(70)
             btn.setMinimumHeight(40)
             btn.clicked.connect(callback)
-            
-            # Apply professional button styling
-            btn.setStyleSheet("""
-                QToolButton {
-                    background-color: #f8f8f8;
-                    border: 1px solid #d0d0d0;
-                    border-radius: 4px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                    font-weight: 500;
-                    color: #333333;
-                }
-                QToolButton:hover {
-                    background-color: #0078d4;
-                    border-color: #0078d4;
-                    color: white;
-                }
-                QToolButton:pressed {
-                    background-color: #005a9e;
-                    border-color: #005a9e;
-                }
-                QToolButton:disabled {
-                    background-color: #f0f0f0;
-                    color: #a0a0a0;
-                    border-color: #e0e0e0;
-                }
-            """)
+            btn.setProperty("toolButton", True)  # Styled by TOOLBAR_QSS
             
             if is_doc_action:
                 self._document_actions.append(btn)
@@ -852,6 +774,11 @@ class Toolbar(QToolBar):
         Args:
             enabled: Whether to enable actions
         """
+        # Called on every window state update; skip when nothing changes
+        if enabled == self._document_actions_enabled:
+            return
+        self._document_actions_enabled = enabled
+        
         for action in self._document_actions:
             action.setEnabled(enabled)
     
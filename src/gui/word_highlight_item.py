@@ -0,0 +1,99 @@
+"""
+Text selection highlight for a single PDF page.
+
+Paints all selected word boxes of one page from a single graphics item
+instead of adding one rectangle item per word to the scene.
+"""
+
+import numpy as np
+from PySide6.QtWidgets import QGraphicsItem
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QBrush
+
+
+class WordHighlightItem(QGraphicsItem):
+    """
+    Overlay item drawing the selected words of one page.
+
+    All word rectangles share one brush and no pen, so they are drawn
+    with a single drawRects call per paint. Word boxes are also kept as
+    contiguous x0/y0/x1/y1 columns so only the words inside the exposed
+    area are drawn, found with one vectorized test. The painted result is
+    cached by Qt as a device pixmap, so later repaints of the same area
+    (scrolling, search or selection updates on top) blit it instead of
+    redrawing the words.
+    """
+
+    _WORD_BRUSH = QBrush(QColor(255, 255, 0, 102))  # Yellow with 40% alpha
+
+    def __init__(self, boxes: np.ndarray, parent=None):
+        """
+        Initialize word highlight overlay.
+
+        Args:
+            boxes: (N, 4) array of (x0, y0, x1, y1) in scene coordinates
+            parent: Parent graphics item
+        """
+        super().__init__(parent)
+
+        # (N, 4) rows -> four contiguous columns for culling
+        x0, y0, x1, y1 = np.asarray(boxes, dtype=np.float64).reshape(-1, 4).T.copy()
+        self._x0 = x0
+        self._y0 = y0
+        self._x1 = x1
+        self._y1 = y1
+        self._rects = [
+            QRectF(rx, ry, rw, rh)
+            for rx, ry, rw, rh in zip(
+                x0.tolist(), y0.tolist(), (x1 - x0).tolist(), (y1 - y0).tolist()
+            )
+        ]
+
+        # Bounds from column extremes instead of uniting every rect
+        if len(x0):
+            left = float(x0.min())
+            top = float(y0.min())
+            self._bounds = QRectF(left, top, float(x1.max()) - left, float(y1.max()) - top)
+        else:
+            self._bounds = QRectF()
+
+        # Needed so paint() receives the exposed rectangle
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+        # Keep the painted overlay in a pixmap; the words never change
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+        # Stay above page pixmaps that are added later by lazy rendering
+        self.setZValue(1)
+
+    def boundingRect(self) -> QRectF:
+        """Return item bounds in local coordinates."""
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the word rectangles intersecting the exposed area in one batch.
+
+        Args:
+            painter: Active QPainter
+            option: Style option carrying the exposed rectangle
+            widget: Widget being painted on
+        """
+        rects = self._rects
+        exposed = option.exposedRect
+
+        # Cull against the exposed area unless the whole overlay is exposed
+        if not exposed.contains(self._bounds):
+            mask = (
+                (self._x1 >= exposed.left()) & (self._x0 <= exposed.right())
+                & (self._y1 >= exposed.top()) & (self._y0 <= exposed.bottom())
+            )
+            visible = np.flatnonzero(mask).tolist()
+            if not visible:
+                return
+            if len(visible) < len(rects):
+                rects = [rects[i] for i in visible]
+
+        painter.setBrush(self._WORD_BRUSH)
+        painter.setPen(Qt.NoPen)
+        painter.drawRects(rects)
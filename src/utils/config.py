@@ -170,6 +170,24 @@ class Config:
         """
         self.settings.setValue("view/mode", mode)
     
+    def get_opengl_viewport(self) -> bool:
+        """
+        Get whether the page view uses an OpenGL viewport.
+        
+        Returns:
+            True to composite pages on the GPU, False for the raster engine
+        """
+        return self.settings.value("view/opengl_viewport", False, bool)
+    
+    def set_opengl_viewport(self, enabled: bool) -> None:
+        """
+        Save OpenGL viewport preference (applies to newly created views).
+        
+        Args:
+            enabled: Enable/disable the OpenGL viewport
+        """
+        self.settings.setValue("view/opengl_viewport", enabled)
+    
     # Sidebar preferences
     def get_left_sidebar_visible(self) -> bool:
         """
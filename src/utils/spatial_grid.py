@@ -0,0 +1,114 @@
+"""
+Uniform grid spatial index.
+
+Buckets axis-aligned rectangles into fixed-size cells so point and region
+lookups only visit the rectangles near the query instead of all of them.
+"""
+
+import math
+from collections import defaultdict
+from typing import List, Tuple
+
+
+class SpatialGrid:
+    """
+    Uniform grid index over axis-aligned rectangles.
+
+    Each rectangle is stored in every cell it overlaps, so a query only
+    has to look at the cells covered by the query area. Rectangles spanning
+    more than MAX_CELLS_PER_RECT cells (e.g. full-page images) go to a
+    separate list every query checks instead. Coordinates are whatever unit
+    the caller uses (PDF points for page content).
+    """
+
+    MAX_CELLS_PER_RECT = 16
+
+    # One grid exists per indexed page; slots avoid a per-instance __dict__
+    __slots__ = ('_cell_size', '_cells', '_large', '_rects')
+
+    def __init__(self, cell_size: float = 128.0):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width and height of a grid cell
+        """
+        self._cell_size = cell_size
+        self._cells = defaultdict(list)  # (cell_x, cell_y) -> [rect index, ...]
+        self._large: List[int] = []  # Indices of rects too big to bucket
+        self._rects: List[Tuple[float, float, float, float]] = []
+
+    def insert(self, x0: float, y0: float, x1: float, y1: float) -> int:
+        """
+        Add a rectangle to the index.
+
+        Rectangles with non-finite corners (malformed PDFs) keep their index
+        but are not bucketed, so queries never return them.
+
+        Args:
+            x0, y0, x1, y1: Rectangle corners
+
+        Returns:
+            Index of the rectangle (insertion order)
+        """
+        index = len(self._rects)
+        self._rects.append((x0, y0, x1, y1))
+
+        if not all(map(math.isfinite, (x0, y0, x1, y1))):
+            return index
+
+        cell = self._cell_size
+        cx0, cx1 = int(x0 // cell), int(x1 // cell)
+        cy0, cy1 = int(y0 // cell), int(y1 // cell)
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.MAX_CELLS_PER_RECT:
+            self._large.append(index)
+            return index
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self._cells[(cx, cy)].append(index)
+
+        return index
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[int]:
+        """
+        Find rectangles intersecting an area.
+
+        Args:
+            x0, y0, x1, y1: Query area corners
+
+        Returns:
+            Sorted list of rectangle indices (insertion order)
+        """
+        if not self._rects:
+            return []
+
+        cell = self._cell_size
+        cells = self._cells
+        candidates = set(self._large)
+
+        for cx in range(int(x0 // cell), int(x1 // cell) + 1):
+            for cy in range(int(y0 // cell), int(y1 // cell) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+
+        rects = self._rects
+        return sorted(
+            i for i in candidates
+            if rects[i][0] <= x1 and rects[i][2] >= x0
+            and rects[i][1] <= y1 and rects[i][3] >= y0
+        )
+
+    def query_point(self, x: float, y: float) -> List[int]:
+        """
+        Find rectangles containing a point.
+
+        Args:
+            x, y: Point coordinates
+
+        Returns:
+            Sorted list of rectangle indices (insertion order)
+        """
+        return self.query_rect(x, y, x, y)
@@ -23,6 +23,7 @@ class ThemeManager:
         """Initialize theme manager with default theme."""
         self._current_theme = 'light'
         self._colors = Colors.LIGHT
+        self._stylesheets: Dict[str, str] = {}  # theme name: generated stylesheet
     
     def get_current_theme(self) -> str:
         """
@@ -50,9 +51,15 @@ class ThemeManager:
         Args:
             app: QApplication instance
         """
-        # Generate and apply stylesheet
-        stylesheet = self._generate_stylesheet()
-        app.setStyleSheet(stylesheet)
+        # Generate the stylesheet once per theme (colors are fixed at runtime)
+        stylesheet = self._stylesheets.get(self._current_theme)
+        if stylesheet is None:
+            stylesheet = self._generate_stylesheet()
+            self._stylesheets[self._current_theme] = stylesheet
+        
+        # Re-applying an identical stylesheet would still re-polish every widget
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
         
         # Set application palette
         palette = self._generate_palette()
@@ -465,6 +472,62 @@ class ThemeManager:
             color: #FFFFFF;
         }}
         
+        /* ===== Search Panel ===== */
+        QLineEdit#search_input {{
+            padding: 6px 28px 6px 8px;
+            border: 2px solid {c['border']};
+            border-radius: 4px;
+            font-size: {Fonts.SIZE_NORMAL}pt;
+        }}
+        
+        QLineEdit#search_input:focus {{
+            border-color: {c['primary']};
+        }}
+        
+        QPushButton#search_history_btn {{
+            background-color: {c['surface']};
+            color: {c['text_primary']};
+            border: 1px solid {c['border']};
+            padding: {Spacing.MICRO}px;
+        }}
+        
+        QPushButton#search_history_btn:hover {{
+            background-color: {c['hover']};
+            border-color: {c['primary']};
+        }}
+        
+        QPushButton#search_history_btn:pressed {{
+            background-color: {c['active']};
+        }}
+        
+        QPushButton#search_find_btn {{
+            padding: {Spacing.SMALL}px {Spacing.MEDIUM}px;
+        }}
+        
+        QLabel#search_results_count {{
+            font-size: {Fonts.SIZE_SMALL}pt;
+        }}
+        
+        QListView#search_results_list {{
+            background-color: {c['surface']};
+            border: 1px solid {c['border']};
+            border-radius: 4px;
+        }}
+        
+        QListView#search_results_list::item {{
+            padding: 6px;
+            border-bottom: 1px solid {c['divider']};
+        }}
+        
+        QListView#search_results_list::item:hover {{
+            background-color: {c['hover']};
+        }}
+        
+        QListView#search_results_list::item:selected {{
+            background-color: {c['primary']};
+            color: #FFFFFF;
+        }}
+        
         /* ===== Tree Widget ===== */
         QTreeWidget {{
             background-color: {c['background']};
@@ -485,6 +548,44 @@ class ThemeManager:
             color: #FFFFFF;
         }}
         
+        /* ===== Bookmarks ===== */
+        QTreeView#bookmark_tree {{
+            background-color: {c['background']};
+            border: 1px solid {c['border']};
+            border-radius: 4px;
+            outline: 0;
+        }}
+        
+        QTreeView#bookmark_tree::item {{
+            padding: {Spacing.MICRO}px;
+        }}
+        
+        QTreeView#bookmark_tree::item:hover {{
+            background-color: {c['hover']};
+        }}
+        
+        QTreeView#bookmark_tree::item:selected {{
+            background-color: {c['primary']};
+            color: #FFFFFF;
+        }}
+        
+        QTreeView#bookmark_tree::branch:has-children:closed,
+        QTreeView#bookmark_tree::branch:has-children:open {{
+            border-image: none;
+            image: none;
+        }}
+        
+        QLineEdit#bookmark_search_input {{
+            padding: 4px 24px 4px 4px;
+            min-height: 24px;
+        }}
+        
+        QLineEdit#bookmark_search_input QToolButton {{
+            border: none;
+            padding: 2px;
+            margin-right: 2px;
+        }}
+        
         /* ===== Splitter ===== */
         QSplitter::handle {{
             background-color: {c['border']};
@@ -0,0 +1,147 @@
+"""
+BookmarkTreeModel tests.
+
+Builds the model from nested bookmark dictionaries as returned by
+PDFDocument.get_bookmarks().
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from gui.bookmark_tree_widget import BookmarkTreeModel
+
+
+def bookmark(title: str, page: int, level: int, children=()) -> dict:
+    """Build a bookmark dictionary."""
+    return {'level': level, 'title': title, 'page': page, 'top': 0.0, 'children': list(children)}
+
+
+BOOKMARKS = [
+    bookmark("Introduction", 0, 1, [
+        bookmark("Scope", 1, 2),
+        bookmark("Terms", 2, 2, [bookmark("Glossary", 2, 3)]),
+    ]),
+    bookmark("Methods", 3, 1, [bookmark("Setup", 4, 2)]),
+    bookmark("Appendix", 5, 1),
+]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Return the shared QApplication."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model(app):
+    """Return a model holding BOOKMARKS."""
+    model = BookmarkTreeModel()
+    model.set_bookmarks(BOOKMARKS)
+    return model
+
+
+def test_nodes_are_in_tree_order(model):
+    """Nested bookmarks are flattened in preorder (document order)."""
+    assert model.titles() == [
+        "Introduction", "Scope", "Terms", "Glossary", "Methods", "Setup", "Appendix"
+    ]
+    assert model.node_count() == 7
+    assert model.rowCount() == 3
+
+
+def test_find_page_returns_first_bookmark_in_tree_order(model):
+    """Pages with several bookmarks resolve to the first one."""
+    assert model.find_page(2) == model.titles().index("Terms")
+    assert model.find_page(5) == model.titles().index("Appendix")
+    assert model.find_page(9) == -1
+
+
+def test_node_index_round_trips_through_parent(model):
+    """A node's index points back at its parent bookmark."""
+    glossary = model.titles().index("Glossary")
+    index = model.node_index(glossary)
+    assert index.data() == "📄 Glossary"
+    assert model.parent(index).data() == "📁 Terms"
+    assert model.parent(model.parent(index)).data() == "📁 Introduction"
+    assert not model.parent(model.parent(model.parent(index))).isValid()
+
+
+def test_match_nodes_marks_matches_and_their_ancestors(model):
+    """Matches are flagged per node and every ancestor of a match is marked."""
+    titles = model.titles()
+    matches, has_matching_children = model.match_nodes("gloss")
+
+    assert [titles[node] for node, hit in enumerate(matches) if hit] == ["Glossary"]
+    assert [titles[node] for node, hit in enumerate(has_matching_children) if hit] == [
+        "Introduction", "Terms"
+    ]
+
+
+def test_match_nodes_with_no_match(model):
+    """Text matching nothing flags no node."""
+    matches, has_matching_children = model.match_nodes("missing")
+    assert not any(matches)
+    assert not any(has_matching_children)
+
+
+def test_children_are_fetched_on_demand(model):
+    """Children reach the view only after fetchMore, in one insert per parent."""
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.data(), first, last)))
+    introduction = model.index(0, 0)
+
+    assert model.hasChildren(introduction)
+    assert model.rowCount(introduction) == 0
+    assert model.canFetchMore(introduction)
+    assert not model.in_view(model.titles().index("Scope"))
+
+    model.fetchMore(introduction)
+    assert inserted == [("📁 Introduction", 0, 1)]
+    assert model.rowCount(introduction) == 2
+    assert not model.canFetchMore(introduction)
+    assert model.in_view(model.titles().index("Scope"))
+
+    # A second fetch is a no-op; grandchildren wait for their own parent
+    model.fetchMore(introduction)
+    terms = model.index(1, 0, introduction)
+    assert len(inserted) == 1
+    assert model.rowCount(terms) == 0
+    assert model.canFetchMore(terms)
+
+
+def test_leaf_has_nothing_to_fetch(model):
+    """Bookmarks without children never ask to be fetched."""
+    appendix = model.index(2, 0)
+    assert not model.hasChildren(appendix)
+    assert not model.canFetchMore(appendix)
+
+
+def test_set_current_page_only_updates_rows_in_view(model):
+    """Rows not fetched yet get no dataChanged; they read the page when fetched."""
+    changed = []
+    model.dataChanged.connect(lambda top, bottom, roles=None: changed.append(top.data()))
+
+    model.set_current_page(3)  # Top-level "Methods"
+    assert changed == ["📁 Methods"]
+
+    changed.clear()
+    model.set_current_page(4)  # "Setup", not fetched yet
+    assert changed == ["📁 Methods"]
+
+    model.fetchMore(model.index(1, 0))
+    setup = model.index(0, 0, model.index(1, 0))
+    assert setup.data(Qt.BackgroundRole) is not None
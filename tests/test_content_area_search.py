@@ -0,0 +1,72 @@
+"""
+Search highlight tests for ContentArea.
+
+Checks that the current search match survives a page relayout (zoom).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+
+from core.pdf_document import PDFDocument
+from gui.content_area import ContentArea
+
+
+MATCH_BBOX = (70.0, 60.0, 120.0, 75.0)
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Return the shared QApplication."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def content_area(app, tmp_path):
+    """Return a ContentArea showing a small generated PDF."""
+    pdf_path = tmp_path / "search.pdf"
+    doc = fitz.open()
+    for _ in range(5):
+        page = doc.new_page()
+        page.insert_text((72, 72), "hello world")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    pdf_document = PDFDocument()
+    assert pdf_document.open(str(pdf_path))
+
+    area = ContentArea()
+    area.resize(600, 800)
+    area.set_pdf_document(pdf_document)
+    yield area
+
+    area.clear_content()
+    pdf_document.close()
+
+
+def test_current_match_survives_zoom(content_area):
+    """Zooming re-lays out pages but keeps the current match emphasized."""
+    results = [{'page': page_num, 'bbox': MATCH_BBOX} for page_num in range(5)]
+    content_area.highlight_search_results(results)
+    content_area.highlight_current_search_match(2, MATCH_BBOX)
+
+    # Zoom in (MainWindow sets the zoom level and re-renders)
+    content_area._pdf_document.zoom_level = 150
+    content_area.render_all_pages()
+
+    assert content_area._current_search_match == (2, MATCH_BBOX)
+    assert content_area._search_highlights[2]._current_area is not None
+    assert set(content_area._search_highlights) == set(range(5))
@@ -0,0 +1,104 @@
+"""
+Search result cache tests for MainWindow.
+
+Checks when a repeated search is served from the cache and when it scans
+the document again.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PySide6")
+
+# The main window pulls in the OCR stack
+pytest.importorskip("PIL")
+pytest.importorskip("cv2")
+pytest.importorskip("pikepdf")
+
+from PySide6.QtWidgets import QApplication
+
+from gui.main_window import MainWindow
+
+
+OPTIONS = {'match_case': False, 'whole_words': False, 'regex': False}
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Return the shared QApplication."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app, tmp_path):
+    """Return a MainWindow showing a small generated PDF."""
+    pdf_path = tmp_path / "search.pdf"
+    doc = fitz.open()
+    for _ in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), "hello world")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    window = MainWindow()
+    window._current_document = str(pdf_path)
+    assert window.pdf_document.open(str(pdf_path))
+    yield window
+
+    window.pdf_document.close()
+    window.deleteLater()
+
+
+def run_search(window, term: str):
+    """
+    Request a search and deliver its results.
+
+    Returns:
+        The SearchWorker started for it, or None if served from the cache
+    """
+    window._handle_search_requested(term, OPTIONS)
+    worker = window._search_worker
+    if worker is not None:
+        worker.wait()
+        QApplication.processEvents()  # Deliver the queued results
+    return worker
+
+
+def test_repeated_search_is_served_from_cache(window):
+    """The same term and options skip the scan the second time."""
+    assert run_search(window, "hello") is not None
+    assert run_search(window, "hello") is None
+    assert window.left_sidebar.search_panel._results_model.rowCount() == 3
+
+    # Other options are a different search
+    window._handle_search_requested("hello", dict(OPTIONS, match_case=True))
+    assert window._search_worker is not None
+    window._search_worker.wait()
+
+
+def test_page_edit_invalidates_cached_search(window):
+    """Results found before a page changed are not reused after it."""
+    run_search(window, "hello")
+    window.pdf_document.rotate_page(0, 90)
+
+    assert run_search(window, "hello") is not None
+    assert run_search(window, "hello") is None
+
+
+def test_document_load_clears_cached_searches(window):
+    """Reopening the document drops every cached search."""
+    run_search(window, "hello")
+    assert window._search_cache
+
+    assert window.pdf_document.open(window._current_document)
+    assert not window._search_cache
@@ -0,0 +1,110 @@
+"""
+SearchHighlightItem tests.
+
+Paints overlays onto an image to check which matches are drawn.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication, QStyleOptionGraphicsItem
+
+from gui.search_highlight_item import SearchHighlightItem
+
+
+MATCHES = [(0.0, 0.0, 10.0, 10.0), (100.0, 100.0, 110.0, 110.0)]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Return the shared QApplication."""
+    return QApplication.instance() or QApplication([])
+
+
+def paint(item, exposed: QRectF) -> QImage:
+    """Paint an item's exposed area onto a transparent image."""
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    option = QStyleOptionGraphicsItem()
+    option.exposedRect = exposed
+    painter = QPainter(image)
+    item.paint(painter, option)
+    painter.end()
+    return image
+
+
+def test_paint_culls_matches_outside_exposed_area(app):
+    """Only matches intersecting the exposed rectangle are drawn."""
+    item = SearchHighlightItem(zoom_factor=1.0)
+    item.set_highlights(MATCHES)
+
+    image = paint(item, QRectF(0, 0, 50, 50))
+    assert image.pixelColor(5, 5).alpha() > 0
+    assert image.pixelColor(105, 105).alpha() == 0
+
+    image = paint(item, QRectF(0, 0, 200, 200))
+    assert image.pixelColor(5, 5).alpha() > 0
+    assert image.pixelColor(105, 105).alpha() > 0
+
+
+def test_matches_are_scaled_by_zoom(app):
+    """Match rects are drawn at PDF coordinates times the zoom factor."""
+    item = SearchHighlightItem(zoom_factor=2.0)
+    item.set_highlights(MATCHES[:1])
+
+    assert item.boundingRect() == QRectF(0, 0, 20, 20).adjusted(-2, -2, 2, 2)
+    image = paint(item, QRectF(0, 0, 200, 200))
+    assert image.pixelColor(15, 15).alpha() > 0
+    assert image.pixelColor(30, 30).alpha() == 0
+
+
+def test_set_current_match_repaints_only_old_and_new_match(app):
+    """Moving the current match invalidates just the two match rectangles."""
+    item = SearchHighlightItem(zoom_factor=1.0)
+    item.set_highlights(MATCHES)
+    updates = []
+    item.update = lambda *args: updates.append(args)
+
+    item.set_current_match(MATCHES[0])
+    first = QRectF(0, 0, 10, 10).adjusted(-2, -2, 2, 2)
+    assert updates == [(first,)]
+
+    updates.clear()
+    item.set_current_match(MATCHES[1])
+    second = QRectF(100, 100, 10, 10).adjusted(-2, -2, 2, 2)
+    assert updates == [(first.united(second),)]
+
+    # Setting the same match again does not repaint
+    updates.clear()
+    item.set_current_match(MATCHES[1])
+    assert updates == []
+
+    item.set_current_match(None)
+    assert updates == [(second,)]
+    assert item._current_area is None
+
+
+def test_current_match_is_painted_on_top(app):
+    """The current match is painted orange over its yellow match fill."""
+    item = SearchHighlightItem(zoom_factor=1.0)
+    item.set_highlights(MATCHES)
+    item.set_current_match(MATCHES[1])
+
+    image = paint(item, QRectF(0, 0, 200, 200))
+    match = image.pixelColor(5, 5)
+    current = image.pixelColor(105, 105)
+    assert current.alpha() > match.alpha()
+    assert current.green() < match.green()
@@ -0,0 +1,104 @@
+"""
+SearchResultsModel tests.
+
+Checks the row change signals the results view receives.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+
+from gui.search_panel import SearchResultsModel
+
+
+def make_results(count: int, word: str = "match") -> list:
+    """Build search result dictionaries with one match per page."""
+    return [
+        {'page': page, 'bbox': (0.0, 0.0, 1.0, 1.0), 'text': word,
+         'context': f"before **{word}** after"}
+        for page in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Return the shared QApplication."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model(app):
+    """Return an empty model that records its change signals."""
+    model = SearchResultsModel()
+    model.events = []
+    model.rowsInserted.connect(lambda parent, first, last: model.events.append(('insert', first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: model.events.append(('remove', first, last)))
+    model.dataChanged.connect(
+        lambda top, bottom, roles=None: model.events.append(('changed', top.row(), bottom.row()))
+    )
+    model.modelReset.connect(lambda: model.events.append(('reset',)))
+    return model
+
+
+def test_set_results_inserts_only_new_rows(model):
+    """Growing the result set inserts the tail without touching kept rows."""
+    results = make_results(3)
+    model.set_results(results[:2])
+    model.events.clear()
+
+    model.set_results(results)
+    assert model.events == [('insert', 2, 2)]
+    assert model.rowCount() == 3
+
+
+def test_set_results_removes_surplus_and_reports_changed_rows(model):
+    """Shrinking removes the tail; kept rows whose result changed get one dataChanged."""
+    model.set_results(make_results(5))
+    model.events.clear()
+
+    results = make_results(3)
+    results[1] = dict(results[1], context="other **hit** here")
+    model.set_results(results)
+    assert model.events == [('remove', 3, 4), ('changed', 1, 1)]
+    assert model.data(model.index(1)) == "Page 2: other hit here"
+
+
+def test_set_results_with_same_rows_emits_nothing(model):
+    """Re-setting an equal result set leaves the view alone."""
+    model.set_results(make_results(4))
+    model.events.clear()
+
+    model.set_results(make_results(4))
+    assert model.events == []
+    assert model.rowCount() == 4
+
+
+def test_append_results_inserts_after_existing_rows(model):
+    """Streamed batches are inserted after the rows already shown."""
+    results = make_results(5)
+    model.set_results([])
+    model.events.clear()
+
+    model.append_results(results[:2])
+    model.append_results([])
+    model.append_results(results[2:])
+    assert model.events == [('insert', 0, 1), ('insert', 2, 4)]
+    assert model.rowCount() == 5
+    assert model.data(model.index(4)) == "Page 5: before match after"
+
+    # The finished set replaces the streamed rows without any change
+    model.events.clear()
+    model.set_results(results)
+    assert model.events == []
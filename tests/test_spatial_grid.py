@@ -0,0 +1,76 @@
+"""
+SpatialGrid tests.
+
+Checks that grid lookups return exactly the rectangles a linear scan would.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path so we can import the application packages
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.spatial_grid import SpatialGrid
+
+
+def linear_query(rects, x0, y0, x1, y1):
+    """Return indices of rects intersecting an area by scanning all of them."""
+    return [
+        i for i, (rx0, ry0, rx1, ry1) in enumerate(rects)
+        if rx0 <= x1 and rx1 >= x0 and ry0 <= y1 and ry1 >= y0
+    ]
+
+
+def test_query_matches_linear_scan():
+    """Grid queries agree with a linear scan, across cell boundaries too."""
+    rects = [
+        (10.0, 10.0, 50.0, 30.0),
+        (120.0, 100.0, 140.0, 140.0),  # Spans a cell boundary
+        (300.0, 300.0, 310.0, 310.0),
+        (0.0, 0.0, 256.0, 20.0),  # Spans three cells
+    ]
+    grid = SpatialGrid(cell_size=128.0)
+    for rect in rects:
+        grid.insert(*rect)
+
+    for area in [
+        (0.0, 0.0, 60.0, 60.0),
+        (125.0, 125.0, 135.0, 135.0),
+        (200.0, 0.0, 400.0, 400.0),
+        (500.0, 500.0, 600.0, 600.0),
+    ]:
+        assert grid.query_rect(*area) == linear_query(rects, *area)
+
+
+def test_query_point():
+    """A point query returns the rects containing the point, edges included."""
+    grid = SpatialGrid()
+    grid.insert(10.0, 10.0, 50.0, 30.0)
+    grid.insert(40.0, 20.0, 80.0, 60.0)
+
+    assert grid.query_point(45.0, 25.0) == [0, 1]
+    assert grid.query_point(10.0, 10.0) == [0]
+    assert grid.query_point(90.0, 90.0) == []
+
+
+def test_oversized_rect_is_found_everywhere_it_covers():
+    """Rects spanning too many cells are kept out of the buckets but still found."""
+    grid = SpatialGrid(cell_size=10.0)
+    grid.insert(0.0, 0.0, 1000.0, 1000.0)  # 101 x 101 cells
+    grid.insert(5.0, 5.0, 8.0, 8.0)
+
+    assert not any(0 in bucket for bucket in grid._cells.values())
+    assert grid.query_point(500.0, 500.0) == [0]
+    assert grid.query_point(6.0, 6.0) == [0, 1]
+    assert grid.query_point(2000.0, 2000.0) == []
+
+
+def test_non_finite_rect_keeps_index_but_is_never_returned():
+    """Malformed rects keep insertion indices stable but are never returned."""
+    grid = SpatialGrid()
+    assert grid.insert(float('nan'), 0.0, 10.0, 10.0) == 0
+    assert grid.insert(0.0, 0.0, float('inf'), 10.0) == 1
+    assert grid.insert(0.0, 0.0, 10.0, 10.0) == 2
+
+    assert grid.query_point(5.0, 5.0) == [2]
+    assert grid.query_rect(-1000.0, -1000.0, 1000.0, 1000.0) == [2]